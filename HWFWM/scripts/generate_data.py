@@ -3,6 +3,16 @@ import pandas as pd
 from scipy import stats
 import random
 
+from alias_sampler import CategoricalSampler
+
+CLASSES = CategoricalSampler(
+    [
+        "Fighter", "Mage", "Healer", "Tank", "Support",
+        "Scout", "Summoner", "Controller", "Buffer", "Debuffer"
+    ],
+    [0.2, 0.15, 0.1, 0.1, 0.1, 0.1, 0.05, 0.08, 0.07, 0.05]
+)
+
 def generate_correlated_stats(n_samples=100):
     """Generate correlated character stats."""
     # Create correlation matrix for core stats
@@ -33,14 +43,9 @@ def generate_essence_ratings():
     base = np.random.gamma(2, 1.5)
     return min(10, max(1, round(base, 1)))
 
-def generate_class():
-    """Generate character class with weighted probabilities."""
-    classes = [
-        "Fighter", "Mage", "Healer", "Tank", "Support",
-        "Scout", "Summoner", "Controller", "Buffer", "Debuffer"
-    ]
-    weights = [0.2, 0.15, 0.1, 0.1, 0.1, 0.1, 0.05, 0.08, 0.07, 0.05]
-    return np.random.choice(classes, p=weights)
+def generate_class(size=None):
+    """Generate character class(es) with weighted probabilities."""
+    return CLASSES.choose(np.random, size)
 
 def generate_achievement_rank():
     """Generate achievement ranks with appropriate distribution."""
@@ -72,7 +77,7 @@ def generate_dataset(n_samples=100):
     
     # Add other characteristics
     df['Essence'] = [generate_essence_ratings() for _ in range(n_samples)]
-    df['Class'] = [generate_class() for _ in range(n_samples)]
+    df['Class'] = generate_class(n_samples)
     df['Achievement_Rank'] = [generate_achievement_rank() for _ in range(n_samples)]
     df['Level'] = np.random.randint(1, 101, size=n_samples)
     df['Experience'] = df['Level'] * 1000 + np.random.randint(0, 1000, size=n_samples)
@@ -4,8 +4,36 @@ from scipy import stats
 import os
 from datetime import datetime, timedelta
 
+from alias_sampler import CategoricalSampler
+
 np.random.seed(42)
 
+RANKS = CategoricalSampler(
+    ['Ensign', 'Lieutenant Junior Grade', 'Lieutenant', 'Lieutenant Commander',
+     'Commander', 'Captain', 'Admiral'],
+    [0.3, 0.2, 0.2, 0.15, 0.1, 0.04, 0.01]
+)
+DEPARTMENTS = CategoricalSampler(
+    ['Command', 'Engineering', 'Science', 'Medical', 'Security', 'Operations'],
+    [0.15, 0.25, 0.2, 0.15, 0.15, 0.1]
+)
+SPECIES = CategoricalSampler(
+    ['Human', 'Vulcan', 'Andorian', 'Tellarite', 'Betazoid', 'Trill', 'Bajoran'],
+    [0.6, 0.1, 0.05, 0.05, 0.08, 0.07, 0.05]
+)
+MISSION_TYPES = CategoricalSampler(
+    ['Exploration', 'Diplomatic', 'Scientific', 'Defense', 'Emergency Response'],
+    [0.3, 0.25, 0.2, 0.15, 0.1]
+)
+MISSION_STATUSES = CategoricalSampler(
+    ['Completed', 'In Progress', 'Failed', 'Aborted'],
+    [0.7, 0.15, 0.1, 0.05]
+)
+LOG_TYPES = CategoricalSampler(
+    ['Standard', 'Alert', 'Discovery', 'Encounter', 'Technical'],
+    [0.5, 0.15, 0.15, 0.1, 0.1]
+)
+
 def generate_starships(n=50):
     """Generate starship data with realistic correlations."""
     # Ship classes with their typical characteristics
@@ -62,20 +90,10 @@ def generate_starships(n=50):
 
 def generate_crew_members(ships_df, n=1000):
     """Generate crew member data."""
-    ranks = ['Ensign', 'Lieutenant Junior Grade', 'Lieutenant', 'Lieutenant Commander', 
-            'Commander', 'Captain', 'Admiral']
-    rank_weights = [0.3, 0.2, 0.2, 0.15, 0.1, 0.04, 0.01]
-    
-    departments = ['Command', 'Engineering', 'Science', 'Medical', 'Security', 'Operations']
-    dept_weights = [0.15, 0.25, 0.2, 0.15, 0.15, 0.1]
-    
-    species = ['Human', 'Vulcan', 'Andorian', 'Tellarite', 'Betazoid', 'Trill', 'Bajoran']
-    species_weights = [0.6, 0.1, 0.05, 0.05, 0.08, 0.07, 0.05]
-    
     # Generate base attributes
-    rank = np.random.choice(ranks, size=n, p=rank_weights)
-    department = np.random.choice(departments, size=n, p=dept_weights)
-    species = np.random.choice(species, size=n, p=species_weights)
+    rank = RANKS.choose(np.random, n)
+    department = DEPARTMENTS.choose(np.random, n)
+    species = SPECIES.choose(np.random, n)
     
     # Experience correlates with rank
     rank_years = {'Ensign': 1, 'Lieutenant Junior Grade': 3, 'Lieutenant': 6, 
@@ -113,15 +131,9 @@ def generate_crew_members(ships_df, n=1000):
 
 def generate_missions(ships_df, n=200):
     """Generate mission data."""
-    mission_types = ['Exploration', 'Diplomatic', 'Scientific', 'Defense', 'Emergency Response']
-    type_weights = [0.3, 0.25, 0.2, 0.15, 0.1]
-    
-    status_options = ['Completed', 'In Progress', 'Failed', 'Aborted']
-    status_weights = [0.7, 0.15, 0.1, 0.05]
-    
     # Generate base mission data
-    mission_type = np.random.choice(mission_types, size=n, p=type_weights)
-    status = np.random.choice(status_options, size=n, p=status_weights)
+    mission_type = MISSION_TYPES.choose(np.random, n)
+    status = MISSION_STATUSES.choose(np.random, n)
     
     # Generate stardates (roughly corresponding to TNG era)
     start_stardate = 41000.0 + np.random.uniform(0, 10000, n)
@@ -138,19 +150,17 @@ def generate_missions(ships_df, n=200):
     duration = np.maximum(duration, 1)
     
     # Assign ships based on mission type and ship capabilities
-    ship_assignments = []
-    for m_type in mission_type:
-        if m_type in ['Defense', 'Emergency Response']:
-            # Prefer combat-capable ships
-            weights = ships_df['weapon_power'] / ships_df['weapon_power'].sum()
-        elif m_type == 'Scientific':
-            # Prefer larger ships with science capabilities
-            weights = ships_df['length'] / ships_df['length'].sum()
-        else:
-            # Equal weights for other missions
-            weights = np.ones(len(ships_df)) / len(ships_df)
-        
-        ship_assignments.append(np.random.choice(ships_df['ship_id'], p=weights))
+    ship_ids = ships_df['ship_id'].tolist()
+    combat = np.isin(mission_type, ['Defense', 'Emergency Response'])
+    scientific = mission_type == 'Scientific'
+    ship_assignments = np.empty(n, dtype=np.int64)
+    for chosen, weights in (
+        (combat, ships_df['weapon_power']),  # Prefer combat-capable ships
+        (scientific, ships_df['length']),  # Prefer larger ships with science capabilities
+        (~combat & ~scientific, None)  # Equal weights for other missions
+    ):
+        sampler = CategoricalSampler(ship_ids, weights)
+        ship_assignments[chosen] = sampler.choose(np.random, int(chosen.sum()))
     
     df = pd.DataFrame({
         'mission_id': range(1, n + 1),
@@ -166,14 +176,13 @@ def generate_missions(ships_df, n=200):
 
 def generate_mission_logs(missions_df, n_logs_per_mission=5):
     """Generate mission log entries."""
-    log_types = ['Standard', 'Alert', 'Discovery', 'Encounter', 'Technical']
-    type_weights = [0.5, 0.15, 0.15, 0.1, 0.1]
+    log_counts = np.random.poisson(n_logs_per_mission, size=len(missions_df))
+    log_types = iter(LOG_TYPES.choose(np.random, int(log_counts.sum())))
     
     logs = []
-    for _, mission in missions_df.iterrows():
-        n_logs = np.random.poisson(n_logs_per_mission)
+    for (_, mission), n_logs in zip(missions_df.iterrows(), log_counts):
         for i in range(n_logs):
-            log_type = np.random.choice(log_types, p=type_weights)
+            log_type = next(log_types)
             stardate = mission['stardate'] + (mission['duration_days'] * i / n_logs)
             
             logs.append({
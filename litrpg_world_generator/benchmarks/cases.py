@@ -0,0 +1,157 @@
+"""
+Benchmark cases for the world generator hot paths.
+Each case builds its inputs untimed and then times one call of the code under test.
+"""
+import tempfile
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from src.generators.being_generator import BeingGenerator
+from src.generators.realm_generator import RealmGenerator
+from src.generators.resource_generator import ResourceGenerator
+from src.generators.world_generator import WorldGenerator
+from src.world.population_index import PopulationIndex
+from src.world.tables import ROW_DTYPE
+
+SEED = 20240101
+
+class Case(NamedTuple):
+    """One benchmark: `run(setup())` is timed and processes `items` entities."""
+
+    name: str
+    setup: Callable[[], object]
+    run: Callable[[object], object]
+    items: int
+    slow: bool = False
+
+CASES: List[Case] = []
+
+def case(name: str, items: int, setup: Optional[Callable[[], object]] = None, slow: bool = False):
+    """Register the decorated function as the timed part of a benchmark."""
+    def register(run: Callable[[object], object]) -> Callable[[object], object]:
+        CASES.append(Case(name, setup or (lambda: None), run, items, slow))
+        return run
+    return register
+
+def world_before(step: str, backend: str, beings: int, realms: int = 3) -> WorldGenerator:
+    """Generate a world, skipping the generation step named `step` and everything after it."""
+    world = WorldGenerator(seed=SEED, backend=backend)
+    steps = ['_establish_realm_connections', '_establish_being_relationships', '_distribute_resources']
+    for name in steps[steps.index(step):]:
+        setattr(world, name, lambda: None)
+    world.generate_world(num_realms=realms, beings_per_realm=beings, resources_per_realm=100)
+    for name in steps:
+        vars(world).pop(name, None)
+    return world
+
+def full_world(backend: str, beings: int, realms: int = 3) -> WorldGenerator:
+    """Generate a complete world."""
+    world = WorldGenerator(seed=SEED, backend=backend)
+    world.generate_world(num_realms=realms, beings_per_realm=beings, resources_per_realm=100)
+    return world
+
+# Sub-generator throughput
+
+@case('generate_being', 1000, lambda: BeingGenerator(SEED))
+def _(generator: BeingGenerator):
+    for _ in range(1000):
+        generator.generate_being()
+
+@case('generate_beings', 100_000, lambda: BeingGenerator(SEED))
+def _(generator: BeingGenerator):
+    generator.generate_beings(100_000)
+
+# What the default 'models' backend pays per being: the batch draw plus building every model
+@case('generate_beings[models]', 10_000, lambda: BeingGenerator(SEED))
+def _(generator: BeingGenerator):
+    generator.generate_beings(10_000).to_models()
+
+@case('generate_resource', 1000, lambda: ResourceGenerator(SEED))
+def _(generator: ResourceGenerator):
+    for _ in range(1000):
+        generator.generate_resource()
+
+@case('generate_realm', 50, lambda: RealmGenerator(SEED))
+def _(generator: RealmGenerator):
+    for _ in range(50):
+        generator.generate_realm()
+
+# Whole worlds; beings_per_realm is scaled per tier, so counts are approximate
+
+for backend, beings, slow in (
+    ('models', 1_000, False),
+    ('records', 100_000, False),
+    ('columnar', 100_000, False),
+    ('columnar', 1_000_000, True)
+):
+    @case(f'generate_world[{backend},{beings}]', beings, slow=slow)
+    def _(_, backend=backend, beings=beings):
+        full_world(backend, beings)
+
+# Generation steps on a pre-built population
+
+for backend in ('models', 'columnar'):
+    @case(
+        f'establish_being_relationships[{backend},10000]',
+        10_000,
+        lambda backend=backend: world_before('_establish_being_relationships', backend, 10_000)
+    )
+    def _(world: WorldGenerator):
+        world._establish_being_relationships()
+
+    @case(
+        f'advance_time[{backend},10000,x10]',
+        10_000,
+        lambda backend=backend: full_world(backend, 10_000)
+    )
+    def _(world: WorldGenerator):
+        for _ in range(10):
+            world.advance_time(days=30)
+
+# Daily ticks only visit the beings whose breakthrough falls due
+@case('advance_time[columnar,1000000,daily,x30]', 1_000_000, lambda: full_world('columnar', 1_000_000), slow=True)
+def _(world: WorldGenerator):
+    for _ in range(30):
+        world.advance_time(days=1)
+
+# Single moves between realms, one index update each
+def _populated_index() -> PopulationIndex:
+    index = PopulationIndex(id_dtype=ROW_DTYPE)
+    index.add_beings(np.arange(100_000), 'a', np.zeros(100_000, dtype=np.int16))
+    return index
+
+@case('move_being[100000]', 10_000, _populated_index)
+def _(index: PopulationIndex):
+    for being in range(0, 100_000, 10):
+        index.move_being(being, 'a', 'b', 1)
+
+# Ranking queries; the setup's world has no cached combat powers yet
+
+@case('top_beings[columnar,1000000,k=100]', 1_000_000, lambda: full_world('columnar', 1_000_000), slow=True)
+def _(world: WorldGenerator):
+    world.top_beings(100)
+
+# Export
+
+def _save(world: WorldGenerator, output_format: str) -> None:
+    """Save a world to a throwaway directory."""
+    from main import save_world_data
+    with tempfile.TemporaryDirectory() as output_dir:
+        save_world_data(world, output_dir, output_format=output_format)
+
+for backend, output_format in (('models', 'json'), ('columnar', 'ndjson')):
+    @case(
+        f'save_world_data[{backend},{output_format},10000]',
+        10_000,
+        lambda backend=backend: full_world(backend, 10_000)
+    )
+    def _(world: WorldGenerator, output_format=output_format):
+        _save(world, output_format)
+
+def select(pattern: Optional[str] = None, slow: bool = False) -> Dict[str, Case]:
+    """Return the cases whose name contains `pattern`, leaving out slow ones unless asked."""
+    return {
+        c.name: c for c in CASES
+        if (slow or not c.slow) and (pattern is None or pattern in c.name)
+    }
@@ -0,0 +1,147 @@
+"""
+Benchmark runner with stored results and regression checks.
+Times the cases in benchmarks/cases.py, saves each run as JSON and compares it with an earlier run.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import numpy as np
+
+from benchmarks.cases import Case, select
+
+RESULTS_DIR = ROOT / 'benchmarks' / 'results'
+
+def time_case(bench: Case, repeat: int) -> Dict[str, float]:
+    """Time a case `repeat` times, each on freshly set-up inputs."""
+    times = []
+    for _ in range(repeat):
+        state = bench.setup()
+        start = time.perf_counter()
+        bench.run(state)
+        times.append(time.perf_counter() - start)
+    median = statistics.median(times)
+    return {
+        'min': min(times),
+        'median': median,
+        'max': max(times),
+        'repeat': repeat,
+        'items': bench.items,
+        'items_per_second': bench.items / median if median else float('inf')
+    }
+
+def environment() -> Dict[str, Optional[str]]:
+    """Describe the code and machine the results were taken on."""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor() or None,
+        'node': platform.node()
+    }
+
+def latest_result(exclude: Optional[Path] = None) -> Optional[Path]:
+    """Return the most recent stored result file."""
+    runs = sorted(p for p in RESULTS_DIR.glob('*.json') if p != exclude)
+    return runs[-1] if runs else None
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Print each shared case's median against the baseline; return the regressed case names."""
+    regressed = []
+    print(f"\n{'case':<52} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, result in current['cases'].items():
+        if name not in baseline['cases']:
+            continue
+        before = baseline['cases'][name]['median']
+        after = result['median']
+        change = after / before - 1
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressed.append(name)
+        print(f"{name:<52} {before:>9.3f}s {after:>9.3f}s {change:>+7.1%}{flag}")
+    return regressed
+
+def main() -> int:
+    """Run the selected benchmarks; exit with 1 when a case regressed past the threshold."""
+    parser = argparse.ArgumentParser(description="Benchmark the world generator hot paths.")
+    parser.add_argument("-k", "--filter", help="Only run cases whose name contains this text")
+    parser.add_argument("--full", action="store_true", help="Include slow cases (1M-being worlds)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (default: 3)")
+    parser.add_argument("--list", action="store_true", help="List the cases and exit")
+    parser.add_argument(
+        "--compare",
+        metavar="RESULT",
+        help="Compare with a stored result file, or 'latest' for the most recent one"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative slowdown of the median that counts as a regression (default: 0.10)"
+    )
+    parser.add_argument("--no-save", action="store_true", help="Do not store this run's results")
+    args = parser.parse_args()
+
+    cases = select(args.filter, slow=args.full)
+    if args.list:
+        for name, bench in cases.items():
+            print(f"{name}{'  (slow)' if bench.slow else ''}")
+        return 0
+
+    results = {}
+    for name, bench in cases.items():
+        results[name] = time_case(bench, args.repeat)
+        print(
+            f"{name:<52} median {results[name]['median']:>8.3f}s "
+            f"({results[name]['items_per_second']:,.0f} items/s)"
+        )
+    current = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment(),
+        'cases': results
+    }
+
+    saved = None
+    if not args.no_save:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        saved = RESULTS_DIR / f"{stamp}_{current['environment']['commit'] or 'nogit'}.json"
+        with open(saved, 'w') as f:
+            json.dump(current, f, indent=2)
+        print(f"\nResults saved to {saved}")
+
+    if args.compare:
+        path = latest_result(exclude=saved) if args.compare == 'latest' else Path(args.compare)
+        if path is None:
+            print("No earlier result to compare with")
+            return 0
+        with open(path) as f:
+            baseline = json.load(f)
+        print(f"Comparing with {path} (commit {baseline['environment'].get('commit')})")
+        regressed = compare(current, baseline, args.threshold)
+        if regressed:
+            print(f"\n{len(regressed)} case(s) slower than the baseline by more than {args.threshold:.0%}")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
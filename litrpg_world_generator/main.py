@@ -3,19 +3,49 @@ Command-line interface for the LITRPG world generator.
 Provides functionality to generate and manage cultivation worlds.
 """
 import argparse
+import cProfile
 import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+from src.export.arrow import FILE_FORMATS, export_world_arrow
+from src.export.ndjson import COMPRESSORS, DEFAULT_SHARD_SIZE, export_world_ndjson
+from src.generators.checkpoint import checkpoint_file, load_checkpoint
 from src.generators.world_generator import WorldGenerator
-from src.constants import RealmTier
+from src.models.construction import set_strict
+from src.models.metrics import metric_cache
+from src.profiling import Profiler, count, enable, phase
+from src.world.allocation import ALLOCATION_POLICIES, CappedPolicy
+from src.world.procedural import ProceduralWorld
 
-def save_world_data(world: WorldGenerator, output_dir: str) -> None:
-    """Save all generated world data to JSON files."""
+def save_world_data(
+    world: WorldGenerator,
+    output_dir: str,
+    output_format: str = "json",
+    compression: Optional[str] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    workers: int = 0
+) -> None:
+    """Save all generated world data as JSON, NDJSON shards or Parquet/Arrow tables."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     base_dir = Path(output_dir) / f"world_{timestamp}"
+    
+    if output_format in FILE_FORMATS:
+        export_world_arrow(world, base_dir, file_format=output_format)
+        return
+    
+    if output_format == "ndjson":
+        export_world_ndjson(
+            world,
+            base_dir,
+            shard_size=shard_size,
+            compression=compression,
+            workers=workers
+        )
+        return
+    
     base_dir.mkdir(parents=True, exist_ok=True)
     
     # Save realms
@@ -24,14 +54,8 @@ def save_world_data(world: WorldGenerator, output_dir: str) -> None:
             "name": realm.name,
             "tier": realm.tier.name,
             "description": realm.description,
-            "population": len([
-                b_id for b_id, r_id in world.being_locations.items()
-                if r_id == realm_id
-            ]),
-            "resources": len([
-                r_id for r_id, r_loc in world.resource_locations.items()
-                if r_loc == realm_id
-            ])
+            "population": world.population_index.being_count(realm_id),
+            "resources": world.population_index.resource_count(realm_id)
         }
         for realm_id, realm in world.realms.items()
     }
@@ -92,42 +116,56 @@ def save_world_data(world: WorldGenerator, output_dir: str) -> None:
         json.dump(relationships_data, f, indent=2)
 
 def print_world_statistics(world: WorldGenerator) -> None:
-    """Print basic statistics about the generated world."""
+    """Print basic statistics about the generated world from its maintained statistics."""
+    statistics = world.statistics.to_dict()
     print("\n=== World Statistics ===")
     
     print("\nRealms:")
-    for tier in RealmTier:
-        count = len([r for r in world.realms.values() if r.tier == tier])
-        if count > 0:
-            print(f"  {tier.name}: {count}")
+    for tier, n in statistics['realm_tiers'].items():
+        print(f"  {tier}: {n}")
     
     print("\nBeings:")
-    total_beings = len(world.beings)
+    total_beings = statistics['population']
     print(f"  Total Population: {total_beings}")
     
-    realm_populations = {}
-    for being_id, realm_id in world.being_locations.items():
-        realm_name = world.realms[realm_id].name
-        realm_populations[realm_name] = realm_populations.get(realm_name, 0) + 1
-    
     print("\nPopulation by Realm:")
-    for realm_name, pop in realm_populations.items():
-        percentage = (pop / total_beings) * 100
-        print(f"  {realm_name}: {pop} ({percentage:.1f}%)")
+    for realm in statistics['realms'].values():
+        if realm['population']:
+            percentage = (realm['population'] / total_beings) * 100
+            print(f"  {realm['name']}: {realm['population']} ({percentage:.1f}%)")
+    
+    print("\nCultivation Stages:")
+    for stage, n in statistics['stages'].items():
+        print(f"  {stage}: {n}")
+    
+    print("\nStrongest Beings:")
+    for being, power in world.top_beings(5):
+        realm_name = world.realms[world.being_locations[being.id]].name
+        print(f"  {being.name} ({realm_name}): {power:,.1f}")
     
     print("\nResources:")
-    total_resources = len(world.resources)
+    total_resources = statistics['resources']
     print(f"  Total Resources: {total_resources}")
     
-    realm_resources = {}
-    for resource_id, realm_id in world.resource_locations.items():
-        realm_name = world.realms[realm_id].name
-        realm_resources[realm_name] = realm_resources.get(realm_name, 0) + 1
-    
     print("\nResources by Realm:")
-    for realm_name, count in realm_resources.items():
-        percentage = (count / total_resources) * 100
-        print(f"  {realm_name}: {count} ({percentage:.1f}%)")
+    for realm in statistics['realms'].values():
+        if realm['resources']:
+            percentage = (realm['resources'] / total_resources) * 100
+            print(f"  {realm['name']}: {realm['resources']} ({percentage:.1f}%)")
+
+def write_profiles(
+    args: argparse.Namespace,
+    profiler: Optional[Profiler],
+    stats: Optional[cProfile.Profile]
+) -> None:
+    """Write the requested phase report and cProfile dump."""
+    if stats:
+        stats.disable()
+        stats.dump_stats(args.pstats)
+        print(f"cProfile stats written to {args.pstats}")
+    if args.profile:
+        profiler.write(args.profile, metric_cache=metric_cache().stats())
+        print(f"Profile written to {args.profile}")
 
 def main():
     """Main entry point for the LITRPG world generator."""
@@ -176,27 +214,186 @@ def main():
         help="Output directory for generated data (default: 'data')"
     )
     
+    parser.add_argument(
+        "--backend",
+        choices=WorldGenerator.BACKENDS,
+        default="models",
+        help="Population storage backend (default: 'models')"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to populate realms; output does not depend on it (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--allocation",
+        choices=ALLOCATION_POLICIES,
+        default="uniform",
+        help="How rare resources are given to eligible beings (default: 'uniform')"
+    )
+    
+    parser.add_argument(
+        "--artifact-cap",
+        type=int,
+        default=1,
+        help="Most resources one being may receive with '--allocation capped' (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Fully validate every generated model instead of checking batches (slower)"
+    )
+    
+    parser.add_argument(
+        "--format",
+        choices=["json", "ndjson", *FILE_FORMATS],
+        default="json",
+        help="Output format; 'ndjson' streams sharded files, 'parquet' and 'arrow' "
+             "write typed tables (default: 'json')"
+    )
+    
+    parser.add_argument(
+        "--compress",
+        choices=[name for name in COMPRESSORS if name],
+        help="Compress NDJSON shards with the given codec"
+    )
+    
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=DEFAULT_SHARD_SIZE,
+        help=f"Records per NDJSON shard (default: {DEFAULT_SHARD_SIZE})"
+    )
+    
+    parser.add_argument(
+        "--export-workers",
+        type=int,
+        default=0,
+        help="Threads writing NDJSON shards; 0 writes inline (default: 0)"
+    )
+    
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="Define beings procedurally and write only summary statistics, "
+             "without materializing the population"
+    )
+    
+    parser.add_argument(
+        "--checkpoint",
+        metavar="DIR",
+        help="Snapshot the world to DIR after every generation step"
+    )
+    
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from the snapshot in --checkpoint; pass the same generation options"
+    )
+    
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="profile.json",
+        metavar="REPORT",
+        help="Write per-phase timings, counts, random draws and peak memory as JSON "
+             "(default path: 'profile.json')"
+    )
+    
+    parser.add_argument(
+        "--statistics-json",
+        nargs="?",
+        const="statistics.json",
+        metavar="FILE",
+        help="Also write the world statistics as JSON (default path: 'statistics.json')"
+    )
+    
+    parser.add_argument(
+        "--pstats",
+        metavar="FILE",
+        help="Also dump a cProfile of the whole run for pstats/snakeviz"
+    )
+    
     args = parser.parse_args()
+    if args.resume and not args.checkpoint:
+        parser.error("--resume needs --checkpoint DIR")
+    
+    set_strict(args.strict)
+    profiler = enable() if args.profile or args.pstats else None
+    stats = cProfile.Profile() if args.pstats else None
+    if stats:
+        stats.enable()
+    
+    if args.lazy:
+        with phase("summarize_lazy_world"):
+            lazy_world = ProceduralWorld(
+                seed=args.seed,
+                num_realms=args.realms,
+                beings_per_realm=args.beings
+            )
+            summary = lazy_world.summary()
+        output_dir = Path(args.output)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with open(output_dir / "summary.json", "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"Summarized {summary['population']} procedural beings in {output_dir / 'summary.json'}")
+        write_profiles(args, profiler, stats)
+        return
     
     # Create world generator
-    world = WorldGenerator(
-        seed=args.seed,
-        base_quality_level=args.quality
-    )
+    allocation = args.allocation
+    if allocation == "capped":
+        allocation = CappedPolicy(args.artifact_cap)
+    if args.resume and checkpoint_file(args.checkpoint).exists():
+        world = load_checkpoint(args.checkpoint)
+        world.workers = max(1, args.workers)
+        world.checkpoint_dir = args.checkpoint
+        steps = world.completed_steps()
+        print(f"Resuming from {args.checkpoint} after {steps[-1] if steps else 'a finished world'}")
+    else:
+        world = WorldGenerator(
+            seed=args.seed,
+            base_quality_level=args.quality,
+            backend=args.backend,
+            workers=args.workers,
+            allocation=allocation,
+            checkpoint_dir=args.checkpoint
+        )
     
     print("Generating world...")
-    world.generate_world(
-        num_realms=args.realms,
-        beings_per_realm=args.beings,
-        resources_per_realm=args.resources
-    )
+    with phase("generate_world"):
+        world.generate_world(
+            num_realms=args.realms,
+            beings_per_realm=args.beings,
+            resources_per_realm=args.resources
+        )
     
     # Print statistics
-    print_world_statistics(world)
+    with phase("statistics"):
+        print_world_statistics(world)
+        if args.statistics_json:
+            with open(args.statistics_json, "w") as f:
+                json.dump(world.statistics.to_dict(), f, indent=2)
+            print(f"\nStatistics written to {args.statistics_json}")
     
     # Save data
     print(f"\nSaving world data to {args.output}...")
-    save_world_data(world, args.output)
+    with phase("export"):
+        save_world_data(
+            world,
+            args.output,
+            output_format=args.format,
+            compression=args.compress,
+            shard_size=args.shard_size,
+            workers=args.export_workers
+        )
+        count(beings=len(world.beings), resources=len(world.resources))
+    
+    write_profiles(args, profiler, stats)
     print("Done!")
 
 if __name__ == "__main__":
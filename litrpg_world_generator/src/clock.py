@@ -0,0 +1,75 @@
+"""
+Simulated world time.
+Holds the current simulated instant as int64 microseconds since the epoch and hands it to model methods, array kernels and model timestamp defaults.
+"""
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import numpy as np
+from typing import Iterator, Optional, Union
+
+# Naive datetimes are counted from here, as NumPy does for datetime64
+EPOCH = datetime(1970, 1, 1)
+
+MICROS_PER_DAY = 86_400_000_000
+
+# The clock that model timestamp defaults read; None falls back to wall time
+_active: Optional['WorldClock'] = None
+
+def to_micros(when: datetime) -> int:
+    """Return a naive datetime as microseconds since the epoch."""
+    return (when - EPOCH) // timedelta(microseconds=1)
+
+class WorldClock:
+    """The simulated time of one world.
+
+    `micros` is the authoritative int64 value; the datetime and datetime64
+    forms are kept alongside it so reading the time in a loop allocates
+    nothing and never asks the OS.
+    """
+
+    __slots__ = ('micros', 'now', 'datetime64')
+
+    def __init__(self, start: Union[datetime, int, None] = None):
+        """Start at a datetime, at epoch microseconds, or at the current wall time."""
+        self.set(datetime.now() if start is None else start)
+
+    def set(self, when: Union[datetime, int]) -> None:
+        """Move the clock to a datetime or to epoch microseconds."""
+        self.micros = int(when) if isinstance(when, (int, np.integer)) else to_micros(when)
+        self.now = EPOCH + timedelta(microseconds=self.micros)
+        self.datetime64 = np.datetime64(self.micros, 'us')
+
+    def advance(self, delta: timedelta) -> None:
+        """Move the clock forward by a time span."""
+        self.set(self.micros + delta // timedelta(microseconds=1))
+
+    def days_since(self, when: datetime) -> int:
+        """Return whole days from `when` to now, floored like timedelta.days."""
+        return (self.micros - to_micros(when)) // MICROS_PER_DAY
+
+    def __getstate__(self) -> int:
+        return self.micros
+
+    def __setstate__(self, micros: int) -> None:
+        self.set(micros)
+
+    def __repr__(self) -> str:
+        return f"WorldClock({self.now.isoformat()})"
+
+def clock_time(clock: Optional[WorldClock]) -> datetime:
+    """Return a clock's time, or the wall time when no clock is given."""
+    return clock.now if clock is not None else datetime.now()
+
+def model_time() -> datetime:
+    """Return the timestamp for a new model: the active world clock's time, or wall time."""
+    return _active.now if _active is not None else datetime.now()
+
+@contextmanager
+def using_clock(clock: WorldClock) -> Iterator[WorldClock]:
+    """Stamp models created inside the block with `clock`'s time."""
+    global _active
+    previous, _active = _active, clock
+    try:
+        yield clock
+    finally:
+        _active = previous
@@ -184,4 +184,80 @@ SPATIAL_PARAMETERS = {
         'size_multiplier': 1.5,
         'complexity_multiplier': 2.0
     }
-}
\ No newline at end of file
+}
+
+# Cultivation stages reachable in each realm
+_DAO_STAGES = (
+    CultivationStage.DAO_SEEKING,
+    CultivationStage.DAO_MANIFESTATION,
+    CultivationStage.DAO_MASTERY
+)
+
+REALM_STAGES = {
+    RealmTier.MORTAL: (
+        CultivationStage.BODY_REFINEMENT,
+        CultivationStage.QI_CONDENSATION,
+        CultivationStage.FOUNDATION_ESTABLISHMENT,
+        CultivationStage.CORE_FORMATION
+    ),
+    RealmTier.SPIRIT: (
+        CultivationStage.NASCENT_SOUL,
+        CultivationStage.SPIRIT_SEVERING,
+        CultivationStage.VOID_FORMATION
+    ),
+    RealmTier.MYSTIC: _DAO_STAGES,
+    RealmTier.CELESTIAL: _DAO_STAGES,
+    RealmTier.DIVINE: _DAO_STAGES,
+    RealmTier.PRIMORDIAL: _DAO_STAGES
+}
+
+# Being Generation Vocabulary
+BEING_VOCABULARY = {
+    'name_prefixes': ('Azure', 'Jade', 'Golden', 'Sacred', 'Divine', 'Ancient'),
+    'name_suffixes': ('Dragon', 'Phoenix', 'Tiger', 'Turtle', 'Serpent', 'Lion'),
+    'races': ('Human', 'Dragon', 'Phoenix', 'Demon', 'Spirit', 'Ancient'),
+    'race_weights': (0.7, 0.1, 0.05, 0.1, 0.03, 0.02),
+    'bloodline_traits': (
+        'Fire Affinity', 'Water Mastery', 'Lightning Soul',
+        'Earth Heart', 'Wind Spirit', 'Time Perception',
+        'Space Comprehension', 'Fate Sensitivity'
+    ),
+    'dao_insights': ('Heaven', 'Earth', 'Humanity', 'Fate', 'Time', 'Space'),
+    'soul_resonance': ('Natural', 'Artificial', 'Divine', 'Demonic'),
+    'techniques': ('Sword', 'Palm', 'Movement', 'Formation', 'Body'),
+    'weapons': ('Sword', 'Spear', 'Bow', 'Staff'),
+    'reputation': ('Mortal World', 'Spirit World', 'Demon World'),
+    'hidden_attributes': (
+        'true_power_level', 'dao_comprehension', 'fate_connection',
+        'soul_structure', 'bloodline_secrets'
+    )
+}
+
+# Fixed starting payloads shared by every generated being
+BEING_STARTING_KIT = {
+    'cultivation_affinity': ('Fire', 'Water', 'Earth', 'Wind', 'Lightning'),
+    'dao_marks': ('Heaven', 'Earth'),
+    'special_moves': ('Dragon Strike', 'Phoenix Flame', 'Tiger Roar'),
+    'artifacts': {
+        'Basic Sword': 0.5,
+        'Protection Talisman': 0.3,
+        'Flying Sword': 0.8
+    },
+    'resources': {
+        'Spirit Stone': 1000,
+        'Qi Condensing Pill': 50,
+        'Foundation Pill': 10
+    },
+    'currency': {
+        'Spirit Stones': 10000,
+        'Contribution Points': 1000
+    },
+    'equipment_slots': {
+        'weapon': 'Basic Sword',
+        'armor': 'Cotton Robe',
+        'accessory': 'Jade Pendant'
+    },
+    'destiny_threads': ('Great Fortune', 'Minor Calamity', 'Hidden Opportunity'),
+    'titles': ('Cultivator',),
+    'accomplishments': ('Began Cultivation', 'Formed Core', 'Survived Tribulation')
+}
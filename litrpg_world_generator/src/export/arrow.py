@@ -0,0 +1,345 @@
+"""
+Arrow and Parquet export and reload for generated worlds.
+Writes typed tables for realms, beings, resources, relationship edges and tribulations, and rebuilds a WorldGenerator from them.
+"""
+from datetime import datetime
+import json
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Tuple
+from uuid import UUID
+
+from ..generators.being_batch import encode_beings
+from ..generators.world_generator import WorldGenerator
+from ..models.realm import Realm
+from ..models.resource import Resource
+from ..models.shared import peek
+from ..constants import CultivationStage
+from ..world.columnar import (
+    BEING_SCHEMA,
+    RESOURCE_SCHEMA,
+    TRIBULATION_SCHEMA,
+    ColumnarWorld,
+    uuid_to_words
+)
+from ..world.events import EventLog
+from ..world.ids import IdAllocator
+from ..world.relationship_graph import EDGE_SCHEMA, MASTER_SCHEMA, RelationshipGraph
+from ..world.records import RecordStore
+from ..world.stores import ModelStore
+from ..world.tables import ROW_DTYPE, ColumnTable
+
+# format name: file suffix; 'arrow' files are uncompressed Arrow IPC and map zero-copy
+FILE_FORMATS = {'parquet': '.parquet', 'arrow': '.arrow'}
+
+# Beings are written with their master index alongside the stored columns
+EXPORT_BEING_SCHEMA = {**BEING_SCHEMA, **MASTER_SCHEMA}
+
+def _require_pyarrow():
+    """Import pyarrow on first use so the rest of the package works without it."""
+    try:
+        import pyarrow
+        import pyarrow.feather
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError(
+            "Arrow/Parquet export requires pyarrow; install it with 'pip install pyarrow'"
+        ) from error
+    return pyarrow
+
+def _to_arrow(pa, name: str, values: np.ndarray):
+    """Convert one NumPy column to an Arrow array with a typed schema."""
+    if name == 'id':
+        # [high, low] words in big-endian order are exactly the UUID bytes
+        data = np.ascontiguousarray(values, dtype='>u8').tobytes()
+        return pa.FixedSizeBinaryArray.from_buffers(
+            pa.binary(16), len(values), [None, pa.py_buffer(data)]
+        )
+    if values.ndim == 2:
+        return pa.FixedSizeListArray.from_arrays(
+            pa.array(np.ascontiguousarray(values).ravel()), values.shape[1]
+        )
+    # from_pandas maps NaT to null for the datetime columns
+    return pa.array(values, from_pandas=True)
+
+def _from_arrow(column, name: str, dtype, shape: Tuple[int, ...]) -> np.ndarray:
+    """Convert one Arrow column back to NumPy, sharing memory where the layout allows."""
+    array = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+    if name == 'id':
+        data = np.frombuffer(
+            array.buffers()[1], dtype='>u8',
+            count=2 * len(array), offset=16 * array.offset
+        )
+        return data.astype(np.uint64).reshape(len(array), 2)
+    if shape:
+        values = array.flatten().to_numpy(zero_copy_only=False)
+        return values.astype(dtype, copy=False).reshape((len(array),) + shape)
+    return array.to_numpy(zero_copy_only=False).astype(dtype, copy=False)
+
+def _table(pa, columns: Dict[str, np.ndarray], metadata: Dict[str, str] = None):
+    """Build an Arrow table from NumPy columns."""
+    table = pa.table({name: _to_arrow(pa, name, values) for name, values in columns.items()})
+    return table.replace_schema_metadata(metadata) if metadata else table
+
+def _columnar_tables(world: WorldGenerator, store: ColumnarWorld) -> tuple:
+    """Collect export columns straight from a columnar store."""
+    for realm_id in world.realms:
+        store.realm_row(realm_id)
+    beings = {name: store.being_table[name] for name in BEING_SCHEMA}
+    resources = {name: store.resource_table[name] for name in RESOURCE_SCHEMA}
+    resource_models = [store.resource(row) for row in range(len(store.resource_table))]
+    events = store.events.select('tribulation')
+    entities = np.column_stack((events['entity_high'], events['entity_low']))
+    tribulations = {
+        'being': store.being_rows(entities).astype(ROW_DTYPE),
+        'power_level': events['value'][:, 0],
+        'difficulty': events['value'][:, 1],
+        'stage': events['code'].astype(np.uint8),
+        'timestamp': events['timestamp']
+    }
+    return list(store.realm_ids), beings, resources, resource_models, tribulations
+
+def _model_tables(world: WorldGenerator, store: ModelStore) -> tuple:
+    """Encode a model store into the same columns the columnar store uses."""
+    realm_ids = list(world.realms)
+    realm_rows = {realm_id: row for row, realm_id in enumerate(realm_ids)}
+    models = list(store.beings.values())
+    rows = {being.id: row for row, being in enumerate(models)}
+    n = len(models)
+
+    beings = encode_beings(models)
+    beings['id'] = np.array([uuid_to_words(b.id) for b in models], dtype=np.uint64).reshape(n, 2)
+    beings['location'] = np.array(
+        [realm_rows[store.being_locations[b.id]] for b in models], dtype=np.uint16
+    )
+    beings['created'] = np.array([b.creation_date for b in models], dtype='datetime64[us]')
+    beings['last_breakthrough'] = np.array(
+        [b.last_breakthrough for b in models], dtype='datetime64[us]'
+    )
+
+    events = [
+        (row, event)
+        for row, being in enumerate(models)
+        for event in peek(being, 'tribulation_history')
+    ]
+    tribulations = {
+        'being': np.array([row for row, _ in events], dtype=ROW_DTYPE),
+        'power_level': np.array([e['power_level'] for _, e in events], dtype=np.float64),
+        'difficulty': np.array([e['difficulty'] for _, e in events], dtype=np.float64),
+        'stage': np.array(
+            [CultivationStage[e['type'].rsplit('_', 1)[0]].value for _, e in events],
+            dtype=np.uint8
+        ),
+        'timestamp': np.array([e['timestamp'] for _, e in events], dtype='datetime64[us]')
+    }
+
+    resource_models = list(store.resources.values())
+    resources = {
+        'id': np.array(
+            [uuid_to_words(r.id) for r in resource_models], dtype=np.uint64
+        ).reshape(len(resource_models), 2),
+        'location': np.array(
+            [realm_rows[store.resource_locations[r.id]] for r in resource_models], dtype=np.uint16
+        ),
+        'tier': np.array([r.tier.value for r in resource_models], dtype=np.uint8),
+        'owner': np.array(
+            [rows.get(store.artifact_owners.get(r.id), -1) for r in resource_models],
+            dtype=ROW_DTYPE
+        ),
+        'base_grade': np.array(
+            [r.quality_metrics.base_grade for r in resource_models], dtype=np.float32
+        ),
+        'current_age': np.array(
+            [r.formation_attributes.current_age for r in resource_models], dtype=np.float64
+        ),
+        'preservation_state': np.array(
+            [r.quality_metrics.preservation_state for r in resource_models], dtype=np.float64
+        ),
+        'stability': np.array([r.energy_profile.stability for r in resource_models], dtype=np.float64),
+        'purity': np.array([r.energy_profile.purity for r in resource_models], dtype=np.float64),
+        'degradation_rate': np.array(
+            [r.usage_metrics.degradation_rate for r in resource_models], dtype=np.float64
+        ),
+        'remaining_uses': np.array(
+            [-1 if r.usage_metrics.remaining_uses is None else r.usage_metrics.remaining_uses
+             for r in resource_models], dtype=np.int32
+        )
+    }
+    return realm_ids, beings, resources, resource_models, tribulations
+
+def export_world_arrow(world: WorldGenerator, base_dir: Path, file_format: str = 'parquet') -> None:
+    """Write a world as typed Parquet or Arrow IPC tables.
+
+    Beings and resources use the columnar backend's schema; `location`
+    is a row number in the realms table and `master`, `owner`, `first`,
+    `second` and `being` are row numbers in the beings table.
+    """
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"Unknown file format {file_format!r}; expected one of {tuple(FILE_FORMATS)}")
+    pa = _require_pyarrow()
+    base_dir = Path(base_dir)
+    base_dir.mkdir(parents=True, exist_ok=True)
+
+    if isinstance(world.store, ColumnarWorld):
+        collected = _columnar_tables(world, world.store)
+    else:
+        collected = _model_tables(world, world.store)
+    realm_ids, beings, resources, resource_models, tribulations = collected
+    graph = world.store.relationship_graph()
+    beings['master'] = graph.masters
+
+    index = world.population_index
+    realms = [world.realms[realm_id] for realm_id in realm_ids]
+    realm_table = pa.table({
+        'id': pa.array([str(r.id) for r in realms], pa.string()),
+        'name': pa.array([r.name for r in realms], pa.string()),
+        'tier': pa.array([r.tier.name for r in realms], pa.string()).dictionary_encode(),
+        'description': pa.array([r.description for r in realms], pa.string()),
+        'population': pa.array([index.being_count(r.id) for r in realms], pa.int64()),
+        'resources': pa.array([index.resource_count(r.id) for r in realms], pa.int64()),
+        'parent_realm': pa.array(
+            [str(r.parent_realm) if r.parent_realm else None for r in realms], pa.string()
+        ),
+        'model': pa.array([r.model_dump_json() for r in realms], pa.string())
+    }).replace_schema_metadata({
+        'current_time': world.current_time.isoformat(),
+        'base_quality_level': repr(world.base_quality_level),
+        'seed': json.dumps(world.seed_sequence.entropy),
+        'ids': json.dumps(world.ids.state())
+    })
+
+    resource_table = _table(pa, resources).append_column(
+        'model', pa.array([r.model_dump_json() for r in resource_models], pa.string())
+    )
+    kinds = RelationshipGraph.KINDS
+    edges = {
+        name: np.concatenate([graph.edges[kind][name] for kind in kinds])
+        for name in EDGE_SCHEMA
+    }
+    kind_codes = np.concatenate([
+        np.full(len(graph.edges[kind]), code, dtype=np.int8)
+        for code, kind in enumerate(kinds)
+    ])
+    relationship_table = _table(pa, edges).add_column(
+        0, 'kind', pa.DictionaryArray.from_arrays(pa.array(kind_codes), pa.array(kinds))
+    )
+
+    tables = {
+        'realms': realm_table,
+        'beings': _table(pa, beings),
+        'resources': resource_table,
+        'relationships': relationship_table,
+        'tribulations': _table(pa, tribulations)
+    }
+    suffix = FILE_FORMATS[file_format]
+    for name, table in tables.items():
+        path = base_dir / f"{name}{suffix}"
+        if file_format == 'parquet':
+            pa.parquet.write_table(table, path)
+        else:
+            pa.feather.write_feather(table, path, compression='uncompressed')
+
+def load_world(base_dir: Path, backend: str = 'columnar', memory_map: bool = True) -> WorldGenerator:
+    """Rebuild a WorldGenerator from tables written by export_world_arrow.
+
+    The world gets the exported seed and id allocator back, so loaded ids
+    decode and new entities do not reuse them. With the columnar backend
+    and Arrow IPC files, numeric columns share memory with the mapped
+    files until they are first modified.
+    """
+    pa = _require_pyarrow()
+    base_dir = Path(base_dir)
+    file_format = next(
+        (name for name, suffix in FILE_FORMATS.items()
+         if (base_dir / f"beings{suffix}").exists()),
+        None
+    )
+    if file_format is None:
+        raise FileNotFoundError(f"No Arrow or Parquet world found in {base_dir}")
+
+    def read(name: str):
+        path = base_dir / f"{name}{FILE_FORMATS[file_format]}"
+        if file_format == 'parquet':
+            return pa.parquet.read_table(path, memory_map=memory_map)
+        return pa.feather.read_table(path, memory_map=memory_map)
+
+    def columns(table, schema: Dict[str, tuple]) -> Dict[str, np.ndarray]:
+        return {
+            name: _from_arrow(table.column(name), name, dtype, shape)
+            for name, (dtype, shape, _) in schema.items()
+        }
+
+    realm_table = read('realms')
+    metadata = {k.decode(): v.decode() for k, v in realm_table.schema.metadata.items()}
+    realms: List[Realm] = [
+        Realm.model_validate_json(text) for text in realm_table.column('model').to_pylist()
+    ]
+    resource_table = read('resources')
+    resource_models = [
+        Resource.model_validate_json(text) for text in resource_table.column('model').to_pylist()
+    ]
+    relationship_table = read('relationships')
+    kinds = relationship_table.column('kind').combine_chunks()
+    kind_names = np.asarray(kinds.dictionary.to_pylist())[kinds.indices.to_numpy()]
+    edges = columns(relationship_table, EDGE_SCHEMA)
+    being_columns = columns(read('beings'), EXPORT_BEING_SCHEMA)
+    graph = RelationshipGraph.from_arrays(
+        being_columns.pop('master'),
+        {
+            kind: {name: values[kind_names == kind] for name, values in edges.items()}
+            for kind in RelationshipGraph.KINDS
+        }
+    )
+
+    tribulations = columns(read('tribulations'), TRIBULATION_SCHEMA)
+    events = EventLog()
+    events.append(
+        'tribulation',
+        being_columns['id'][tribulations['being']],
+        tribulations['timestamp'],
+        np.column_stack((tribulations['power_level'], tribulations['difficulty'])),
+        tribulations['stage']
+    )
+
+    world = WorldGenerator(
+        seed=json.loads(metadata['seed']) if 'seed' in metadata else None,
+        base_quality_level=float(metadata['base_quality_level']),
+        backend=backend
+    )
+    # Exports written before the allocator was saved fall back to one drawn from the seed
+    ids = IdAllocator.restore(json.loads(metadata['ids'])) if 'ids' in metadata else world.ids
+
+    realm_ids: List[UUID] = [realm.id for realm in realms]
+    columnar = ColumnarWorld.from_tables(
+        realm_ids,
+        ColumnTable.from_columns(BEING_SCHEMA, being_columns),
+        ColumnTable.from_columns(RESOURCE_SCHEMA, columns(resource_table, RESOURCE_SCHEMA)),
+        resource_models,
+        graph,
+        events,
+        ids
+    )
+    world.current_time = datetime.fromisoformat(metadata['current_time'])
+    world.realms = {realm.id: realm for realm in realms}
+    world.realm_hierarchies = {
+        realm.id: list(realm.child_realms) for realm in realms if realm.child_realms
+    }
+
+    if backend == 'columnar':
+        world.attach_store(columnar)
+        return world
+
+    store = RecordStore(ids, events) if backend == 'records' else ModelStore(ids, events)
+    index = columnar.index
+    for realm_id in realm_ids:
+        rows = index.beings_in(realm_id)
+        if len(rows):
+            store.place_beings([columnar.being(row) for row in rows.tolist()], realm_id)
+        for row in index.resources_in(realm_id).tolist():
+            resource = columnar.resource(row)
+            store.add_resource(resource, realm_id)
+            owner = int(columnar.resource_table['owner'][row])
+            if owner >= 0:
+                store.artifact_owners[resource.id] = columnar.being_uuid(owner)
+    world.attach_store(store)
+    return world
@@ -0,0 +1,195 @@
+"""
+Streaming NDJSON export for generated worlds.
+Writes entity types as numbered newline-delimited JSON shards and relationships as CSV edge lists, optionally compressed.
+"""
+import bz2
+import gzip
+import json
+import lzma
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
+from uuid import UUID
+
+from ..models.being import Being
+from ..models.realm import Realm
+from ..models.resource import Resource
+
+# compression name: (open function, file suffix)
+COMPRESSORS: Dict[Optional[str], tuple] = {
+    None: (open, ''),
+    'gzip': (gzip.open, '.gz'),
+    'bz2': (bz2.open, '.bz2'),
+    'xz': (lzma.open, '.xz')
+}
+
+DEFAULT_SHARD_SIZE = 50_000
+
+def realm_record(realm: Realm, population: int, resources: int) -> Dict[str, Any]:
+    """Return the exported fields of a realm."""
+    return {
+        "id": str(realm.id),
+        "name": realm.name,
+        "tier": realm.tier.name,
+        "description": realm.description,
+        "population": population,
+        "resources": resources
+    }
+
+def being_record(being: Being, realm_id: UUID) -> Dict[str, Any]:
+    """Return the exported fields of a being."""
+    return {
+        "id": str(being.id),
+        "name": being.name,
+        "race": being.race,
+        "age": being.age,
+        "cultivation_stage": being.cultivation.stage.name,
+        "realm": being.cultivation.realm.name,
+        "combat_power": being.calculate_combat_power(),
+        "realm_location": str(realm_id)
+    }
+
+def resource_record(resource: Resource, realm_id: UUID) -> Dict[str, Any]:
+    """Return the exported fields of a resource."""
+    return {
+        "id": str(resource.id),
+        "name": resource.name,
+        "tier": resource.tier.name,
+        "description": resource.description,
+        "formation_age": resource.formation_attributes.current_age,
+        "realm_location": str(realm_id)
+    }
+
+def _write_shard(path: Path, opener: Callable, records: List[Dict[str, Any]]) -> None:
+    """Serialize one shard of records to a file, one JSON document per line."""
+    with opener(path, 'wt', encoding='utf-8') as f:
+        f.writelines(json.dumps(record) + '\n' for record in records)
+
+class _WritePool:
+    """Runs shard writes inline or on a bounded thread pool."""
+
+    def __init__(self, workers: int):
+        """Initialize the pool; `workers` of 0 writes on the calling thread."""
+        self._executor = ThreadPoolExecutor(workers) if workers > 0 else None
+        # Bounding in-flight shards keeps memory flat when writers fall behind
+        self._max_pending = 2 * workers
+        self._pending: Deque[Future] = deque()
+
+    def submit(self, fn: Callable, *args) -> None:
+        """Schedule a write, waiting for the oldest one if too many are pending."""
+        if self._executor is None:
+            fn(*args)
+            return
+        while len(self._pending) >= self._max_pending:
+            self._pending.popleft().result()
+        self._pending.append(self._executor.submit(fn, *args))
+
+    def close(self) -> None:
+        """Wait for every pending write and re-raise the first failure."""
+        if self._executor is None:
+            return
+        try:
+            while self._pending:
+                self._pending.popleft().result()
+        finally:
+            self._executor.shutdown(wait=True)
+
+class ShardWriter:
+    """Buffers records for one entity type and writes them as numbered shards."""
+
+    def __init__(
+        self,
+        directory: Path,
+        entity: str,
+        pool: _WritePool,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        compression: Optional[str] = None
+    ):
+        """Initialize an empty writer for `<entity>-NNNNN.ndjson[.suffix]` shards."""
+        if compression not in COMPRESSORS:
+            raise ValueError(f"Unknown compression {compression!r}")
+        self.directory = directory
+        self.entity = entity
+        self.shard_size = shard_size
+        self.count = 0
+        self.shards: List[str] = []
+        self._opener, self._suffix = COMPRESSORS[compression]
+        self._pool = pool
+        self._buffer: List[Dict[str, Any]] = []
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Queue a record, writing a shard once the buffer is full."""
+        self._buffer.append(record)
+        self.count += 1
+        if len(self._buffer) >= self.shard_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered records as the next shard."""
+        if not self._buffer:
+            return
+        name = f"{self.entity}-{len(self.shards):05d}.ndjson{self._suffix}"
+        self.shards.append(name)
+        self._pool.submit(_write_shard, self.directory / name, self._opener, self._buffer)
+        self._buffer = []
+
+def export_world_ndjson(
+    world,
+    base_dir: Path,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    compression: Optional[str] = None,
+    workers: int = 0
+) -> Dict[str, Any]:
+    """Stream a generated world to NDJSON shards and return the written manifest.
+
+    Entities are visited realm by realm through the population index and
+    built one at a time, so at most a few shards of records are held in
+    memory regardless of population size.
+    """
+    base_dir = Path(base_dir)
+    base_dir.mkdir(parents=True, exist_ok=True)
+    pool = _WritePool(workers)
+    writers = {
+        entity: ShardWriter(base_dir, entity, pool, shard_size, compression)
+        for entity in ('realms', 'hierarchies', 'beings', 'resources')
+    }
+    index = world.population_index
+    store = world.store
+
+    try:
+        for realm_id, realm in world.realms.items():
+            writers['realms'].add(realm_record(
+                realm, index.being_count(realm_id), index.resource_count(realm_id)
+            ))
+        for parent, children in world.realm_hierarchies.items():
+            writers['hierarchies'].add({
+                "parent": str(parent),
+                "children": [str(child) for child in children]
+            })
+        for realm_id in index.realms():
+            for handle in index.beings_in(realm_id):
+                writers['beings'].add(being_record(store.being(handle), realm_id))
+            for handle in index.resources_in(realm_id):
+                writers['resources'].add(resource_record(store.resource(handle), realm_id))
+        for writer in writers.values():
+            writer.flush()
+            
+        # Relationships go out as edge lists straight from the graph arrays
+        opener, suffix = COMPRESSORS[compression]
+        edge_lists = store.relationship_graph().write_edge_lists(
+            base_dir, store.being_labels, opener, suffix
+        )
+    finally:
+        pool.close()
+
+    manifest = {
+        "format": "ndjson",
+        "compression": compression,
+        "counts": {entity: writer.count for entity, writer in writers.items()},
+        "shards": {entity: writer.shards for entity, writer in writers.items()},
+        "edge_lists": [path.name for path in edge_lists]
+    }
+    with open(base_dir / "manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
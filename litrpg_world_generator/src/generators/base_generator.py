@@ -4,9 +4,11 @@ Provides common functionality for all specific generators.
 """
 from datetime import datetime, timedelta
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
 
+from ..profiling import track
+from ..sampling import categorical
 from ..constants import (
     DISTRIBUTION_PARAMS,
     DATA_QUALITY,
@@ -15,21 +17,36 @@ from ..constants import (
     ResourceTier
 )
 
+# Anything numpy.random.default_rng accepts; shards pass spawned SeedSequences
+# and procedural worlds pass keyed Philox streams
+SeedLike = Union[int, np.random.SeedSequence, np.random.BitGenerator, None]
+
 class BaseGenerator:
     """Base class for all data generators."""
     
     def __init__(
         self,
-        seed: Optional[int] = None,
+        seed: SeedLike = None,
         quality_level: float = 1.0,
         realm_tier: RealmTier = RealmTier.MORTAL
     ):
         """Initialize the generator with given parameters."""
         self.rng = np.random.default_rng(seed)
+        track(self.rng)
         self.quality_level = min(1.0, max(0.0, quality_level))
         self.realm_tier = realm_tier
         self.current_time = datetime.now()
         
+    def choose(
+        self,
+        categories: Sequence,
+        weights: Optional[Sequence[float]] = None,
+        size: Optional[int] = None
+    ):
+        """Draw one category (or `size` of them) through the distribution's shared sampler."""
+        sampler = categorical(tuple(categories), None if weights is None else tuple(weights))
+        return sampler.choose(self.rng, size)
+        
     def generate_cultivation_speed(self) -> float:
         """Generate a realistic cultivation speed value."""
         params = DISTRIBUTION_PARAMS['cultivation_speed']
@@ -51,6 +68,28 @@ class BaseGenerator:
         bottleneck = 1.0 / (1.0 + np.exp(-2 * (base - 2)))
         return self._apply_measurement_noise(bottleneck)
     
+    def generate_cultivation_speeds(self, size: int) -> np.ndarray:
+        """Generate cultivation speed values for many beings at once."""
+        params = DISTRIBUTION_PARAMS['cultivation_speed']
+        base = self.rng.gamma(
+            shape=params['shape'],
+            scale=params['scale'],
+            size=size
+        )
+        noise = self._apply_measurement_noise_array(base)
+        return np.maximum(0.0, noise)
+    
+    def generate_talent_ratings(self, size: int) -> np.ndarray:
+        """Generate talent ratings for many beings at once."""
+        params = DISTRIBUTION_PARAMS['talent_rating']
+        base = self.rng.gamma(
+            shape=params['shape'],
+            scale=params['scale'],
+            size=size
+        )
+        bottleneck = 1.0 / (1.0 + np.exp(-2 * (base - 2)))
+        return self._apply_measurement_noise_array(bottleneck)
+    
     def calculate_breakthrough_chance(
         self,
         talent: float,
@@ -122,7 +161,8 @@ class BaseGenerator:
             params['minimum'],
             base * realm_decay * age_factor * (1.0 + quality_bonus)
         )
-        return self._apply_measurement_noise(raw_stability)
+        # Stability is a fraction; the quality bonus and noise may not push it past 1
+        return min(1.0, self._apply_measurement_noise(raw_stability))
     
     def generate_time_flow(self, realm_difference: int) -> float:
         """Generate time flow rate between realms."""
@@ -148,6 +188,19 @@ class BaseGenerator:
         noise = self.rng.normal(loc=1.0, scale=total_error)
         return max(0.0, value * noise)
     
+    def _apply_measurement_noise_array(self, values: np.ndarray) -> np.ndarray:
+        """Apply measurement noise element-wise to an array of values."""
+        if self.quality_level >= 1.0:
+            return values
+            
+        params = DATA_QUALITY['measurement_error']
+        base_error = params['base_error']
+        realm_error = params['realm_increase'] * (self.realm_tier.value - 1)
+        total_error = (base_error + realm_error) * (1.0 - self.quality_level)
+        
+        noise = self.rng.normal(loc=1.0, scale=total_error, size=np.shape(values))
+        return np.maximum(0.0, values * noise)
+    
     def _apply_information_decay(
         self,
         value: float,
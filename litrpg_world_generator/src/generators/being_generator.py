@@ -7,27 +7,40 @@ import numpy as np
 from typing import Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
-from .base_generator import BaseGenerator
+from .base_generator import BaseGenerator, SeedLike
+from .being_batch import (
+    BLOODLINE_NAMES, SHARED_KIT, BeingBatch, shared_abilities, shared_mask_set
+)
+from ..models.construction import build
+from ..models.shared import EMPTY_DICT, EMPTY_SET, intern_str
+from ..profiling import profiled
+from ..sampling import CategoricalSampler, categorical
 from ..models.being import (
     Being, Bloodline, CultivationBase, Soul,
     Combat, Inventory, Karma, Achievement
 )
-from ..constants import CultivationStage, RealmTier
+from ..constants import (
+    BEING_VOCABULARY,
+    REALM_STAGES,
+    CultivationStage,
+    RealmTier
+)
 
 class BeingGenerator(BaseGenerator):
     """Generator for creating cultivator beings."""
     
     def __init__(
         self,
-        seed: Optional[int] = None,
+        seed: SeedLike = None,
         quality_level: float = 1.0,
         realm_tier: RealmTier = RealmTier.MORTAL
     ):
         """Initialize the being generator."""
         super().__init__(seed, quality_level, realm_tier)
-        self.name_prefixes = ['Azure', 'Jade', 'Golden', 'Sacred', 'Divine', 'Ancient']
-        self.name_suffixes = ['Dragon', 'Phoenix', 'Tiger', 'Turtle', 'Serpent', 'Lion']
+        self.name_prefixes = list(BEING_VOCABULARY['name_prefixes'])
+        self.name_suffixes = list(BEING_VOCABULARY['name_suffixes'])
         
+    @profiled()
     def generate_being(
         self,
         age: Optional[int] = None,
@@ -58,7 +71,8 @@ class BeingGenerator(BaseGenerator):
         measurement_accuracy = self._calculate_measurement_accuracy(cultivation.stage)
         data_reliability = self._calculate_data_reliability(age)
         
-        return Being(
+        return build(
+            Being,
             name=name,
             race=race,
             age=age,
@@ -79,13 +93,13 @@ class BeingGenerator(BaseGenerator):
         prefix = self.rng.choice(self.name_prefixes)
         suffix = self.rng.choice(self.name_suffixes)
         number = self.rng.integers(1, 9999)
-        return f"{prefix} {suffix} {number}"
+        return intern_str(f"{prefix} {suffix} {number}")
         
     def _generate_race(self) -> str:
         """Generate a being's race."""
-        races = ['Human', 'Dragon', 'Phoenix', 'Demon', 'Spirit', 'Ancient']
-        weights = [0.7, 0.1, 0.05, 0.1, 0.03, 0.02]
-        return self.rng.choice(races, p=weights)
+        races = BEING_VOCABULARY['races']
+        weights = BEING_VOCABULARY['race_weights']
+        return intern_str(self.choose(races, weights))
         
     def _generate_age(self) -> int:
         """Generate an appropriate age based on realm."""
@@ -98,22 +112,19 @@ class BeingGenerator(BaseGenerator):
         purity = strength * self.rng.random()
         mutation_factor = self.rng.random() * 0.1
         
-        traits = set()
         num_traits = self.rng.integers(1, 4)
-        possible_traits = [
-            'Fire Affinity', 'Water Mastery', 'Lightning Soul',
-            'Earth Heart', 'Wind Spirit', 'Time Perception',
-            'Space Comprehension', 'Fate Sensitivity'
-        ]
-        traits.update(self.rng.choice(possible_traits, size=num_traits, replace=False))
-        
-        return Bloodline(
-            name=f"{self.rng.choice(self.name_prefixes)} Bloodline",
+        possible_traits = BEING_VOCABULARY['bloodline_traits']
+        chosen = self.rng.choice(len(possible_traits), size=num_traits, replace=False)
+        traits_mask = sum(1 << int(bit) for bit in chosen)
+        
+        return build(
+            Bloodline,
+            name=BLOODLINE_NAMES[self.rng.choice(len(self.name_prefixes))],
             purity=purity,
-            traits=traits,
+            traits=shared_mask_set('bloodline_traits', traits_mask),
             mutation_factor=mutation_factor,
             inherited_power=strength * 100,
-            special_abilities=[f"{trait} Mastery" for trait in traits]
+            special_abilities=shared_abilities(traits_mask)
         )
         
     def _generate_cultivation_base(self, realm: RealmTier) -> CultivationBase:
@@ -122,7 +133,8 @@ class BeingGenerator(BaseGenerator):
         foundation_quality = self.generate_talent_rating()
         cultivation_speed = self.generate_cultivation_speed()
         
-        return CultivationBase(
+        return build(
+            CultivationBase,
             stage=stage,
             realm=realm,
             foundation_quality=foundation_quality,
@@ -130,12 +142,8 @@ class BeingGenerator(BaseGenerator):
             bottleneck_threshold=0.7 + (0.1 * self.rng.random()),
             comprehension_rate=0.1 + (0.4 * self.rng.random()),
             dao_insights={
-                'Heaven': self.rng.random(),
-                'Earth': self.rng.random(),
-                'Humanity': self.rng.random(),
-                'Fate': self.rng.random(),
-                'Time': self.rng.random(),
-                'Space': self.rng.random()
+                aspect: self.rng.random()
+                for aspect in BEING_VOCABULARY['dao_insights']
             }
         )
         
@@ -144,18 +152,17 @@ class BeingGenerator(BaseGenerator):
         base_strength = bloodline_strength * 100
         realm_multiplier = self.realm_tier.value
         
-        return Soul(
+        return build(
+            Soul,
             strength=base_strength * realm_multiplier,
             purity=0.3 + (0.7 * self.rng.random()),
             stability=0.4 + (0.6 * self.rng.random()),
             resonance={
-                'Natural': self.rng.random(),
-                'Artificial': self.rng.random(),
-                'Divine': self.rng.random(),
-                'Demonic': self.rng.random()
+                kind: self.rng.random()
+                for kind in BEING_VOCABULARY['soul_resonance']
             },
-            cultivation_affinity=['Fire', 'Water', 'Earth', 'Wind', 'Lightning'],
-            dao_marks={'Heaven', 'Earth'} if self.rng.random() > 0.8 else set()
+            cultivation_affinity=SHARED_KIT['cultivation_affinity'],
+            dao_marks=SHARED_KIT['dao_marks'] if self.rng.random() > 0.8 else EMPTY_SET
         )
         
     def _generate_combat(self, stage: CultivationStage) -> Combat:
@@ -163,69 +170,44 @@ class BeingGenerator(BaseGenerator):
         base_power = 10 * (stage.value + 1)
         
         techniques = {
-            'Sword': self.rng.random(),
-            'Palm': self.rng.random(),
-            'Movement': self.rng.random(),
-            'Formation': self.rng.random(),
-            'Body': self.rng.random()
+            technique: self.rng.random()
+            for technique in BEING_VOCABULARY['techniques']
         }
         
         weapons = {
-            'Sword': self.rng.random(),
-            'Spear': self.rng.random(),
-            'Bow': self.rng.random(),
-            'Staff': self.rng.random()
+            weapon: self.rng.random()
+            for weapon in BEING_VOCABULARY['weapons']
         }
         
-        return Combat(
+        return build(
+            Combat,
             base_power=base_power,
             technique_mastery=techniques,
             battle_experience=self.rng.random() * 1000,
             weapon_proficiency=weapons,
-            special_moves={
-                'Dragon Strike',
-                'Phoenix Flame',
-                'Tiger Roar'
-            } if self.rng.random() > 0.7 else set()
+            special_moves=SHARED_KIT['special_moves'] if self.rng.random() > 0.7 else EMPTY_SET
         )
         
     def _generate_inventory(self, stage: CultivationStage) -> Inventory:
         """Generate inventory contents."""
         storage_rings = max(1, stage.value // 3)
         
-        return Inventory(
+        return build(
+            Inventory,
             storage_rings=storage_rings,
-            artifacts={
-                'Basic Sword': 0.5,
-                'Protection Talisman': 0.3,
-                'Flying Sword': 0.8
-            },
-            resources={
-                'Spirit Stone': 1000,
-                'Qi Condensing Pill': 50,
-                'Foundation Pill': 10
-            },
-            currency={
-                'Spirit Stones': 10000,
-                'Contribution Points': 1000
-            },
-            equipment_slots={
-                'weapon': 'Basic Sword',
-                'armor': 'Cotton Robe',
-                'accessory': 'Jade Pendant'
-            }
+            artifacts=SHARED_KIT['artifacts'],
+            resources=SHARED_KIT['resources'],
+            currency=SHARED_KIT['currency'],
+            equipment_slots=SHARED_KIT['equipment_slots']
         )
         
     def _generate_karma(self) -> Karma:
         """Generate karmic attributes."""
-        return Karma(
+        return build(
+            Karma,
             fate_value=self.rng.normal(0, 1),
-            connections={},  # Empty initially
-            destiny_threads=[
-                'Great Fortune',
-                'Minor Calamity',
-                'Hidden Opportunity'
-            ],
+            connections=EMPTY_DICT,  # Empty initially
+            destiny_threads=SHARED_KIT['destiny_threads'],
             karmic_debt=max(0, self.rng.normal(0, 10)),
             fortune=self.rng.random() * 2 - 1,  # -1 to 1
             tribulation_counter=0
@@ -233,48 +215,28 @@ class BeingGenerator(BaseGenerator):
         
     def _generate_achievements(self) -> Achievement:
         """Generate achievements and titles."""
-        return Achievement(
-            titles={'Cultivator'},
+        return build(
+            Achievement,
+            titles=SHARED_KIT['titles'],
             reputation={
-                'Mortal World': self.rng.random(),
-                'Spirit World': self.rng.random(),
-                'Demon World': self.rng.random()
+                world: self.rng.random()
+                for world in BEING_VOCABULARY['reputation']
             },
-            accomplishments=[
-                'Began Cultivation',
-                'Formed Core',
-                'Survived Tribulation'
-            ],
-            hidden_achievements=set()
+            accomplishments=SHARED_KIT['accomplishments'],
+            hidden_achievements=EMPTY_SET
         )
         
     def _determine_cultivation_stage(self, realm: RealmTier) -> CultivationStage:
         """Determine appropriate cultivation stage for realm."""
-        if realm == RealmTier.MORTAL:
-            stages = [
-                CultivationStage.BODY_REFINEMENT,
-                CultivationStage.QI_CONDENSATION,
-                CultivationStage.FOUNDATION_ESTABLISHMENT,
-                CultivationStage.CORE_FORMATION
-            ]
-        elif realm == RealmTier.SPIRIT:
-            stages = [
-                CultivationStage.NASCENT_SOUL,
-                CultivationStage.SPIRIT_SEVERING,
-                CultivationStage.VOID_FORMATION
-            ]
-        else:
-            stages = [
-                CultivationStage.DAO_SEEKING,
-                CultivationStage.DAO_MANIFESTATION,
-                CultivationStage.DAO_MASTERY
-            ]
-            
-        weights = np.array([4, 2, 1])  # Higher weights for lower stages
-        weights = weights[:len(stages)]
-        weights = weights / weights.sum()
+        stages = REALM_STAGES[realm]
+        return stages[self._stage_sampler(realm).draw(self.rng)]
         
-        return self.rng.choice(stages, p=weights)
+    @staticmethod
+    def _stage_sampler(realm: RealmTier) -> CategoricalSampler:
+        """Return the shared stage distribution for a realm."""
+        # Each stage is half as common as the one below it
+        stages = tuple(REALM_STAGES[realm])
+        return categorical(stages, tuple(2.0 ** -np.arange(len(stages))))
         
     def _calculate_measurement_accuracy(self, stage: CultivationStage) -> float:
         """Calculate how accurately the being's attributes can be measured."""
@@ -294,13 +256,122 @@ class BeingGenerator(BaseGenerator):
         
     def _generate_hidden_attributes(self, stage: CultivationStage) -> Set[str]:
         """Determine which attributes are hidden from measurement."""
-        possible_hidden = {
-            'true_power_level',
-            'dao_comprehension',
-            'fate_connection',
-            'soul_structure',
-            'bloodline_secrets'
-        }
+        possible_hidden = BEING_VOCABULARY['hidden_attributes']
         
         hide_probability = 0.1 * stage.value
-        return {attr for attr in possible_hidden if self.rng.random() < hide_probability}
\ No newline at end of file
+        mask = sum(
+            1 << bit for bit in range(len(possible_hidden))
+            if self.rng.random() < hide_probability
+        )
+        return shared_mask_set('hidden_attributes', mask)
+        
+    @profiled()
+    def generate_beings(
+        self,
+        n: int,
+        initial_realm: Optional[RealmTier] = None
+    ) -> BeingBatch:
+        """Generate n beings at once, drawing each attribute as a NumPy array.
+
+        Drawing the columns costs about a microsecond per being, a few
+        hundred times less than generate_being. Building Being models from
+        them (BeingBatch.to_models, which the default 'models' backend does
+        for every being) costs over a hundred, so that backend generates
+        beings only about 1.5-2x faster than the scalar path; the columnar
+        and records backends keep the columns and build models on access.
+        """
+        if initial_realm is None:
+            initial_realm = self.realm_tier
+        rng = self.rng
+        vocabulary = BEING_VOCABULARY
+        columns: Dict[str, np.ndarray] = {}
+        
+        columns['name_prefix'] = rng.integers(
+            0, len(vocabulary['name_prefixes']), size=n, dtype=np.uint8
+        )
+        columns['name_suffix'] = rng.integers(
+            0, len(vocabulary['name_suffixes']), size=n, dtype=np.uint8
+        )
+        columns['name_number'] = rng.integers(1, 9999, size=n, dtype=np.uint16)
+        columns['race'] = categorical(
+            tuple(vocabulary['races']), tuple(vocabulary['race_weights'])
+        ).draw(rng, n).astype(np.uint8)
+        columns['age'] = (
+            rng.integers(16, 100, size=n) + self.realm_tier.value * 100
+        ).astype(np.int32)
+        
+        # Bloodline
+        strength = rng.random(n)
+        columns['bloodline_strength'] = strength
+        columns['bloodline_purity'] = strength * rng.random(n)
+        columns['bloodline_mutation'] = rng.random(n) * 0.1
+        columns['bloodline_traits'] = self._draw_trait_masks(
+            n, len(vocabulary['bloodline_traits'])
+        )
+        columns['bloodline_name'] = rng.integers(
+            0, len(vocabulary['name_prefixes']), size=n, dtype=np.uint8
+        )
+        
+        # Cultivation base
+        stage_values = np.array([s.value for s in REALM_STAGES[initial_realm]], dtype=np.uint8)
+        stage = stage_values[self._stage_sampler(initial_realm).draw(rng, n)]
+        columns['stage'] = stage
+        columns['realm'] = np.full(n, initial_realm.value, dtype=np.uint8)
+        columns['foundation_quality'] = self.generate_talent_ratings(n)
+        columns['cultivation_speed'] = self.generate_cultivation_speeds(n)
+        columns['bottleneck_threshold'] = 0.7 + (0.1 * rng.random(n))
+        columns['comprehension_rate'] = 0.1 + (0.4 * rng.random(n))
+        columns['dao_insights'] = rng.random((n, len(vocabulary['dao_insights'])))
+        
+        # Soul
+        columns['soul_strength'] = strength * 100 * self.realm_tier.value
+        columns['soul_purity'] = 0.3 + (0.7 * rng.random(n))
+        columns['soul_stability'] = 0.4 + (0.6 * rng.random(n))
+        columns['soul_resonance'] = rng.random((n, len(vocabulary['soul_resonance'])))
+        columns['dao_marks'] = rng.random(n) > 0.8
+        
+        # Combat
+        columns['base_power'] = 10.0 * (stage + 1)
+        columns['technique_mastery'] = rng.random((n, len(vocabulary['techniques'])))
+        columns['battle_experience'] = rng.random(n) * 1000
+        columns['weapon_proficiency'] = rng.random((n, len(vocabulary['weapons'])))
+        columns['special_moves'] = rng.random(n) > 0.7
+        
+        # Inventory, karma and achievements
+        columns['storage_rings'] = np.maximum(1, stage // 3).astype(np.uint8)
+        columns['fate_value'] = rng.normal(0, 1, size=n)
+        columns['karmic_debt'] = np.maximum(0, rng.normal(0, 10, size=n))
+        columns['fortune'] = rng.random(n) * 2 - 1
+        columns['reputation'] = rng.random((n, len(vocabulary['reputation'])))
+        
+        # Data quality metrics
+        columns['measurement_accuracy'] = np.clip(
+            0.7 - 0.05 * stage - 0.1 * self.realm_tier.value, 0.1, 1.0
+        )
+        columns['data_reliability'] = np.clip(
+            0.9 - 0.001 * (columns['age'] / 100) - 0.05 * self.realm_tier.value, 0.1, 1.0
+        )
+        hidden = rng.random((n, len(vocabulary['hidden_attributes']))) < (0.1 * stage)[:, None]
+        columns['hidden_attributes'] = self._pack_mask(hidden)
+        
+        # Checked once for the whole batch; models are then built unvalidated
+        batch = BeingBatch(columns, self.current_time)
+        batch.validate()
+        return batch
+        
+    def _draw_trait_masks(self, n: int, vocabulary_size: int) -> np.ndarray:
+        """Draw 1-3 distinct traits per being, encoded as bitmasks."""
+        trait_counts = self.rng.integers(1, 4, size=n)
+        # Ranking random keys gives an independent permutation per row
+        order = np.argsort(self.rng.random((n, vocabulary_size)), axis=1)
+        chosen = np.zeros((n, vocabulary_size), dtype=bool)
+        for k in range(3):
+            rows = np.flatnonzero(trait_counts > k)
+            chosen[rows, order[rows, k]] = True
+        return self._pack_mask(chosen)
+        
+    @staticmethod
+    def _pack_mask(flags: np.ndarray) -> np.ndarray:
+        """Pack a boolean (n, k) array into one bitmask per row."""
+        bits = np.left_shift(1, np.arange(flags.shape[1]), dtype=np.int64)
+        return (flags @ bits).astype(np.uint8)
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""
+Checkpoints for resumable world generation.
+Snapshots a world generator, including its stores and random generator states, after each completed generation step.
+"""
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Union
+
+from ..models.construction import is_strict, set_strict
+
+CHECKPOINT_FILE = 'world.ckpt'
+
+# Bumped whenever the pickled layout of the generator or its stores changes
+CHECKPOINT_VERSION = 6
+
+def checkpoint_file(path: Union[str, Path]) -> Path:
+    """Return the checkpoint file for a checkpoint directory."""
+    return Path(path) / CHECKPOINT_FILE
+
+def save_checkpoint(world: Any, path: Union[str, Path]) -> None:
+    """Write a world generator to the checkpoint directory `path`.
+
+    The snapshot is a single pickle (NumPy columns are stored as raw
+    buffers), written to a temporary file and renamed into place so a run
+    that dies mid-write keeps the previous checkpoint.
+    """
+    target = checkpoint_file(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    partial = target.with_suffix('.partial')
+    payload = {'version': CHECKPOINT_VERSION, 'strict': is_strict(), 'world': world}
+    with open(partial, 'wb') as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(partial, target)
+
+def load_checkpoint(path: Union[str, Path]) -> Any:
+    """Load the world generator saved in the checkpoint directory `path`.
+
+    Restores the validation mode the run was started with. Raises
+    FileNotFoundError when there is no checkpoint and ValueError when it
+    was written by an incompatible version.
+    """
+    with open(checkpoint_file(path), 'rb') as f:
+        payload = pickle.load(f)
+    if payload.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(
+            f"Checkpoint version {payload.get('version')} is not supported "
+            f"(expected {CHECKPOINT_VERSION}); regenerate the world"
+        )
+    set_strict(payload['strict'])
+    return payload['world']
@@ -0,0 +1,52 @@
+"""
+Bulk master-disciple assignment over stage-sorted realm populations.
+Draws disjoint sets of lower-stage disciples for every master of a realm in a few vectorized rounds.
+"""
+import numpy as np
+from typing import Tuple
+
+def assign_disciples(
+    sorted_stages: np.ndarray,
+    master_stages: np.ndarray,
+    wanted: np.ndarray,
+    rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (positions, owners) pairing disciples with masters.
+
+    `positions` index into the stage-sorted population and `owners` into
+    `master_stages`. Each master draws up to `wanted` disciples uniformly
+    from the beings at a strictly lower stage that no master has taken yet,
+    so no being is assigned twice. Every round gives each unfinished master
+    one free disciple; masters that draw the same being are ordered at
+    random and only the first keeps it.
+    """
+    # Beings below a master's stage form a prefix of the sorted view
+    limits = np.searchsorted(sorted_stages, master_stages, side='left')
+    remaining = np.minimum(wanted, limits).astype(np.int64)
+    taken = np.zeros(len(sorted_stages), dtype=bool)
+    positions, owners = [], []
+
+    active = np.flatnonzero(remaining > 0)
+    while len(active):
+        # free_before[i] counts untaken beings among the first i + 1
+        free_before = np.cumsum(~taken)
+        free = free_before[limits[active] - 1]
+        active, free = active[free > 0], free[free > 0]
+        if not len(active):
+            break
+
+        # The k-th free being is the first position where the count reaches k
+        picks = np.searchsorted(free_before, rng.integers(0, free) + 1, side='left')
+        order = rng.permutation(len(active))
+        _, first = np.unique(picks[order], return_index=True)
+        winners = order[first]
+
+        taken[picks[winners]] = True
+        positions.append(picks[winners])
+        owners.append(active[winners])
+        remaining[active[winners]] -= 1
+        active = active[remaining[active] > 0]
+
+    if not positions:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    return np.concatenate(positions), np.concatenate(owners)
@@ -7,7 +7,9 @@ import numpy as np
 from typing import Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
-from .base_generator import BaseGenerator
+from .base_generator import BaseGenerator, SeedLike
+from ..models.construction import build
+from ..profiling import profiled
 from ..models.realm import (
     Realm, NaturalLaws, SpatialAttributes, EnergyGrid,
     PopulationMetrics, FormationDetails, EnvironmentalEffects
@@ -19,7 +21,7 @@ class RealmGenerator(BaseGenerator):
     
     def __init__(
         self,
-        seed: Optional[int] = None,
+        seed: SeedLike = None,
         quality_level: float = 1.0,
         realm_tier: RealmTier = RealmTier.MORTAL
     ):
@@ -28,6 +30,7 @@ class RealmGenerator(BaseGenerator):
         self.element_types = ['Fire', 'Water', 'Earth', 'Wind', 'Lightning', 'Dark', 'Light']
         self.law_types = ['Space', 'Time', 'Fate', 'Creation', 'Destruction']
         
+    @profiled()
     def generate_realm(
         self,
         tier: Optional[RealmTier] = None,
@@ -55,7 +58,8 @@ class RealmGenerator(BaseGenerator):
         measurement_accuracy = self._calculate_measurement_accuracy(tier)
         data_reliability = self._calculate_data_reliability(age)
         
-        return Realm(
+        return build(
+            Realm,
             name=name,
             tier=tier,
             description=description,
@@ -110,7 +114,8 @@ class RealmGenerator(BaseGenerator):
         """Generate natural laws for the realm."""
         base_qi = self.generate_qi_density(100.0)
         
-        return NaturalLaws(
+        return build(
+            NaturalLaws,
             qi_density=base_qi,
             space_stability=self.generate_space_stability(1000, 0.8),
             time_flow_rate=self.generate_time_flow(tier.value - 1),
@@ -130,7 +135,8 @@ class RealmGenerator(BaseGenerator):
         """Generate spatial characteristics for the realm."""
         base_size = 1000000 * (10 ** tier.value)  # in cubic kilometers
         
-        return SpatialAttributes(
+        return build(
+            SpatialAttributes,
             dimensions=3 + (tier.value // 2),  # Higher realms have more dimensions
             size=base_size,
             boundary_stability=0.5 + (0.5 * self.rng.random()),
@@ -161,7 +167,8 @@ class RealmGenerator(BaseGenerator):
         """Generate energy distribution for the realm."""
         base_energy = 1000 * (10 ** tier.value)
         
-        return EnergyGrid(
+        return build(
+            EnergyGrid,
             base_energy_level=base_energy,
             energy_types={
                 element: base_energy * self.rng.random()
@@ -195,7 +202,8 @@ class RealmGenerator(BaseGenerator):
         """Generate population distribution for the realm."""
         base_population = 1000000 * (10 ** (6 - tier.value))  # Higher realms have fewer beings
         
-        return PopulationMetrics(
+        return build(
+            PopulationMetrics,
             total_population=base_population,
             species_distribution={
                 'Human': 0.6,
@@ -235,7 +243,8 @@ class RealmGenerator(BaseGenerator):
         tier: RealmTier
     ) -> FormationDetails:
         """Generate formation characteristics for the realm."""
-        return FormationDetails(
+        return build(
+            FormationDetails,
             age=age,
             stability_cycle=1000 * tier.value,
             maintenance_cost=1000000 * (10 ** tier.value),
@@ -269,7 +278,8 @@ class RealmGenerator(BaseGenerator):
         
     def _generate_environmental_effects(self, tier: RealmTier) -> EnvironmentalEffects:
         """Generate environmental conditions for the realm."""
-        return EnvironmentalEffects(
+        return build(
+            EnvironmentalEffects,
             weather_patterns={
                 'Energy Storms': 0.3 * tier.value,
                 'Law Fluctuations': 0.2 * tier.value,
@@ -310,7 +320,7 @@ class RealmGenerator(BaseGenerator):
         """Generate appropriate age for the realm."""
         base_age = 1000 * (10 ** tier.value)
         variation = self.rng.integers(-base_age//10, base_age//10)
-        return max(1000, base_age + variation)
+        return max(1000, base_age + int(variation))
         
     def _generate_controlling_factions(self, tier: RealmTier) -> Dict[str, float]:
         """Generate controlling factions and their influence."""
@@ -357,5 +367,20 @@ class RealmGenerator(BaseGenerator):
             'Chaotic Regions'
         }
         
-        unmapped_count = self.rng.integers(1, tier.value + 2)
-        return set(self.rng.choice(list(possible_regions), size=unmapped_count, replace=False))
\ No newline at end of file
+        unmapped_count = self.rng.integers(1, min(tier.value + 1, len(possible_regions)) + 1)
+        return set(self.rng.choice(list(possible_regions), size=unmapped_count, replace=False))
+
+    def _calculate_measurement_accuracy(self, tier: RealmTier) -> float:
+        """Calculate how accurately the realm can be surveyed."""
+        base_accuracy = 0.9
+        tier_penalty = 0.1 * (tier.value - 1)
+
+        return max(0.1, min(1.0, base_accuracy - tier_penalty))
+
+    def _calculate_data_reliability(self, age: int) -> float:
+        """Calculate how reliable the realm's data is based on age."""
+        base_reliability = 0.95
+        # Realm ages span orders of magnitude, so the penalty grows with their log
+        age_penalty = 0.05 * np.log10(max(age, 1000) / 1000)
+
+        return float(max(0.1, min(1.0, base_reliability - age_penalty)))
\ No newline at end of file
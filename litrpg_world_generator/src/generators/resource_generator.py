@@ -3,11 +3,13 @@ Generator for creating cultivation resources in the LITRPG world.
 Handles creation of resources, treasures, and artifacts with realistic properties.
 """
 from datetime import datetime, timedelta
-import numpy as np
 from typing import Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
-from .base_generator import BaseGenerator
+from .base_generator import BaseGenerator, SeedLike
+from ..models.construction import build
+from ..models.shared import intern_str
+from ..profiling import profiled
 from ..models.resource import (
     Resource, EnergyProfile, FormationAttributes,
     QualityMetrics, CraftingRequirements, SpecialEffects,
@@ -20,7 +22,7 @@ class ResourceGenerator(BaseGenerator):
     
     def __init__(
         self,
-        seed: Optional[int] = None,
+        seed: SeedLike = None,
         quality_level: float = 1.0,
         realm_tier: RealmTier = RealmTier.MORTAL
     ):
@@ -29,6 +31,7 @@ class ResourceGenerator(BaseGenerator):
         self.element_types = ['Fire', 'Water', 'Earth', 'Wind', 'Lightning', 'Dark', 'Light']
         self.environment_types = ['Mountain', 'Ocean', 'Desert', 'Forest', 'Volcano', 'Arctic']
         
+    @profiled()
     def generate_resource(
         self,
         tier: Optional[ResourceTier] = None,
@@ -41,7 +44,7 @@ class ResourceGenerator(BaseGenerator):
         if age is None:
             age = self.generate_resource_formation_time(tier)
         if environment_type is None:
-            environment_type = self.rng.choice(self.environment_types)
+            environment_type = intern_str(self.rng.choice(self.environment_types))
             
         name = self._generate_name(tier)
         description = self._generate_description(tier, environment_type)
@@ -62,7 +65,8 @@ class ResourceGenerator(BaseGenerator):
         measurement_accuracy = self._calculate_measurement_accuracy(tier)
         data_reliability = self._calculate_data_reliability(age)
         
-        return Resource(
+        return build(
+            Resource,
             name=name,
             description=description,
             tier=tier,
@@ -91,6 +95,7 @@ class ResourceGenerator(BaseGenerator):
             ResourceTier.RARE: ['Superior', 'Excellent', 'Premium'],
             ResourceTier.EPIC: ['Magnificent', 'Extraordinary', 'Supreme'],
             ResourceTier.LEGENDARY: ['Mythical', 'Legendary', 'Ancient'],
+            ResourceTier.MYTHICAL: ['Mythic', 'Fabled', 'Otherworldly'],
             ResourceTier.DIVINE: ['Divine', 'Heavenly', 'Celestial'],
             ResourceTier.PRIMORDIAL: ['Primordial', 'Eternal', 'Ultimate']
         }
@@ -102,7 +107,7 @@ class ResourceGenerator(BaseGenerator):
         type_ = self.rng.choice(types)
         element = self.rng.choice(elements)
         
-        return f"{prefix} {element} {type_}"
+        return intern_str(f"{prefix} {element} {type_}")
         
     def _generate_description(self, tier: ResourceTier, environment: str) -> str:
         """Generate a description for the resource."""
@@ -114,15 +119,16 @@ class ResourceGenerator(BaseGenerator):
     def _generate_energy_profile(self, tier: ResourceTier) -> EnergyProfile:
         """Generate energy characteristics for the resource."""
         base_power = 100 * (tier.value ** 2)
-        energy_type = self.rng.choice(self.element_types)
+        energy_type = intern_str(self.rng.choice(self.element_types))
         
-        return EnergyProfile(
+        return build(
+            EnergyProfile,
             base_power=base_power,
             energy_type=energy_type,
             purity=0.3 + (0.7 * self.rng.random()),
             stability=0.4 + (0.6 * self.rng.random()),
             resonance_frequencies=[
-                self.rng.choice(self.element_types)
+                intern_str(self.rng.choice(self.element_types))
                 for _ in range(self.rng.integers(1, 4))
             ],
             absorption_rate=0.1 + (0.9 * self.rng.random()),
@@ -135,7 +141,8 @@ class ResourceGenerator(BaseGenerator):
         environment_type: str
     ) -> FormationAttributes:
         """Generate formation characteristics for the resource."""
-        return FormationAttributes(
+        return build(
+            FormationAttributes,
             formation_date=self.current_time - timedelta(days=age*365),
             maturity_age=age * 2,
             current_age=age,
@@ -149,7 +156,8 @@ class ResourceGenerator(BaseGenerator):
         """Generate quality metrics for the resource."""
         base_grade = 0.3 + (0.7 * (tier.value / ResourceTier.PRIMORDIAL.value))
         
-        return QualityMetrics(
+        return build(
+            QualityMetrics,
             base_grade=base_grade,
             impurities=max(0, 1 - base_grade),
             stability_rating=0.4 + (0.6 * self.rng.random()),
@@ -168,7 +176,8 @@ class ResourceGenerator(BaseGenerator):
             
         min_realm = RealmTier(max(1, tier.value - 2))
         
-        return CraftingRequirements(
+        return build(
+            CraftingRequirements,
             minimum_realm=min_realm,
             tool_requirements={'Cauldron', 'Formation Array'},
             skill_requirements={
@@ -199,9 +208,10 @@ class ResourceGenerator(BaseGenerator):
             'Body Fortification'
         ]
         
-        return SpecialEffects(
-            primary_effect=self.rng.choice(effects),
-            secondary_effects=self.rng.choice(effects, size=2).tolist(),
+        return build(
+            SpecialEffects,
+            primary_effect=intern_str(self.rng.choice(effects)),
+            secondary_effects=[intern_str(effect) for effect in self.rng.choice(effects, size=2)],
             side_effects=['Minor Fatigue'] if self.rng.random() > 0.7 else [],
             activation_conditions=['Qi Circulation', 'Mental Focus'],
             duration=int(3600 * (1 + self.rng.random() * tier.value)),
@@ -215,7 +225,8 @@ class ResourceGenerator(BaseGenerator):
         
     def _generate_usage_metrics(self, tier: ResourceTier) -> UsageMetrics:
         """Generate usage metrics for the resource."""
-        return UsageMetrics(
+        return build(
+            UsageMetrics,
             consumption_method='Absorption' if tier.value <= 3 else 'Refinement',
             absorption_efficiency=0.3 + (0.7 * self.rng.random()),
             usage_limit=10 * tier.value if tier.value <= 4 else None,
@@ -232,16 +243,14 @@ class ResourceGenerator(BaseGenerator):
     def _determine_resource_tier(self) -> ResourceTier:
         """Determine appropriate resource tier for the realm."""
         available_tiers = list(ResourceTier)[:self.realm_tier.value + 2]
-        weights = np.array([10, 5, 3, 2, 1, 0.5, 0.1])[:len(available_tiers)]
-        weights = weights / weights.sum()
-        
-        return self.rng.choice(available_tiers, p=weights)
+        weights = (10, 5, 3, 2, 1, 0.5, 0.1)[:len(available_tiers)]
+        return self.choose(available_tiers, weights)
         
     def _determine_category(self, tier: ResourceTier) -> str:
         """Determine the resource category."""
         categories = ['Pill', 'Elixir', 'Ore', 'Spirit Plant', 'Beast Core']
         weights = [0.4, 0.3, 0.15, 0.1, 0.05]
-        return self.rng.choice(categories, p=weights)
+        return intern_str(self.choose(categories, weights))
         
     def _determine_subcategory(self, tier: ResourceTier) -> str:
         """Determine the resource subcategory."""
@@ -254,7 +263,7 @@ class ResourceGenerator(BaseGenerator):
         }
         
         category = self._determine_category(tier)
-        return self.rng.choice(subcategories[category])
+        return intern_str(self.rng.choice(subcategories[category]))
         
     def _calculate_rarity_index(
         self,
@@ -0,0 +1,49 @@
+"""
+Per-realm shard generation for parallel world building.
+Populates one realm from its own seed stream so shards can run in worker processes and merge deterministically.
+"""
+import numpy as np
+from typing import List, Optional, Tuple
+
+from .being_batch import BeingBatch
+from .being_generator import BeingGenerator
+from .resource_generator import ResourceGenerator
+from ..clock import WorldClock, using_clock
+from ..models.construction import set_strict
+from ..models.resource import Resource
+from ..profiling import track
+from ..sampling import categorical
+from ..constants import RealmTier, ResourceTier
+
+def generate_realm_shard(
+    tier: RealmTier,
+    seed: np.random.SeedSequence,
+    population: int,
+    resource_count: int,
+    strict: bool = False,
+    now: Optional[int] = None
+) -> Tuple[BeingBatch, List[Resource]]:
+    """Generate the beings and resources of one realm from its seed stream.
+
+    The result depends only on the arguments, so shards produce the same
+    data whichever process runs them and in whatever order. `strict` and
+    `now` (the world clock in epoch microseconds) carry the parent's
+    validation mode and time into worker processes.
+    """
+    set_strict(strict)
+    clock = WorldClock(now)
+    being_seed, resource_seed, tier_seed = seed.spawn(3)
+    being_generator = BeingGenerator(being_seed)
+    being_generator.current_time = clock.now
+    batch = being_generator.generate_beings(population, initial_realm=tier)
+
+    # Higher realms have rarer resources
+    available_tiers = categorical(tuple(ResourceTier)[:tier.value + 2])
+    tier_rng = np.random.default_rng(tier_seed)
+    track(tier_rng)
+    tiers = available_tiers.choose(tier_rng, resource_count)
+    resource_generator = ResourceGenerator(resource_seed)
+    resource_generator.current_time = clock.now
+    with using_clock(clock):
+        resources = [resource_generator.generate_resource(tier=resource_tier) for resource_tier in tiers]
+    return batch, resources
@@ -2,47 +2,159 @@
 Main generator for creating and managing the entire LITRPG world.
 Coordinates realm, being, and resource generation to create a coherent world.
 """
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 import numpy as np
-from typing import Dict, List, Optional, Set, Tuple
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Set, Tuple, Union
 from uuid import UUID
 
-from .base_generator import BaseGenerator
+from .base_generator import BaseGenerator, SeedLike
+from .being_batch import BeingBatch
 from .being_generator import BeingGenerator
+from .checkpoint import save_checkpoint
+from .disciples import assign_disciples
 from .resource_generator import ResourceGenerator
 from .realm_generator import RealmGenerator
+from .shard import generate_realm_shard
+from ..clock import MICROS_PER_DAY, WorldClock, to_micros, using_clock
 from ..models.being import Being
+from ..models.construction import is_strict
+from ..models.metrics import bump, bump_all, metric_cache
 from ..models.resource import Resource
 from ..models.realm import Realm
-from ..constants import RealmTier, ResourceTier, POPULATION_DISTRIBUTION
+from ..profiling import count, phase, profiled, track
+from ..world.allocation import ALLOCATION_POLICIES, AllocationPolicy, distribute_resources
+from ..world.columnar import ColumnarWorld
+from ..world.events import EventLog, entity_words
+from ..world.ids import IdAllocator
+from ..world.rankings import percentile_bands, stage_histogram, top_k
+from ..world.records import RecordStore
+from ..world.scheduler import EventQueue
+from ..world.simulation import tick_years
+from ..world.statistics import WorldStatistics, batch_profiles, being_profile
+from ..world.stores import ModelStore, PopulationStore
+from ..constants import RealmTier, POPULATION_DISTRIBUTION
+
+# backend name -> population store class
+_STORES = {
+    'models': ModelStore,
+    'columnar': ColumnarWorld,
+    'records': RecordStore
+}
 
 class WorldGenerator:
     """Main generator for creating and managing the LITRPG world."""
     
+    BACKENDS = ('models', 'columnar', 'records')
+    
     def __init__(
         self,
-        seed: Optional[int] = None,
-        base_quality_level: float = 1.0
+        seed: SeedLike = None,
+        base_quality_level: float = 1.0,
+        backend: str = 'models',
+        workers: int = 1,
+        allocation: Union[str, AllocationPolicy] = 'uniform',
+        checkpoint_dir: Optional[Union[str, Path]] = None,
+        events: Optional[EventLog] = None
     ):
-        """Initialize the world generator."""
-        self.rng = np.random.default_rng(seed)
+        """Initialize the world generator.
+        
+        The 'columnar' backend keeps beings and resources as NumPy columns;
+        `beings`, `resources` and the location maps then become read-only
+        views that build models on access. The 'records' backend keeps
+        beings as slotted records and builds their models the same way.
+        With `workers` > 1 realms are populated in a process pool; results
+        do not depend on the count.
+        `allocation` names a policy from ALLOCATION_POLICIES or is a policy
+        instance deciding which beings receive rare resources. With a
+        `checkpoint_dir` the generator snapshots itself there after every
+        generation step (see load_checkpoint to resume). Entity ids are
+        derived from the seed (see IdAllocator), so seeded runs repeat them.
+        Tribulations and stability samples go to `events`, an EventLog that
+        may spill to disk or keep only recent events. `statistics` is kept
+        current as the world changes (see WorldStatistics).
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}; expected one of {self.BACKENDS}")
+        if isinstance(allocation, str):
+            if allocation not in ALLOCATION_POLICIES:
+                raise ValueError(
+                    f"Unknown allocation policy {allocation!r}; "
+                    f"expected one of {tuple(ALLOCATION_POLICIES)}"
+                )
+            allocation = ALLOCATION_POLICIES[allocation]()
+        self.allocation = allocation
         self.base_quality_level = base_quality_level
-        self.current_time = datetime.now()
+        self.clock = WorldClock()  # simulated time
+        self.workers = max(1, workers)
+        self.checkpoint_dir = checkpoint_dir
+        
+        # Plan and finished steps of an unfinished generate_world call
+        self._progress: Optional[Dict[str, object]] = None
+        
+        # Every consumer draws from its own stream spawned from the seed
+        self.seed_sequence = np.random.SeedSequence(seed)
+        (world_seed, being_seed, resource_seed,
+         realm_seed, self._shard_seeds) = self.seed_sequence.spawn(5)
+        self.rng = np.random.default_rng(world_seed)
+        track(self.rng)
         
         # Initialize sub-generators
-        self.being_generator = BeingGenerator(seed)
-        self.resource_generator = ResourceGenerator(seed)
-        self.realm_generator = RealmGenerator(seed)
+        self.being_generator = BeingGenerator(being_seed)
+        self.resource_generator = ResourceGenerator(resource_seed)
+        self.realm_generator = RealmGenerator(realm_seed)
         
         # Storage for generated entities
+        self.backend = backend
         self.realms: Dict[UUID, Realm] = {}
-        self.beings: Dict[UUID, Being] = {}
-        self.resources: Dict[UUID, Resource] = {}
+        self.attach_store(_STORES[backend](IdAllocator(self.seed_sequence), events))
         
         # Tracking relationships
         self.realm_hierarchies: Dict[UUID, List[UUID]] = {}  # parent -> children
-        self.being_locations: Dict[UUID, UUID] = {}  # being -> realm
-        self.resource_locations: Dict[UUID, UUID] = {}  # resource -> realm
+        
+        # Realms keyed on when each next needs stabilization; built on the first tick
+        self._stabilizations: Optional[EventQueue] = None
+        
+    @property
+    def current_time(self) -> datetime:
+        """The world's simulated time."""
+        return self.clock.now
+        
+    @current_time.setter
+    def current_time(self, value: datetime) -> None:
+        self.clock.set(value)
+        
+    def __getstate__(self) -> dict:
+        """Pickle the generator without its ranking cache, which is only valid in this process."""
+        state = dict(self.__dict__)
+        state['_power_columns'] = {}
+        return state
+        
+    def attach_store(self, store: PopulationStore) -> None:
+        """Use `store` for beings and resources and re-point the views onto it."""
+        self.store = store
+        self.ids = store.ids  # entity indices and their seed-derived UUIDs
+        self.events = store.events  # tribulation and stability history
+        self.beings: Mapping[UUID, Being] = store.beings
+        self.resources: Mapping[UUID, Resource] = store.resources
+        self.being_locations: Mapping[UUID, UUID] = store.being_locations  # being -> realm
+        self.resource_locations: Mapping[UUID, UUID] = store.resource_locations  # resource -> realm
+        self.population_index = store.index  # realm -> beings/resources
+        # realm -> (being handles, metric cache changes, combat powers) for ranking queries
+        self._power_columns: Dict[UUID, tuple] = {}
+        self.recount_statistics()
+        
+    def recount_statistics(self) -> None:
+        """Rebuild `statistics` from the realms and the store, after they were changed directly."""
+        self.statistics = WorldStatistics()
+        for realm in self.realms.values():
+            self.statistics.add_realm(realm)
+        for realm_id in self.population_index.realms():
+            handles = self.population_index.beings_in(realm_id)
+            self.statistics.add_beings(realm_id, self.store.being_profiles(handles))
+            self.statistics.add_resources(realm_id, self.population_index.resource_count(realm_id))
         
     def generate_world(
         self,
@@ -50,59 +162,119 @@ class WorldGenerator:
         beings_per_realm: int = 1000,
         resources_per_realm: int = 100
     ) -> None:
-        """Generate a complete world with all realms, beings, and resources."""
-        # Generate realms from lowest to highest
-        for tier in RealmTier:
-            if len(self.realms) >= num_realms:
-                break
-                
-            realm = self.realm_generator.generate_realm(tier=tier)
-            self.realms[realm.id] = realm
+        """Generate a complete world with all realms, beings, and resources.
+        
+        Each step runs as a profiling phase (see src.profiling); the hooks
+        do nothing unless profiling is enabled. Steps finished by an
+        interrupted call (as restored by load_checkpoint) are skipped, so
+        calling this again with the same arguments completes the world.
+        New models are stamped with the world clock's time.
+        """
+        with using_clock(self.clock):
+            self._generate_world(num_realms, beings_per_realm, resources_per_realm)
             
-            # Generate beings for this realm
-            self._populate_realm(realm.id, beings_per_realm)
+    def _generate_world(self, num_realms: int, beings_per_realm: int, resources_per_realm: int) -> None:
+        """Run the generation steps that have not finished yet."""
+        plan = (num_realms, beings_per_realm, resources_per_realm)
+        if self._progress is None:
+            self._progress = {'plan': plan, 'done': []}
+        elif self._progress['plan'] != plan:
+            raise ValueError(
+                f"Generation was started with (num_realms, beings_per_realm, "
+                f"resources_per_realm) = {self._progress['plan']}, not {plan}"
+            )
+        done = self._progress['done']
+        
+        # Generate realms from lowest to highest
+        if 'realms' not in done:
+            new_realms = []
+            with phase('realms'):
+                for tier in RealmTier:
+                    if len(self.realms) >= num_realms:
+                        break
+                        
+                    realm = self.realm_generator.generate_realm(tier=tier)
+                    realm.id = self.ids.new_uuid('realm')
+                    self.realms[realm.id] = realm
+                    self.statistics.add_realm(realm)
+                    new_realms.append(realm)
+                self._stabilizations = None
+                count(realms=len(new_realms))
+            self._progress['realms'] = [realm.id for realm in new_realms]
+            self._progress['shard_seeds'] = self._shard_seeds.spawn(len(new_realms))
+            self._complete('realms')
+        new_realms = [self.realms[realm_id] for realm_id in self._progress['realms']]
             
-            # Generate resources for this realm
-            self._generate_realm_resources(realm.id, resources_per_realm)
+        # Generate beings and resources for each realm from its own seed stream
+        pending = [k for k, realm in enumerate(new_realms) if f'populate:{realm.id}' not in done]
+        tasks = (
+            [new_realms[k].tier for k in pending],
+            [self._progress['shard_seeds'][k] for k in pending],
+            # Population distribution depends on realm tier
+            [int(beings_per_realm * POPULATION_DISTRIBUTION[new_realms[k].tier]) for k in pending],
+            [resources_per_realm] * len(pending),
+            [is_strict()] * len(pending),
+            [self.clock.micros] * len(pending)
+        )
+        pool = None
+        if self.workers > 1 and len(pending) > 1:
+            pool = ProcessPoolExecutor(min(self.workers, len(pending)))
+        with phase('populate'), pool or nullcontext():
+            # Draws made in worker processes are not counted
+            shards = (pool.map if pool else map)(generate_realm_shard, *tasks)
+            for k, shard in zip(pending, shards):
+                self._store_shard(new_realms[k].id, *shard)
+                self._complete(f'populate:{new_realms[k].id}')
+            count(beings=sum(tasks[2]), resources=resources_per_realm * len(pending))
             
-        # Establish realm connections
-        self._establish_realm_connections()
-        
-        # Create relationships between entities
-        self._establish_being_relationships()
-        self._distribute_resources()
+        # Connect realms, create relationships between entities and hand out resources
+        for step, run in (
+            ('realm_connections', self._establish_realm_connections),
+            ('relationships', self._establish_being_relationships),
+            ('resource_distribution', self._distribute_resources)
+        ):
+            if step not in done:
+                with phase(step):
+                    run()
+                self._complete(step)
+        self._progress = None
         
-    def _populate_realm(self, realm_id: UUID, population: int) -> None:
-        """Populate a realm with beings."""
-        realm = self.realms[realm_id]
+    def completed_steps(self) -> List[str]:
+        """Return the steps an unfinished generate_world call has completed."""
+        return list(self._progress['done']) if self._progress else []
         
-        # Calculate population distribution based on realm tier
-        tier_distribution = POPULATION_DISTRIBUTION[realm.tier]
-        actual_population = int(population * tier_distribution)
+    def _complete(self, step: str) -> None:
+        """Record a finished generation step and checkpoint the generator if enabled."""
+        self._progress['done'].append(step)
+        if self.checkpoint_dir is not None:
+            with phase('checkpoint'):
+                save_checkpoint(self, self.checkpoint_dir)
         
-        for _ in range(actual_population):
-            being = self.being_generator.generate_being(
-                initial_realm=realm.tier
-            )
-            self.beings[being.id] = being
-            self.being_locations[being.id] = realm_id
-            
-    def _generate_realm_resources(
+    def _store_shard(
         self,
         realm_id: UUID,
-        resource_count: int
+        batch: BeingBatch,
+        resources: List[Resource]
     ) -> None:
-        """Generate resources for a realm."""
-        realm = self.realms[realm_id]
-        
-        # Higher realms have rarer resources
-        available_tiers = list(ResourceTier)[:realm.tier.value + 2]
+        """Place a generated realm shard's beings and resources in the store."""
+        self.store.add_beings(batch, realm_id)
+        self.statistics.add_beings(realm_id, batch_profiles(batch))
+        for resource in resources:
+            resource.id = self.ids.new_uuid('resource')
+            self.store.add_resource(resource, realm_id)
+        self.statistics.add_resources(realm_id, len(resources))
+            
+    def move_being(self, being_id: UUID, realm_id: UUID) -> None:
+        """Move a being to another realm."""
+        from_realm = self.being_locations[being_id]
+        self.store.move_being(being_id, realm_id)
+        self.statistics.move_being(from_realm, realm_id, being_profile(self.beings[being_id]))
         
-        for _ in range(resource_count):
-            tier = self.rng.choice(available_tiers)
-            resource = self.resource_generator.generate_resource(tier=tier)
-            self.resources[resource.id] = resource
-            self.resource_locations[resource.id] = realm_id
+    def move_resource(self, resource_id: UUID, realm_id: UUID) -> None:
+        """Move a resource to another realm."""
+        from_realm = self.resource_locations[resource_id]
+        self.store.move_resource(resource_id, realm_id)
+        self.statistics.move_resource(from_realm, realm_id)
             
     def _establish_realm_connections(self) -> None:
         """Establish connections between realms."""
@@ -128,88 +300,85 @@ class WorldGenerator:
             
     def _establish_being_relationships(self) -> None:
         """Establish relationships between beings."""
-        for being_id, being in self.beings.items():
-            realm_id = self.being_locations[being_id]
-            realm_beings = [
-                b_id for b_id, r_id in self.being_locations.items()
-                if r_id == realm_id and b_id != being_id
-            ]
+        for realm_id in self.population_index.realms():
+            realm_beings = self.population_index.beings_in(realm_id)
+            realm_stages = self.population_index.being_stages_in(realm_id)
+            by_stage, sorted_stages = self.population_index.stage_sorted(realm_id)
             
-            # Create master-disciple relationships
-            if self.rng.random() < 0.1:  # 10% chance to have disciples
-                potential_disciples = [
-                    b_id for b_id in realm_beings
-                    if self.beings[b_id].cultivation.stage.value <
-                    being.cultivation.stage.value
-                ]
-                
-                if potential_disciples:
-                    disciple_count = self.rng.integers(1, 4)
-                    disciples = self.rng.choice(
-                        potential_disciples,
-                        size=min(disciple_count, len(potential_disciples)),
-                        replace=False
-                    )
-                    
-                    for disciple_id in disciples:
-                        self.beings[disciple_id].master_id = being_id
-                        being.disciples.append(disciple_id)
-                        
-            # Create ally and enemy relationships
-            num_relationships = self.rng.integers(1, 6)
-            potential_relations = self.rng.choice(
-                realm_beings,
-                size=min(num_relationships, len(realm_beings)),
-                replace=False
+            # Create master-disciple relationships for the whole realm at once
+            is_master = self.rng.random(len(realm_beings)) < 0.1  # 10% chance to have disciples
+            positions, owners = assign_disciples(
+                sorted_stages,
+                realm_stages[is_master],
+                self.rng.integers(1, 4, size=int(is_master.sum())),
+                self.rng
             )
+            self.store.set_masters(by_stage[positions], realm_beings[is_master][owners])
             
-            for other_id in potential_relations:
-                if self.rng.random() < 0.7:  # 70% chance for ally
-                    relationship_strength = 0.3 + (0.7 * self.rng.random())
-                    being.allies[other_id] = relationship_strength
-                    self.beings[other_id].allies[being_id] = relationship_strength
-                else:  # 30% chance for enemy
-                    enmity_level = 0.3 + (0.7 * self.rng.random())
-                    being.enemies[other_id] = enmity_level
-                    self.beings[other_id].enemies[being_id] = enmity_level
+            links = {kind: ([], [], []) for kind in ('allies', 'enemies')}
+            for position, being_id in enumerate(realm_beings):
+                # Create ally and enemy relationships, skipping the being itself
+                others = len(realm_beings) - 1
+                num_relationships = self.rng.integers(1, 6)
+                picks = self.rng.choice(
+                    others,
+                    size=min(num_relationships, others),
+                    replace=False
+                )
+                picks[picks >= position] += 1
+                
+                for other_id in realm_beings[picks]:
+                    if self.rng.random() < 0.7:  # 70% chance for ally
+                        kind = 'allies'
+                    else:  # 30% chance for enemy
+                        kind = 'enemies'
+                    firsts, seconds, weights = links[kind]
+                    firsts.append(being_id)
+                    seconds.append(other_id)
+                    weights.append(0.3 + (0.7 * self.rng.random()))
+                    
+            # Hand the realm's edges to the store in bulk
+            for kind, (firsts, seconds, weights) in links.items():
+                self.store.link_many(kind, firsts, seconds, weights)
+                count(**{kind: len(firsts)})
+            count(disciples=len(positions))
                     
     def _distribute_resources(self) -> None:
         """Distribute resources among beings."""
-        for resource_id, resource in self.resources.items():
-            realm_id = self.resource_locations[resource_id]
-            realm_beings = [
-                b_id for b_id, r_id in self.being_locations.items()
-                if r_id == realm_id
-            ]
-            
-            if not realm_beings:
-                continue
-                
-            # Higher quality resources go to stronger beings
-            if resource.tier.value >= ResourceTier.RARE.value:
-                potential_owners = [
-                    b_id for b_id in realm_beings
-                    if self.beings[b_id].cultivation.stage.value >= 
-                    resource.tier.value
-                ]
-                
-                if potential_owners:
-                    owner_id = self.rng.choice(potential_owners)
-                    owner = self.beings[owner_id]
-                    owner.inventory.artifacts[resource.name] = resource.quality_metrics.base_grade
+        placed = distribute_resources(self.store, self.population_index, self.allocation, self.rng)
+        count(artifacts=placed)
                     
+    @profiled()
     def advance_time(self, years: float = 0.0, days: float = 0.0) -> None:
-        """Advance time in the world and update all entities."""
+        """Advance time in the world and update all entities.
+        
+        Breakthroughs and realm stabilization are event-driven: each being
+        and realm is queued for the time it next becomes eligible, so a
+        tick only visits the ones that are due and short ticks stay cheap.
+        """
         time_delta = timedelta(days=days + years * 365.25)
-        self.current_time += time_delta
+        self.clock.advance(time_delta)
         
         # Update all entities
-        self._update_realms(time_delta)
+        logged = len(self.events)
+        stabilized = self._update_realms(time_delta)
         self._update_beings(time_delta)
         self._update_resources(time_delta)
+        self.statistics.tick(
+            time_delta.days,
+            tick_years(time_delta.days),
+            tribulations=len(self.events) - logged - stabilized,
+            stabilizations=stabilized
+        )
+        self.events.compact(self.clock.now)
         
-    def _update_realms(self, time_delta: timedelta) -> None:
-        """Update all realms based on time passed."""
+    def reschedule(self) -> None:
+        """Re-queue every being and realm after their fields were changed outside advance_time."""
+        self._stabilizations = None
+        self.store.reschedule_breakthroughs()
+        
+    def _update_realms(self, time_delta: timedelta) -> int:
+        """Update all realms based on time passed, returning how many were stabilized."""
         for realm in self.realms.values():
             # Update energy grid
             realm.energy_grid.base_energy_level *= (
@@ -219,54 +388,114 @@ class WorldGenerator:
             
             # Degrade formation
             realm.formation_details.age += time_delta.days / 365.25
+            bump(realm.id)
             
-            # Update stability
-            if realm.needs_stabilization():
-                realm.last_stabilized = self.current_time
-                realm.stability_history.append({
-                    'timestamp': self.current_time,
-                    'stability': realm.calculate_stability(),
-                    'energy_state': realm.energy_grid.stability_index
-                })
+        # Stabilize the realms that are due
+        if self._stabilizations is None:
+            self._stabilizations = EventQueue(dtype=object)
+            self._stabilizations.schedule(list(self.realms), self._stabilization_due(list(self.realms)))
+        due = self._stabilizations.pop_ready(self.clock.micros, self._stabilization_due)
+        samples = []
+        for realm_id in due.tolist():
+            realm = self.realms[realm_id]
+            realm.stability_history = self.events.adopt('stability', realm_id, realm.stability_history)
+            realm.last_stabilized = self.clock.now
+            samples.append((realm.calculate_stability(self.clock), realm.energy_grid.stability_index))
+        self.events.append(
+            'stability',
+            entity_words(due.tolist()),
+            self.clock.now,
+            np.array(samples, dtype=np.float64).reshape(len(samples), 2)
+        )
+        self._stabilizations.schedule(due, self._stabilization_due(due))
+        return len(due)
+                
+    def _stabilization_due(self, realm_ids: List[UUID]) -> np.ndarray:
+        """Return when each realm next needs stabilization, in clock microseconds.
+        
+        Ticks only raise a realm's energy level and age, which never lowers
+        its stability, so a realm that needs nothing now needs nothing
+        until 30 days after it was last stabilized.
+        """
+        return np.array([
+            self.clock.micros if realm.needs_stabilization(self.clock)
+            else to_micros(realm.last_stabilized) + 30 * MICROS_PER_DAY
+            for realm in (self.realms[realm_id] for realm_id in realm_ids)
+        ], dtype=np.int64)
                 
     def _update_beings(self, time_delta: timedelta) -> None:
         """Update all beings based on time passed."""
-        for being in self.beings.values():
-            # Age the being
-            being.age += time_delta.days / 365.25
-            
-            # Check for breakthroughs
-            if being.can_breakthrough():
-                tribulation = being.generate_tribulation()
-                being.tribulation_history.append(tribulation)
-                being.last_breakthrough = self.current_time
-                
-            # Update karma
-            being.update_karma('time_passage', 0.001 * time_delta.days)
+        self.store.advance_beings(time_delta, self.clock)
+        bump_all('being')
             
     def _update_resources(self, time_delta: timedelta) -> None:
         """Update all resources based on time passed."""
-        for resource in self.resources.values():
-            # Age the resource
-            resource.formation_attributes.current_age += time_delta.days / 365.25
-            
-            # Apply natural degradation
-            resource.degrade(time_delta.days / 365.25)
+        self.store.advance_resources(time_delta)
+        bump_all('resource')
             
     def get_realm_beings(self, realm_id: UUID) -> List[Being]:
         """Get all beings in a specific realm."""
         return [
-            being for being_id, being in self.beings.items()
-            if self.being_locations[being_id] == realm_id
+            self.store.being(handle)
+            for handle in self.population_index.beings_in(realm_id)
         ]
         
     def get_realm_resources(self, realm_id: UUID) -> List[Resource]:
         """Get all resources in a specific realm."""
         return [
-            resource for resource_id, resource in self.resources.items()
-            if self.resource_locations[resource_id] == realm_id
+            self.store.resource(handle)
+            for handle in self.population_index.resources_in(realm_id)
         ]
         
+    def combat_powers(self, realm_id: Optional[UUID] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (being handles, combat powers) for one realm or, by default, the whole world."""
+        realm_ids = list(self.realms) if realm_id is None else [realm_id]
+        handles = [self.population_index.beings_in(realm) for realm in realm_ids]
+        powers = [
+            self._realm_combat_powers(realm, members)
+            for realm, members in zip(realm_ids, handles)
+        ]
+        if len(handles) == 1:
+            return handles[0], powers[0]
+        return np.concatenate(handles), np.concatenate(powers)
+        
+    def _realm_combat_powers(self, realm_id: UUID, handles: np.ndarray) -> np.ndarray:
+        """Return a realm's combat powers, reusing the last result while nothing has changed.
+
+        The index replaces a realm's handle array whenever its membership
+        changes, and every entity mutation bumps the metric cache.
+        """
+        changes = metric_cache().changes
+        cached = self._power_columns.get(realm_id)
+        if cached is not None and cached[0] is handles and cached[1] == changes:
+            return cached[2]
+        powers = self.store.combat_powers(handles)
+        self._power_columns[realm_id] = (handles, changes, powers)
+        return powers
+        
+    def top_beings(self, k: int = 10, realm_id: Optional[UUID] = None) -> List[Tuple[Being, float]]:
+        """Return the k strongest beings with their combat power, strongest first."""
+        handles, powers = self.combat_powers(realm_id)
+        return [(self.store.being(handles[i]), float(powers[i])) for i in top_k(powers, k).tolist()]
+        
+    def realm_leaderboards(self, k: int = 10) -> Dict[UUID, List[Tuple[Being, float]]]:
+        """Return the k strongest beings of every realm."""
+        return {realm_id: self.top_beings(k, realm_id) for realm_id in self.realms}
+        
+    def combat_power_bands(
+        self,
+        percentiles: Tuple[float, ...] = (50, 90, 99, 99.9),
+        realm_id: Optional[UUID] = None
+    ) -> Dict[float, float]:
+        """Return the combat power at each percentile of one realm or the whole world."""
+        return percentile_bands(self.combat_powers(realm_id)[1], percentiles)
+        
+    def stage_histogram(self, realm_id: Optional[UUID] = None) -> Dict[str, int]:
+        """Count the beings at each cultivation stage in one realm or the whole world."""
+        realm_ids = list(self.realms) if realm_id is None else [realm_id]
+        stages = [self.population_index.being_stages_in(realm) for realm in realm_ids]
+        return stage_histogram(np.concatenate(stages) if stages else np.empty(0, dtype=np.int16))
+        
     def get_being_realm(self, being_id: UUID) -> Optional[Realm]:
         """Get the realm a being is currently in."""
         realm_id = self.being_locations.get(being_id)
@@ -3,12 +3,16 @@ Core model for beings in the LITRPG world.
 Represents individual entities with their cultivation paths and attributes.
 """
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 from pydantic import BaseModel, Field
 from uuid import UUID, uuid4
 
+from .metrics import bump, cached_metric
+from .shared import History, copy_on_write
+from ..clock import WorldClock, clock_time, model_time
 from ..constants import CultivationStage, RealmTier
 
+@copy_on_write('traits', 'special_abilities')
 class Bloodline(BaseModel):
     """Represents a being's bloodline inheritance and traits."""
     name: str
@@ -28,6 +32,7 @@ class CultivationBase(BaseModel):
     comprehension_rate: float = Field(ge=0.0, le=1.0)
     dao_insights: Dict[str, float] = Field(default_factory=dict)
 
+@copy_on_write('cultivation_affinity', 'dao_marks')
 class Soul(BaseModel):
     """Represents a being's soul attributes and cultivation."""
     strength: float = Field(ge=0.0)
@@ -37,6 +42,7 @@ class Soul(BaseModel):
     cultivation_affinity: List[str]
     dao_marks: Set[str] = Field(default_factory=set)
 
+@copy_on_write('special_moves')
 class Combat(BaseModel):
     """Represents a being's combat capabilities."""
     base_power: float = Field(ge=0.0)
@@ -45,6 +51,7 @@ class Combat(BaseModel):
     weapon_proficiency: Dict[str, float] = Field(default_factory=dict)
     special_moves: Set[str] = Field(default_factory=set)
 
+@copy_on_write('artifacts', 'resources', 'currency', 'equipment_slots')
 class Inventory(BaseModel):
     """Represents a being's possessions and equipment."""
     storage_rings: int = Field(ge=0)
@@ -53,6 +60,7 @@ class Inventory(BaseModel):
     currency: Dict[str, int]     # type: amount
     equipment_slots: Dict[str, Optional[str]]  # slot: item_name
 
+@copy_on_write('connections', 'destiny_threads')
 class Karma(BaseModel):
     """Represents a being's karmic relationships and destiny."""
     fate_value: float
@@ -62,6 +70,7 @@ class Karma(BaseModel):
     fortune: float
     tribulation_counter: int = Field(ge=0)
 
+@copy_on_write('titles', 'accomplishments', 'hidden_achievements')
 class Achievement(BaseModel):
     """Represents a being's accomplishments and titles."""
     titles: Set[str] = Field(default_factory=set)
@@ -69,13 +78,14 @@ class Achievement(BaseModel):
     accomplishments: List[str] = Field(default_factory=list)
     hidden_achievements: Set[str] = Field(default_factory=set)
 
+@copy_on_write('tribulation_history', 'cultivation_insights', 'battle_records', 'hidden_attributes')
 class Being(BaseModel):
     """Main model representing a cultivator or any sentient being."""
     id: UUID = Field(default_factory=uuid4)
     name: str
     race: str
-    age: int = Field(ge=0)
-    creation_date: datetime = Field(default_factory=datetime.now)
+    age: float = Field(ge=0)  # in years; fractional once time advances
+    creation_date: datetime = Field(default_factory=model_time)
     
     # Core attributes
     bloodline: Bloodline
@@ -87,27 +97,28 @@ class Being(BaseModel):
     achievements: Achievement
     
     # Tracking fields
-    last_breakthrough: Optional[datetime]
-    tribulation_history: List[Dict[str, any]]
-    cultivation_insights: List[str]
-    battle_records: List[Dict[str, any]]
+    last_breakthrough: Optional[datetime] = None
+    tribulation_history: History = Field(default_factory=list)  # list, or a view over the world event log
+    cultivation_insights: List[str] = Field(default_factory=list)
+    battle_records: List[Dict[str, Any]] = Field(default_factory=list)
     
     # Social connections
-    sect_id: Optional[UUID]
-    master_id: Optional[UUID]
+    sect_id: Optional[UUID] = None
+    master_id: Optional[UUID] = None
     disciples: List[UUID] = Field(default_factory=list)
     allies: Dict[UUID, float] = Field(default_factory=dict)  # being_id: relationship_strength
     enemies: Dict[UUID, float] = Field(default_factory=dict)  # being_id: enmity_level
     
     # Data quality tracking
     measurement_accuracy: float = Field(ge=0.0, le=1.0)
-    last_updated: datetime = Field(default_factory=datetime.now)
+    last_updated: datetime = Field(default_factory=model_time)
     data_reliability: float = Field(ge=0.0, le=1.0)
     hidden_attributes: Set[str] = Field(default_factory=set)
 
     class Config:
         arbitrary_types_allowed = True
 
+    @cached_metric('being')
     def calculate_combat_power(self) -> float:
         """Calculate the being's total combat power."""
         base = self.combat.base_power
@@ -117,12 +128,12 @@ class Being(BaseModel):
         
         return base * realm_mult * (1 + technique_bonus) * soul_factor
 
-    def can_breakthrough(self) -> bool:
-        """Check if the being can attempt breakthrough to next stage."""
+    def can_breakthrough(self, clock: Optional[WorldClock] = None) -> bool:
+        """Check if the being can attempt breakthrough to next stage at the clock's time."""
         if not self.last_breakthrough:
             return True
             
-        time_since_last = datetime.now() - self.last_breakthrough
+        time_since_last = clock_time(clock) - self.last_breakthrough
         required_insights = len(self.cultivation_insights)
         foundation_check = self.cultivation.foundation_quality > self.cultivation.bottleneck_threshold
         
@@ -130,8 +141,8 @@ class Being(BaseModel):
                 required_insights >= 3 and 
                 foundation_check)
 
-    def generate_tribulation(self) -> Dict[str, any]:
-        """Generate a tribulation event based on cultivation stage."""
+    def generate_tribulation(self, clock: Optional[WorldClock] = None) -> Dict[str, Any]:
+        """Generate a tribulation event based on cultivation stage, stamped with the clock's time."""
         power_level = self.calculate_combat_power()
         stage_factor = self.cultivation.stage.value
         karma_influence = self.karma.fate_value
@@ -140,7 +151,7 @@ class Being(BaseModel):
             'power_level': power_level,
             'difficulty': stage_factor * (1 + abs(karma_influence)),
             'type': f"{self.cultivation.stage.name}_TRIBULATION",
-            'timestamp': datetime.now()
+            'timestamp': clock_time(clock)
         }
 
     def update_karma(self, event: str, magnitude: float) -> None:
@@ -149,4 +160,5 @@ class Being(BaseModel):
         self.karma.fortune = max(-1, min(1, self.karma.fortune + magnitude * 0.1))
         
         if abs(self.karma.fate_value) > 10:
-            self.karma.tribulation_counter += 1
\ No newline at end of file
+            self.karma.tribulation_counter += 1
+        bump(self.id)
\ No newline at end of file
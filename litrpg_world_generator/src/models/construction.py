@@ -0,0 +1,104 @@
+"""
+Construction modes for the world models.
+Lets trusted generators skip per-object pydantic validation and check whole columns of values at once instead.
+"""
+import copy
+import numpy as np
+from typing import Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar
+from pydantic import BaseModel
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+
+# When set, every generated model goes through full pydantic validation
+_strict = False
+
+# model -> (field name, zero-argument default) for every optional field
+_defaults: Dict[type, List[Tuple[str, Callable[[], object]]]] = {}
+
+# model -> names of the fields that have no default
+_required: Dict[type, Set[str]] = {}
+
+def set_strict(enabled: bool) -> None:
+    """Switch between full per-object validation and the trusted fast path."""
+    global _strict
+    _strict = enabled
+
+def is_strict() -> bool:
+    """Return whether generated models are fully validated."""
+    return _strict
+
+def build(model: Type[ModelT], **fields) -> ModelT:
+    """Create a generated model, validating it only in strict mode.
+
+    Otherwise the instance is assembled the way model_construct does it,
+    taking the fields as given and filling in defaults for missing ones;
+    a missing required field still raises ValueError. model_construct
+    itself inspects every default factory's signature on each call, which
+    makes it slower than validating.
+    """
+    if _strict:
+        return model(**fields)
+    missing = _required_fields(model).difference(fields)
+    if missing:
+        raise ValueError(f"{model.__name__} is missing required field(s): {', '.join(sorted(missing))}")
+    values = {name: default() for name, default in _field_defaults(model) if name not in fields}
+    values.update(fields)
+    instance = model.__new__(model)
+    object.__setattr__(instance, '__dict__', values)
+    object.__setattr__(instance, '__pydantic_fields_set__', set(fields))
+    object.__setattr__(instance, '__pydantic_extra__', None)
+    object.__setattr__(instance, '__pydantic_private__', None)
+    return instance
+
+def _field_defaults(model: Type[BaseModel]) -> List[Tuple[str, Callable[[], object]]]:
+    """Return the cached default of every optional field of a model."""
+    if model not in _defaults:
+        _defaults[model] = [
+            (name, info.default_factory or (lambda value=info.default: copy.deepcopy(value)))
+            for name, info in model.model_fields.items()
+            if not info.is_required()
+        ]
+    return _defaults[model]
+
+def _required_fields(model: Type[BaseModel]) -> Set[str]:
+    """Return the cached names of a model's fields that have no default."""
+    if model not in _required:
+        _required[model] = {name for name, info in model.model_fields.items() if info.is_required()}
+    return _required[model]
+
+def field_bounds(model: Type[BaseModel], name: str) -> Tuple[Optional[float], Optional[float]]:
+    """Return the (ge, le) bounds declared on a model field."""
+    ge = le = None
+    for constraint in model.model_fields[name].metadata:
+        ge = getattr(constraint, 'ge', ge)
+        le = getattr(constraint, 'le', le)
+    return ge, le
+
+def check_columns(
+    columns: Dict[str, np.ndarray],
+    fields: Dict[str, Tuple[Type[BaseModel], str]]
+) -> None:
+    """Check columns against the bounds of the model fields they fill.
+
+    `fields` maps a column name to its (model, field name); columns that
+    are not present are skipped. Raises ValueError for the first column
+    holding a value the field would reject.
+    """
+    for column, (model, name) in fields.items():
+        if column not in columns:
+            continue
+        values = columns[column]
+        ge, le = field_bounds(model, name)
+        bad = np.zeros(values.shape, dtype=bool)
+        if np.issubdtype(values.dtype, np.floating):
+            bad |= np.isnan(values)
+        if ge is not None:
+            bad |= values < ge
+        if le is not None:
+            bad |= values > le
+        if bad.any():
+            row = int(np.argmax(bad))
+            raise ValueError(
+                f"{int(bad.sum())} value(s) in column '{column}' are outside the bounds "
+                f"of {model.__name__}.{name}; first at row {row}: {values[row]}"
+            )
@@ -0,0 +1,146 @@
+"""
+Cache for derived entity metrics.
+Memoizes values such as combat power, realm stability and resource value per entity instance, with LRU eviction, optional expiry and hit/miss counts.
+"""
+from collections import OrderedDict
+from functools import wraps
+import time
+import weakref
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from ..clock import WorldClock
+
+class MetricCache:
+    """Size-bounded cache of derived metrics keyed on (metric, entity id).
+
+    Every entry is bound to the model instance it was computed for, so
+    worlds generated from the same seed, whose entities share ids, never
+    read each other's values, and remembers its kind's epoch at the time:
+    `bump` drops one entity's entries after a mutation and `bump_all`
+    invalidates a whole kind at once (a time step that touches every
+    being), so a stale value is never returned. Entries may also expire
+    after `ttl` seconds for metrics that read the wall clock.
+    """
+
+    def __init__(self, max_size: int = 100_000, ttl: Optional[float] = None):
+        """Initialize an empty cache holding at most `max_size` values."""
+        if max_size < 0:
+            raise ValueError(f"Cache size must be non-negative, got {max_size}")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: 'OrderedDict[Tuple[str, Hashable], tuple]' = OrderedDict()
+        self._epochs: Dict[str, int] = {}
+        self._metrics: Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Bumps of any kind so far; population-wide results compare it to detect changes
+        self.changes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def bump(self, entity_id: Hashable) -> None:
+        """Invalidate every cached metric of one entity."""
+        for metric in self._metrics:
+            self._entries.pop((metric, entity_id), None)
+        self.changes += 1
+
+    def bump_all(self, kind: str) -> None:
+        """Invalidate every cached metric of every entity of a kind."""
+        self._epochs[kind] = self._epochs.get(kind, 0) + 1
+        self.changes += 1
+
+    def get(
+        self,
+        kind: str,
+        metric: str,
+        entity: Any,
+        compute: Callable[[], float],
+        ttl: Optional[float] = None,
+        at: Optional[int] = None
+    ) -> float:
+        """Return a cached metric, calling `compute` when it is missing, stale or expired.
+
+        The entry is keyed on `entity.id` and only counts for `entity`
+        itself. `at` is the simulated instant a time-dependent metric was
+        computed for; a value cached for another instant counts as stale.
+        """
+        key = (metric, entity.id)
+        version = (self._epochs.get(kind, 0), at)
+        ttl = self.ttl if ttl is None else ttl
+        entry = self._entries.get(key)
+        if (entry is not None and entry[0]() is entity and entry[1] == version
+                and (ttl is None or time.monotonic() < entry[3])):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+        self.misses += 1
+        value = compute()
+        if self.max_size:
+            expires = time.monotonic() + ttl if ttl is not None else None
+            self._metrics.add(metric)
+            self._entries[key] = (weakref.ref(entity), version, value, expires)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached value and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, object]:
+        """Return hit/miss counts and the current size."""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else None
+        }
+
+# The process-wide cache used by the model methods
+_cache = MetricCache()
+
+def metric_cache() -> MetricCache:
+    """Return the process-wide metric cache."""
+    return _cache
+
+def set_metric_cache(cache: MetricCache) -> MetricCache:
+    """Replace the process-wide metric cache and return the previous one."""
+    global _cache
+    previous, _cache = _cache, cache
+    return previous
+
+def bump(entity_id: Hashable) -> None:
+    """Invalidate the cached metrics of one entity after it changed."""
+    _cache.bump(entity_id)
+
+def bump_all(kind: str) -> None:
+    """Invalidate the cached metrics of every entity of a kind."""
+    _cache.bump_all(kind)
+
+def cached_metric(kind: str, ttl: Optional[float] = None) -> Callable[[Callable], Callable]:
+    """Decorate a model method so its result is cached per entity instance.
+
+    The metric is named after the method and keyed on the instance's `id`.
+    Methods that read the time take an optional WorldClock; their results
+    are then cached per simulated instant, while `ttl` bounds how long a
+    wall-clock result is reused. Code that changes the fields a metric
+    reads must call `bump` (or `bump_all` for the whole kind) afterwards.
+    """
+    def decorate(method: Callable) -> Callable:
+        metric = method.__name__
+
+        @wraps(method)
+        def wrapper(self, clock: Optional[WorldClock] = None):
+            if clock is None:
+                return _cache.get(kind, metric, self, lambda: method(self), ttl)
+            return _cache.get(kind, metric, self, lambda: method(self, clock), at=clock.micros)
+        return wrapper
+    return decorate
@@ -3,10 +3,13 @@ Model for realms and planes of existence in the LITRPG world.
 Defines the structure and properties of different reality layers.
 """
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 from pydantic import BaseModel, Field
 from uuid import UUID, uuid4
 
+from .metrics import bump, cached_metric
+from .shared import History
+from ..clock import WorldClock, clock_time, model_time
 from ..constants import RealmTier, WORLD_LAWS
 
 class NaturalLaws(BaseModel):
@@ -25,16 +28,16 @@ class SpatialAttributes(BaseModel):
     size: float  # in cubic kilometers
     boundary_stability: float = Field(ge=0.0, le=1.0)
     connection_points: Dict[str, float]  # location: stability
-    spatial_anchors: List[Dict[str, any]]
+    spatial_anchors: List[Dict[str, Any]]
     fold_density: float = Field(ge=0.0)  # pocket space density
-    distortion_zones: List[Dict[str, any]]
+    distortion_zones: List[Dict[str, Any]]
 
 class EnergyGrid(BaseModel):
     """Represents the energy distribution and flow in the realm."""
     base_energy_level: float = Field(ge=0.0)
     energy_types: Dict[str, float]  # type: concentration
-    ley_lines: List[Dict[str, any]]
-    nodes: List[Dict[str, any]]
+    ley_lines: List[Dict[str, Any]]
+    nodes: List[Dict[str, Any]]
     flow_patterns: Dict[str, List[float]]
     regeneration_rate: float = Field(ge=0.0)
     stability_index: float = Field(ge=0.0, le=1.0)
@@ -42,30 +45,30 @@ class EnergyGrid(BaseModel):
 class PopulationMetrics(BaseModel):
     """Tracks population and resource distribution."""
     total_population: int = Field(ge=0)
-    species_distribution: Dict[str, int]
+    species_distribution: Dict[str, float]  # species: share of the population
     cultivation_levels: Dict[str, int]
     resource_density: Dict[str, float]
-    civilization_centers: List[Dict[str, any]]
+    civilization_centers: List[Dict[str, Any]]
     power_distribution: Dict[str, float]
     karmic_density: float = Field(ge=0.0)
 
 class FormationDetails(BaseModel):
     """Details about the realm's formation and maintenance."""
-    age: int = Field(ge=0)  # in years
+    age: float = Field(ge=0)  # in years; fractional once time advances
     stability_cycle: int  # in years
     maintenance_cost: float = Field(ge=0.0)
     core_elements: List[str]
-    supporting_formations: List[Dict[str, any]]
-    weakness_points: List[Dict[str, any]]
+    supporting_formations: List[Dict[str, Any]]
+    weakness_points: List[Dict[str, Any]]
     repair_mechanisms: Dict[str, float]
 
 class EnvironmentalEffects(BaseModel):
     """Tracks environmental conditions and effects."""
     weather_patterns: Dict[str, float]
     elemental_phenomena: List[str]
-    natural_hazards: List[Dict[str, any]]
-    beneficial_regions: List[Dict[str, any]]
-    seasonal_effects: Dict[str, Dict[str, any]]
+    natural_hazards: List[Dict[str, Any]]
+    beneficial_regions: List[Dict[str, Any]]
+    seasonal_effects: Dict[str, Dict[str, Any]]
     background_radiation: float = Field(ge=0.0)
     magical_interference: float = Field(ge=0.0)
 
@@ -85,10 +88,10 @@ class Realm(BaseModel):
     environmental_effects: EnvironmentalEffects
     
     # Tracking fields
-    creation_date: datetime = Field(default_factory=datetime.now)
-    last_stabilized: datetime = Field(default_factory=datetime.now)
-    stability_history: List[Dict[str, any]]
-    major_events: List[Dict[str, any]]
+    creation_date: datetime = Field(default_factory=model_time)
+    last_stabilized: datetime = Field(default_factory=model_time)
+    stability_history: History = Field(default_factory=list)  # list, or a view over the world event log
+    major_events: List[Dict[str, Any]] = Field(default_factory=list)
     
     # Connections and relationships
     parent_realm: Optional[UUID]
@@ -97,34 +100,36 @@ class Realm(BaseModel):
     
     # Access and control
     controlling_factions: Dict[str, float]  # faction_name: influence_level
-    access_restrictions: List[Dict[str, any]]
+    access_restrictions: List[Dict[str, Any]]
     security_measures: List[str]
     
     # Data quality tracking
     measurement_accuracy: float = Field(ge=0.0, le=1.0)
-    last_surveyed: datetime = Field(default_factory=datetime.now)
+    last_surveyed: datetime = Field(default_factory=model_time)
     data_reliability: float = Field(ge=0.0, le=1.0)
     unmapped_regions: Set[str] = Field(default_factory=set)
 
     class Config:
         arbitrary_types_allowed = True
 
-    def calculate_stability(self) -> float:
-        """Calculate the overall stability of the realm."""
+    # Without a clock stability reads the wall time, so those results also expire
+    @cached_metric('realm', ttl=60.0)
+    def calculate_stability(self, clock: Optional[WorldClock] = None) -> float:
+        """Calculate the overall stability of the realm at the clock's time."""
         base_stability = self.spatial_attributes.boundary_stability
         energy_factor = self.energy_grid.stability_index
-        formation_age = (datetime.now() - self.creation_date).days / 365.25
+        formation_age = (clock_time(clock) - self.creation_date).days / 365.25
         age_factor = min(1.0, formation_age / self.formation_details.stability_cycle)
         
         return base_stability * energy_factor * (0.5 + 0.5 * age_factor)
 
-    def needs_stabilization(self) -> bool:
-        """Check if the realm needs stabilization maintenance."""
+    def needs_stabilization(self, clock: Optional[WorldClock] = None) -> bool:
+        """Check if the realm needs stabilization maintenance at the clock's time."""
         if not self.last_stabilized:
             return True
             
-        time_since_last = datetime.now() - self.last_stabilized
-        current_stability = self.calculate_stability()
+        time_since_last = clock_time(clock) - self.last_stabilized
+        current_stability = self.calculate_stability(clock)
         energy_state = self.energy_grid.base_energy_level / self.tier.value
         
         return (time_since_last.days >= 30 or 
@@ -157,4 +162,5 @@ class Realm(BaseModel):
         # Update stability based on energy levels
         total_energy = sum(self.energy_grid.energy_types.values())
         optimal_energy = self.tier.value * 1000 * len(self.energy_grid.energy_types)
-        self.energy_grid.stability_index = min(1.0, total_energy / optimal_energy)
\ No newline at end of file
+        self.energy_grid.stability_index = min(1.0, total_energy / optimal_energy)
+        bump(self.id)
\ No newline at end of file
@@ -3,10 +3,12 @@ Model for resources, treasures, and artifacts in the LITRPG world.
 Handles everything from basic cultivation materials to divine artifacts.
 """
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 from pydantic import BaseModel, Field
 from uuid import UUID, uuid4
 
+from .metrics import bump, cached_metric
+from ..clock import WorldClock, clock_time, model_time
 from ..constants import ResourceTier, RealmTier
 
 class EnergyProfile(BaseModel):
@@ -23,7 +25,7 @@ class FormationAttributes(BaseModel):
     """Tracks the formation and aging of resources."""
     formation_date: datetime
     maturity_age: int = Field(ge=0)  # in years
-    current_age: int = Field(ge=0)
+    current_age: float = Field(ge=0)  # in years; fractional once time advances
     environment_type: str
     natural_born: bool
     geological_pressure: float = Field(ge=0.0)
@@ -85,9 +87,9 @@ class Resource(BaseModel):
     usage_metrics: UsageMetrics
     
     # Tracking fields
-    discovery_date: datetime = Field(default_factory=datetime.now)
-    last_refined: Optional[datetime]
-    refinement_history: List[Dict[str, any]]
+    discovery_date: datetime = Field(default_factory=model_time)
+    last_refined: Optional[datetime] = None
+    refinement_history: List[Dict[str, Any]] = Field(default_factory=list)
     known_locations: Set[str] = Field(default_factory=set)
     
     # Market and value information
@@ -98,13 +100,14 @@ class Resource(BaseModel):
     
     # Data quality tracking
     measurement_accuracy: float = Field(ge=0.0, le=1.0)
-    last_assessed: datetime = Field(default_factory=datetime.now)
+    last_assessed: datetime = Field(default_factory=model_time)
     data_reliability: float = Field(ge=0.0, le=1.0)
     hidden_properties: Set[str] = Field(default_factory=set)
 
     class Config:
         arbitrary_types_allowed = True
 
+    @cached_metric('resource')
     def calculate_true_value(self) -> float:
         """Calculate the true value of the resource based on all attributes."""
         base_value = self.tier.value * self.quality_metrics.base_grade
@@ -114,12 +117,12 @@ class Resource(BaseModel):
         
         return base_value * age_factor * energy_factor * (1 + self.rarity_index)
 
-    def can_be_refined(self) -> bool:
-        """Check if the resource can undergo further refinement."""
+    def can_be_refined(self, clock: Optional[WorldClock] = None) -> bool:
+        """Check if the resource can undergo further refinement at the clock's time."""
         if not self.last_refined:
             return True
             
-        time_since_refinement = datetime.now() - self.last_refined
+        time_since_refinement = clock_time(clock) - self.last_refined
         stability_check = self.quality_metrics.stability_rating > 0.3
         refinement_limit = self.quality_metrics.refinement_level < 9
         
@@ -152,4 +155,5 @@ class Resource(BaseModel):
             self.usage_metrics.remaining_uses = max(
                 0, 
                 self.usage_metrics.remaining_uses - int(degradation * 10)
-            )
\ No newline at end of file
+            )
+        bump(self.id)
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""
+Shared immutable values for generated models.
+Read-only containers that many models reference at once, model fields that swap them for a private copy on first use, plus string interning for category values.
+"""
+import copy
+import sys
+from typing import Annotated, Any, Callable, Dict, List
+
+from pydantic import PlainSerializer
+
+def _read_only(self, *args, **kwargs):
+    """Reject in-place changes to a shared container."""
+    raise TypeError(
+        f"{type(self).__name__} is shared between models; "
+        f"replace it with thaw(value) before changing it"
+    )
+
+class FrozenDict(dict):
+    """A dict that refuses in-place changes; copies are plain dicts."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo) -> dict:
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self):
+        return 'EMPTY_DICT' if self is EMPTY_DICT else (type(self), (dict(self),))
+
+class FrozenList(list):
+    """A list that refuses in-place changes; copies are plain lists."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo) -> list:
+        return copy.deepcopy(list(self), memo)
+
+    def __reduce__(self):
+        return 'EMPTY_LIST' if self is EMPTY_LIST else (type(self), (list(self),))
+
+class FrozenSet(set):
+    """A set that refuses in-place changes; copies are plain sets.
+
+    Unlike frozenset it is still a set, so models typed Set[str] serialize
+    it without warnings.
+    """
+
+    __slots__ = ()
+    __ior__ = __iand__ = __isub__ = __ixor__ = _read_only
+    add = clear = discard = pop = remove = update = _read_only
+    difference_update = intersection_update = symmetric_difference_update = _read_only
+
+    def __copy__(self) -> set:
+        return set(self)
+
+    def __deepcopy__(self, memo) -> set:
+        return copy.deepcopy(set(self), memo)
+
+    def __reduce__(self):
+        return 'EMPTY_SET' if self is EMPTY_SET else (type(self), (set(self),))
+
+_FROZEN = {FrozenDict: dict, FrozenList: list, FrozenSet: set}
+
+# Shared empty containers for fields most models never fill; they unpickle
+# as themselves, so identity checks against them survive a round trip
+EMPTY_DICT = FrozenDict()
+EMPTY_LIST = FrozenList()
+EMPTY_SET = FrozenSet()
+
+# An event history field: a list, or an append-only view over the world event
+# log (src.world.events.EventHistory); either way it serializes as a list
+History = Annotated[List[Dict[str, Any]], PlainSerializer(list)]
+
+def thaw(value):
+    """Return `value` itself if it may be changed, else a private mutable copy.
+
+    Model fields declared with `copy_on_write` do this on first use; code
+    holding a shared container some other way assigns the result back
+    before changing it.
+    """
+    plain = _FROZEN.get(type(value))
+    return plain(value) if plain is not None else value
+
+def peek(model, name: str):
+    """Return a model field as stored, without thawing it, for code that only reads it."""
+    return model.__dict__[name]
+
+class CopyOnWrite:
+    """Model field that hands each model its own copy of a shared container.
+
+    The first read through the attribute replaces a frozen value in the
+    model's __dict__ with thaw(value), so `being.cultivation_insights.append`
+    changes that being alone. Serialization reads __dict__ directly and
+    keeps the sharing; bulk readers use `peek` for the same reason.
+    """
+
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            raise AttributeError(self.name)
+        values = instance.__dict__
+        try:
+            value = values[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+        plain = _FROZEN.get(type(value))
+        if plain is not None:
+            value = values[self.name] = plain(value)
+        return value
+
+    def __set__(self, instance, value) -> None:
+        instance.__dict__[self.name] = value
+
+def copy_on_write(*names: str) -> Callable[[type], type]:
+    """Decorate a model class so the named fields thaw shared containers on first use."""
+    def install(model: type) -> type:
+        for name in names:
+            setattr(model, name, CopyOnWrite(name))
+        return model
+    return install
+
+def intern_str(value) -> str:
+    """Return the single shared copy of a category string (also unwraps numpy strings)."""
+    return sys.intern(str(value))
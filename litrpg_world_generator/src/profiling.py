@@ -0,0 +1,200 @@
+"""
+Per-phase instrumentation for world generation runs.
+Records wall time, entity counts, random draws and peak memory for each phase and writes them as a JSON report.
+"""
+from contextlib import contextmanager
+from functools import wraps
+import json
+import sys
+import time
+import numpy as np
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+try:
+    import resource
+except ImportError:  # Windows has no getrusage
+    resource = None
+
+# PCG64 advances its 128-bit state as state * _PCG_MULT + inc, once per 64-bit output
+_PCG_MULT = 0x2360ed051fc65da44385df649fccf645
+_PCG_MASK = (1 << 128) - 1
+
+# The active profiler; None keeps every hook a no-op
+_profiler: Optional['Profiler'] = None
+
+def _pcg_distance(start: int, end: int, inc: int) -> int:
+    """Return how many steps the PCG64 LCG takes from `start` to `end`."""
+    mult, bit, distance = _PCG_MULT, 1, 0
+    while start != end:
+        if start & bit != end & bit:
+            start = (start * mult + inc) & _PCG_MASK
+            distance |= bit
+        bit <<= 1
+        inc = (mult + 1) * inc & _PCG_MASK
+        mult = mult * mult & _PCG_MASK
+    return distance
+
+def _pcg_state(rng: np.random.Generator) -> Optional[dict]:
+    """Return a generator's PCG64 state, or None for other bit generators."""
+    state = rng.bit_generator.state
+    return state['state'] if state['bit_generator'] == 'PCG64' else None
+
+def peak_rss_mb() -> Optional[float]:
+    """Return the peak resident set size of this process and its children in MiB."""
+    if resource is None:
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    )
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return peak / (2 ** 20 if sys.platform == 'darwin' else 2 ** 10)
+
+class _Phase:
+    """Totals for every run of one phase path."""
+
+    __slots__ = ('calls', 'seconds', 'draws', 'counts', 'peak_rss_mb')
+
+    def __init__(self):
+        """Initialize empty totals."""
+        self.calls = 0
+        self.seconds = 0.0
+        self.draws = 0
+        self.counts: Dict[str, int] = {}
+        self.peak_rss_mb: Optional[float] = None
+
+class Profiler:
+    """Collects phase timings for one run.
+
+    Phases nest; each is reported under its slash-separated path and runs
+    of the same path are summed. Random draws are counted in 64-bit words
+    taken from the PCG64 generators registered with `track`.
+    """
+
+    def __init__(self):
+        """Initialize an empty profile starting now."""
+        self.started = time.perf_counter()
+        self.phases: Dict[str, _Phase] = {}
+        self._stack: List[str] = []
+        self._generators: List[tuple] = []
+
+    def track(self, rng: np.random.Generator) -> None:
+        """Count the draws a generator makes from now on."""
+        state = _pcg_state(rng)
+        if state is not None:
+            self._generators.append((rng, state['state'], state['inc']))
+
+    def draws(self, rng: Optional[np.random.Generator] = None) -> int:
+        """Return the words drawn from `rng`, or from every tracked generator, since tracking began."""
+        generators = self._generators
+        if rng is not None:
+            generators = [entry for entry in generators if entry[0] is rng]
+        return sum(
+            _pcg_distance(start, _pcg_state(generator)['state'], inc)
+            for generator, start, inc in generators
+        )
+
+    @contextmanager
+    def phase(self, name: str, rng: Optional[np.random.Generator] = None) -> Iterator[_Phase]:
+        """Time a phase, counting draws from `rng` only when one is given."""
+        self._stack.append(name)
+        path = '/'.join(self._stack)
+        totals = self.phases.setdefault(path, _Phase())
+        draws = self.draws(rng)
+        start = time.perf_counter()
+        try:
+            yield totals
+        finally:
+            totals.seconds += time.perf_counter() - start
+            totals.draws += self.draws(rng) - draws
+            totals.calls += 1
+            totals.peak_rss_mb = peak_rss_mb()
+            self._stack.pop()
+
+    def count(self, **counts: int) -> None:
+        """Add entity counts to the innermost running phase."""
+        if self._stack:
+            totals = self.phases['/'.join(self._stack)].counts
+            for name, value in counts.items():
+                totals[name] = totals.get(name, 0) + int(value)
+
+    def report(self, **extra: object) -> dict:
+        """Return the profile, plus any `extra` sections, as JSON-serializable data."""
+        return {
+            'argv': sys.argv,
+            'total_seconds': time.perf_counter() - self.started,
+            'peak_rss_mb': peak_rss_mb(),
+            'phases': [
+                {
+                    'name': path,
+                    'calls': totals.calls,
+                    'seconds': totals.seconds,
+                    'draws': totals.draws,
+                    'counts': totals.counts,
+                    'peak_rss_mb': totals.peak_rss_mb
+                }
+                for path, totals in self.phases.items()
+            ],
+            **extra
+        }
+
+    def write(self, path: Union[str, Path], **extra: object) -> None:
+        """Write the report, plus any `extra` sections, as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.report(**extra), f, indent=2)
+
+def enable() -> Profiler:
+    """Start profiling this process and return the new profiler."""
+    global _profiler
+    _profiler = Profiler()
+    return _profiler
+
+def disable() -> Optional[Profiler]:
+    """Stop profiling and return the profiler that was active."""
+    global _profiler
+    profiler, _profiler = _profiler, None
+    return profiler
+
+def active() -> Optional[Profiler]:
+    """Return the active profiler, if any."""
+    return _profiler
+
+def track(rng: np.random.Generator) -> None:
+    """Count a generator's draws when profiling is on."""
+    if _profiler is not None:
+        _profiler.track(rng)
+
+@contextmanager
+def phase(name: str, rng: Optional[np.random.Generator] = None) -> Iterator[None]:
+    """Time a block as a phase of the active profiler; does nothing when profiling is off."""
+    if _profiler is None:
+        yield
+        return
+    with _profiler.phase(name, rng):
+        yield
+
+def count(**counts: int) -> None:
+    """Add entity counts to the running phase when profiling is on."""
+    if _profiler is not None:
+        _profiler.count(**counts)
+
+def profiled(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Decorate a generator method so each call runs as a phase.
+
+    The phase is named after the method unless `name` is given and counts
+    only the draws of the instance's own `rng`.
+    """
+    def decorate(method: Callable) -> Callable:
+        label = name or method.__name__
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if _profiler is None:
+                return method(self, *args, **kwargs)
+            with _profiler.phase(label, getattr(self, 'rng', None)):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
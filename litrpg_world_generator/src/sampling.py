@@ -0,0 +1,72 @@
+"""
+Precomputed categorical samplers for the generators.
+Builds an alias table once per distribution so each weighted draw is O(1) and draws can be taken in bulk.
+"""
+from functools import lru_cache
+import numpy as np
+from typing import Optional, Sequence, Tuple, Union
+
+class CategoricalSampler:
+    """Draws from a fixed categorical distribution with Walker's alias method.
+
+    The table is built once in O(k). A draw then takes one uniform number:
+    its integer part picks a column and its fraction decides between the
+    column's own category and its alias. `rng` may be a numpy Generator,
+    a RandomState or the numpy.random module itself.
+    """
+
+    def __init__(self, categories: Sequence, weights: Optional[Sequence[float]] = None):
+        """Build the alias table for `categories`, equally weighted when `weights` is None."""
+        k = len(categories)
+        if k == 0:
+            raise ValueError("A categorical sampler needs at least one category")
+        p = np.ones(k) if weights is None else np.asarray(weights, dtype=np.float64)
+        if p.shape != (k,):
+            raise ValueError(f"Expected {k} weights, got {p.size}")
+        if (p < 0).any() or not np.isfinite(p).all() or p.sum() <= 0:
+            raise ValueError("Weights must be finite, non-negative and not all zero")
+
+        self.categories = tuple(categories)
+        self.probabilities = p / p.sum()
+        self.values = np.empty(k, dtype=object)
+        self.values[:] = self.categories
+        if all(isinstance(category, str) for category in self.categories):
+            self.values = self.values.astype(str)
+
+        # Vose's construction: under-full columns are topped up from over-full ones
+        scaled = self.probabilities * k
+        self._accept = np.ones(k)
+        self._alias = np.arange(k)
+        small = [i for i in range(k) if scaled[i] < 1.0]
+        large = [i for i in range(k) if scaled[i] >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            self._accept[low] = scaled[low]
+            self._alias[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+    def draw(self, rng, size: Optional[Union[int, Tuple[int, ...]]] = None):
+        """Return one category index, or an array of `size` indices."""
+        k = len(self.categories)
+        if size is None:
+            u = rng.random() * k
+            column = min(int(u), k - 1)
+            return column if u - column < self._accept[column] else int(self._alias[column])
+        u = rng.random(size) * k
+        column = np.minimum(u.astype(np.intp), k - 1)
+        return np.where(u - column < self._accept[column], column, self._alias[column])
+
+    def choose(self, rng, size: Optional[Union[int, Tuple[int, ...]]] = None):
+        """Return one category, or an array of `size` categories."""
+        if size is None:
+            return self.categories[self.draw(rng)]
+        return self.values[self.draw(rng, size)]
+
+@lru_cache(maxsize=None)
+def categorical(categories: Tuple, weights: Optional[Tuple[float, ...]] = None) -> CategoricalSampler:
+    """Return the shared sampler for a distribution, building it on first use."""
+    return CategoricalSampler(categories, weights)
@@ -0,0 +1,148 @@
+"""
+Tiered resource allocation for generated worlds.
+Samples owners for every rare resource of a realm in bulk under a pluggable allocation policy.
+"""
+import numpy as np
+from typing import Dict, Optional, Tuple, Type
+
+from .population_index import PopulationIndex
+from .stores import PopulationStore
+from ..constants import ResourceTier
+
+class AllocationPolicy:
+    """Decides how likely each eligible being is to receive a resource.
+
+    The base policy weighs every eligible being equally and lets one
+    being own any number of resources.
+    """
+
+    # Most resources a single being may receive, None for no limit
+    cap: Optional[int] = None
+
+    def weights(self, store: PopulationStore, beings: np.ndarray) -> Optional[np.ndarray]:
+        """Return a non-negative weight per being, or None for equal weights."""
+        return None
+
+class UniformPolicy(AllocationPolicy):
+    """Every eligible being is equally likely to receive a resource."""
+
+class CombatPowerPolicy(AllocationPolicy):
+    """Eligible beings receive resources in proportion to their combat power."""
+
+    def weights(self, store: PopulationStore, beings: np.ndarray) -> Optional[np.ndarray]:
+        return np.maximum(store.combat_powers(beings), 0)
+
+class CappedPolicy(AllocationPolicy):
+    """Limits how many resources one being may receive under another policy."""
+
+    def __init__(self, cap: int = 1, base: Optional[AllocationPolicy] = None):
+        """Initialize the policy with a per-owner cap over `base` (uniform by default)."""
+        if cap < 1:
+            raise ValueError(f"Allocation cap must be at least 1, got {cap}")
+        self.cap = cap
+        self.base = base or UniformPolicy()
+
+    def weights(self, store: PopulationStore, beings: np.ndarray) -> Optional[np.ndarray]:
+        return self.base.weights(store, beings)
+
+ALLOCATION_POLICIES: Dict[str, Type[AllocationPolicy]] = {
+    'uniform': UniformPolicy,
+    'combat_power': CombatPowerPolicy,
+    'capped': CappedPolicy
+}
+
+def draw_owners(
+    sorted_stages: np.ndarray,
+    tiers: np.ndarray,
+    rng: np.random.Generator,
+    weights: Optional[np.ndarray] = None,
+    cap: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (resources, owners) for the resources that found an owner.
+
+    `resources` index into `tiers` and `owners` into the stage-sorted
+    population. A resource may only go to a being whose stage is at least
+    its tier value; those beings form a suffix of the sorted view. With a
+    `cap`, owners are drawn in rounds and beings that reach the cap stop
+    receiving, so a resource goes unowned once every eligible being is full.
+    """
+    n = len(sorted_stages)
+    first = np.searchsorted(sorted_stages, tiers, side='left')
+    pending = np.flatnonzero(first < n)
+    if weights is None and cap is None:
+        return pending, rng.integers(first[pending], n)
+
+    weights = np.ones(n) if weights is None else np.array(weights, dtype=np.float64)
+    load = np.zeros(n, dtype=np.int64)
+    resources, owners = [], []
+    while len(pending):
+        # Sample each resource's suffix through the cumulative weights
+        cumulative = np.cumsum(weights)
+        start = np.where(first[pending] > 0, cumulative[first[pending] - 1], 0.0)
+        total = cumulative[-1] - start
+        pending, start, total = pending[total > 0], start[total > 0], total[total > 0]
+        if not len(pending):
+            break
+        picks = np.minimum(
+            np.searchsorted(cumulative, start + rng.random(len(pending)) * total, side='right'),
+            n - 1
+        )
+        if cap is None:
+            resources.append(pending)
+            owners.append(picks)
+            break
+
+        # Resources that drew the same being are ranked at random and the
+        # ones past its remaining capacity are drawn again next round
+        order = rng.permutation(len(pending))
+        order = order[np.argsort(picks[order], kind='stable')]
+        ranked = picks[order]
+        group_start = np.flatnonzero(np.r_[True, ranked[1:] != ranked[:-1]])
+        rank = np.arange(len(ranked)) - np.repeat(group_start, np.diff(np.r_[group_start, len(ranked)]))
+        accepted = rank < cap - load[ranked]
+
+        resources.append(pending[order[accepted]])
+        owners.append(ranked[accepted])
+        np.add.at(load, ranked[accepted], 1)
+        weights[load >= cap] = 0
+        pending = np.sort(pending[order[~accepted]])
+
+    if not resources:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    return np.concatenate(resources), np.concatenate(owners)
+
+def distribute_resources(
+    store: PopulationStore,
+    index: PopulationIndex,
+    policy: AllocationPolicy,
+    rng: np.random.Generator
+) -> int:
+    """Give every RARE or better resource an owner in its realm; return how many were placed.
+
+    Beings are bucketed by stage once per realm through the index's
+    stage-sorted view, owners are drawn for all of the realm's resources
+    together and the artifacts are written to the store in one batch.
+    """
+    placed = 0
+    for realm_id in index.realms():
+        if not index.being_count(realm_id):
+            continue
+
+        # Higher quality resources go to stronger beings
+        handles = index.resources_in(realm_id)
+        tiers = store.resource_tiers(handles)
+        rare = tiers >= ResourceTier.RARE.value
+        if not rare.any():
+            continue
+
+        by_stage, sorted_stages = index.stage_sorted(realm_id)
+        resources, owners = draw_owners(
+            sorted_stages,
+            tiers[rare],
+            rng,
+            policy.weights(store, by_stage),
+            policy.cap
+        )
+        store.give_artifacts(by_stage[owners], handles[rare][resources])
+        placed += len(resources)
+    return placed
@@ -0,0 +1,536 @@
+"""
+Columnar (struct-of-arrays) population backend for the world generator.
+Keeps beings and resources as typed NumPy columns and builds models lazily on access.
+"""
+from datetime import datetime, timedelta
+import numpy as np
+from collections.abc import Mapping, ValuesView, ItemsView
+from typing import Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from .events import EventLog
+from .ids import IdAllocator, id_index, word_indices
+from .population_index import PopulationIndex
+from .relationship_graph import RelationshipGraph
+from .scheduler import EventQueue
+from .simulation import (
+    apply_karma,
+    breakthrough_due,
+    combat_power,
+    degrade_resources,
+    row_totals,
+    tick_years,
+    tribulation_difficulty
+)
+from .stores import PopulationStore
+from .tables import ROW_DTYPE, ColumnTable
+from ..clock import WorldClock
+from ..generators.being_batch import BeingBatch, KEYED_COLUMNS, build_being
+from ..models.being import Being
+from ..models.resource import Resource
+
+# name: (dtype, per-row shape, fill value for rows appended without it)
+BEING_SCHEMA = {
+    'id': (np.uint64, (2,), 0),
+    'location': (np.uint16, (), 0),
+    'name_prefix': (np.uint8, (), 0),
+    'name_suffix': (np.uint8, (), 0),
+    'name_number': (np.uint16, (), 0),
+    'race': (np.uint8, (), 0),
+    'age': (np.float64, (), 0),
+    'bloodline_name': (np.uint8, (), 0),
+    'bloodline_strength': (np.float32, (), 0),
+    'bloodline_purity': (np.float32, (), 0),
+    'bloodline_mutation': (np.float32, (), 0),
+    'bloodline_traits': (np.uint8, (), 0),
+    'stage': (np.uint8, (), 0),
+    'realm': (np.uint8, (), 0),
+    'foundation_quality': (np.float32, (), 0),
+    'cultivation_speed': (np.float32, (), 0),
+    'bottleneck_threshold': (np.float32, (), 0),
+    'comprehension_rate': (np.float32, (), 0),
+    'soul_strength': (np.float32, (), 0),
+    'soul_purity': (np.float32, (), 0),
+    'soul_stability': (np.float32, (), 0),
+    'dao_marks': (np.bool_, (), False),
+    'base_power': (np.float32, (), 0),
+    'battle_experience': (np.float32, (), 0),
+    'special_moves': (np.bool_, (), False),
+    'storage_rings': (np.uint8, (), 0),
+    'fate_value': (np.float64, (), 0),
+    'karmic_debt': (np.float32, (), 0),
+    'fortune': (np.float64, (), 0),
+    'tribulation_counter': (np.int32, (), 0),
+    'measurement_accuracy': (np.float32, (), 0),
+    'data_reliability': (np.float32, (), 0),
+    'hidden_attributes': (np.uint8, (), 0),
+    'created': ('datetime64[us]', (), 'NaT'),
+    'last_breakthrough': ('datetime64[us]', (), 'NaT'),
+    # Fixed-key dicts are expanded to one float32 column per key
+    **{
+        name: (np.float32, (len(keys),), 0)
+        for name, keys in KEYED_COLUMNS.items()
+    }
+}
+
+# Resources keep their descriptive fields in the generated model; the fields
+# that change over time live in columns and are written back on access.
+RESOURCE_SCHEMA = {
+    'id': (np.uint64, (2,), 0),
+    'location': (np.uint16, (), 0),
+    'tier': (np.uint8, (), 0),
+    'owner': (ROW_DTYPE, (), -1),
+    'base_grade': (np.float32, (), 0),
+    'current_age': (np.float64, (), 0),
+    'preservation_state': (np.float64, (), 0),
+    'stability': (np.float64, (), 0),
+    'purity': (np.float64, (), 0),
+    'degradation_rate': (np.float64, (), 0),
+    'remaining_uses': (np.int32, (), -1)
+}
+
+# Tribulations as exported to Arrow tables; in memory they live in the event log
+TRIBULATION_SCHEMA = {
+    'being': (ROW_DTYPE, (), 0),
+    'power_level': (np.float64, (), 0),
+    'difficulty': (np.float64, (), 0),
+    'stage': (np.uint8, (), 0),
+    'timestamp': ('datetime64[us]', (), 'NaT')
+}
+
+def uuid_to_words(value: UUID) -> Tuple[int, int]:
+    """Split a UUID into its high and low 64-bit words."""
+    return value.int >> 64, value.int & 0xFFFFFFFFFFFFFFFF
+
+def words_to_uuid(high: int, low: int) -> UUID:
+    """Join high and low 64-bit words into a UUID."""
+    return UUID(int=(int(high) << 64) | int(low))
+
+class _UuidLookup:
+    """Sorted index from UUIDs to row numbers over a table's id column.
+
+    Ids from an IdAllocator are usually stored at the row matching their
+    index, so that row is checked before the sorted index is consulted.
+    """
+
+    def __init__(self, table: ColumnTable):
+        self._table = table
+        self._size = -1
+        self._high: np.ndarray = np.empty(0, dtype=np.uint64)
+        self._order: np.ndarray = np.empty(0, dtype=np.int64)
+
+    def find(self, value: UUID) -> int:
+        """Return the row holding `value`, or -1."""
+        high, low = uuid_to_words(value)
+        ids = self._table['id']
+        row = id_index(value)
+        if row is not None and row < len(self._table) and ids[row, 0] == high and ids[row, 1] == low:
+            return row
+        if self._size != len(self._table):
+            self._order = np.argsort(ids[:, 0], kind='stable')
+            self._high = ids[self._order, 0]
+            self._size = len(self._table)
+        start = np.searchsorted(self._high, np.uint64(high), side='left')
+        stop = np.searchsorted(self._high, np.uint64(high), side='right')
+        for row in self._order[start:stop]:
+            if ids[row, 1] == low:
+                return int(row)
+        return -1
+
+class ColumnarWorld(PopulationStore):
+    """Population store holding beings and resources as typed NumPy columns."""
+
+    RELATION_KINDS = RelationshipGraph.KINDS
+
+    def __init__(self, ids: Optional[IdAllocator] = None, events: Optional[EventLog] = None):
+        """Initialize empty tables, realm registry and row-based index, allocating ids from `ids`."""
+        self.ids = ids if ids is not None else IdAllocator()
+        self.events = events if events is not None else EventLog()
+        self.being_table = ColumnTable(BEING_SCHEMA)
+        self.resource_table = ColumnTable(RESOURCE_SCHEMA)
+        self.graph = RelationshipGraph()  # allies, enemies and masters by row
+        self.resource_models: List[Resource] = []
+        self.realm_ids: List[UUID] = []
+        self._realm_rows: Dict[UUID, int] = {}
+        self.index = PopulationIndex(id_dtype=ROW_DTYPE)
+        self._being_lookup = _UuidLookup(self.being_table)
+        self._resource_lookup = _UuidLookup(self.resource_table)
+        self._breakthroughs: Optional[EventQueue] = None  # built on the first tick
+
+        self.beings = _ModelView(self, 'being')
+        self.resources = _ModelView(self, 'resource')
+        self.being_locations = _LocationView(self, self.being_table)
+        self.resource_locations = _LocationView(self, self.resource_table)
+
+    @classmethod
+    def from_tables(
+        cls,
+        realm_ids: List[UUID],
+        beings: ColumnTable,
+        resources: ColumnTable,
+        resource_models: List[Resource],
+        graph: RelationshipGraph,
+        events: EventLog,
+        ids: Optional[IdAllocator] = None
+    ) -> 'ColumnarWorld':
+        """Assemble a world from existing tables and rebuild its realm index.
+
+        `ids` should be the allocator the tables' ids came from (see
+        IdAllocator.restore), so they decode and new ids do not collide.
+        """
+        world = cls(ids, events)
+        world.being_table = beings
+        world.resource_table = resources
+        world.resource_models = list(resource_models)
+        world.graph = graph
+        for realm_id in realm_ids:
+            world.realm_row(realm_id)
+        world._being_lookup = _UuidLookup(beings)
+        world._resource_lookup = _UuidLookup(resources)
+        world.being_locations = _LocationView(world, beings)
+        world.resource_locations = _LocationView(world, resources)
+
+        being_location = beings['location']
+        resource_location = resources['location']
+        for realm, realm_id in enumerate(realm_ids):
+            rows = np.flatnonzero(being_location == realm).astype(ROW_DTYPE)
+            if len(rows):
+                world.index.add_beings(rows, realm_id, beings['stage'][rows])
+            for row in np.flatnonzero(resource_location == realm).tolist():
+                world.index.add_resource(row, realm_id)
+        return world
+
+    def realm_row(self, realm_id: UUID) -> int:
+        """Return the compact index used for a realm, registering it if new."""
+        if realm_id not in self._realm_rows:
+            self._realm_rows[realm_id] = len(self.realm_ids)
+            self.realm_ids.append(realm_id)
+        return self._realm_rows[realm_id]
+
+    def add_beings(self, batch: BeingBatch, realm_id: UUID) -> np.ndarray:
+        """Append a batch of generated beings placed in one realm; return their rows."""
+        n = len(batch)
+        columns = {name: batch[name] for name in batch.columns if name in BEING_SCHEMA}
+        columns['id'] = self.ids.words('being', self.ids.allocate('being', n), n)
+        columns['location'] = self.realm_row(realm_id)
+        columns['created'] = np.datetime64(batch.creation_date, 'us')
+        rows = self.being_table.append(columns, n)
+        self._breakthroughs = None
+        self.graph.add_nodes(n)
+        self.index.add_beings(rows, realm_id, batch['stage'])
+        return rows
+
+    def add_resource(self, resource: Resource, realm_id: UUID) -> int:
+        """Append a resource placed in a realm; return its row."""
+        high, low = uuid_to_words(resource.id)
+        remaining = resource.usage_metrics.remaining_uses
+        row = self.resource_table.append({
+            'id': np.array([[high, low]], dtype=np.uint64),
+            'location': self.realm_row(realm_id),
+            'tier': resource.tier.value,
+            'base_grade': resource.quality_metrics.base_grade,
+            'current_age': resource.formation_attributes.current_age,
+            'preservation_state': resource.quality_metrics.preservation_state,
+            'stability': resource.energy_profile.stability,
+            'purity': resource.energy_profile.purity,
+            'degradation_rate': resource.usage_metrics.degradation_rate,
+            'remaining_uses': -1 if remaining is None else remaining
+        }, 1)[0]
+        self.resource_models.append(resource)
+        self.index.add_resource(row, realm_id)
+        return int(row)
+
+    def move_being(self, being_id: UUID, realm_id: UUID) -> None:
+        """Move a being to another realm."""
+        row = self.being_row(being_id)
+        old_realm = self.realm_ids[self.being_table['location'][row]]
+        self.index.move_being(row, old_realm, realm_id, int(self.being_table['stage'][row]))
+        self.being_table.writable('location')[row] = self.realm_row(realm_id)
+
+    def move_resource(self, resource_id: UUID, realm_id: UUID) -> None:
+        """Move a resource to another realm."""
+        row = self.resource_row(resource_id)
+        old_realm = self.realm_ids[self.resource_table['location'][row]]
+        self.index.move_resource(row, old_realm, realm_id)
+        self.resource_table.writable('location')[row] = self.realm_row(realm_id)
+
+    def being_row(self, being_id: UUID) -> int:
+        """Return the row of a being, raising KeyError if unknown."""
+        row = self._being_lookup.find(being_id)
+        if row < 0:
+            raise KeyError(being_id)
+        return row
+
+    def resource_row(self, resource_id: UUID) -> int:
+        """Return the row of a resource, raising KeyError if unknown."""
+        row = self._resource_lookup.find(resource_id)
+        if row < 0:
+            raise KeyError(resource_id)
+        return row
+
+    def being_uuid(self, row: int) -> UUID:
+        """Return the UUID of the being in a row."""
+        return words_to_uuid(*self.being_table['id'][row])
+
+    def resource_uuid(self, row: int) -> UUID:
+        """Return the UUID of the resource in a row."""
+        return words_to_uuid(*self.resource_table['id'][row])
+
+    def being(self, handle: int) -> Being:
+        """Build a Being model from a row, including its relationships and artifacts."""
+        row = self.being_table.row(handle)
+        master = int(self.graph.masters[handle])
+        fields = {
+            'id': words_to_uuid(*row['id']),
+            'master_id': self.being_uuid(master) if master >= 0 else None,
+            'disciples': [self.being_uuid(d) for d in self.graph.disciples_of(handle).tolist()]
+        }
+        for kind in self.RELATION_KINDS:
+            others, weights = self.graph.neighbors(kind, handle)
+            fields[kind] = {
+                self.being_uuid(other): weight
+                for other, weight in zip(others.tolist(), weights.tolist())
+            }
+        if not np.isnat(row['last_breakthrough']):
+            fields['last_breakthrough'] = row['last_breakthrough'].astype(datetime)
+            fields['tribulation_history'] = self.events.view('tribulation', fields['id'])
+        being = build_being(row, row['created'].astype(datetime), **fields)
+        owned = np.flatnonzero(self.resource_table['owner'] == handle)
+        for resource_row in owned:
+            item = self.resource_models[resource_row]
+            being.inventory.artifacts[item.name] = item.quality_metrics.base_grade
+        age = float(row['age'])
+        if not age.is_integer():
+            being.age = age  # aged beings carry fractional years, as in the model path
+        return being
+
+    def resource(self, handle: int) -> Resource:
+        """Return the Resource model for a row with its time-varying fields synced."""
+        resource = self.resource_models[handle]
+        table = self.resource_table
+        age = float(table['current_age'][handle])
+        resource.formation_attributes.current_age = int(age) if age.is_integer() else age
+        resource.quality_metrics.preservation_state = float(table['preservation_state'][handle])
+        resource.energy_profile.stability = float(table['stability'][handle])
+        resource.energy_profile.purity = float(table['purity'][handle])
+        remaining = int(table['remaining_uses'][handle])
+        if resource.usage_metrics.remaining_uses is not None:
+            resource.usage_metrics.remaining_uses = remaining
+        return resource
+
+    def resource_tier(self, handle: int) -> int:
+        return int(self.resource_table['tier'][handle])
+
+    def resource_tiers(self, handles: np.ndarray) -> np.ndarray:
+        return self.resource_table['tier'][handles]
+
+    def combat_powers(self, handles: np.ndarray) -> np.ndarray:
+        table = self.being_table
+        return combat_power(
+            table['base_power'][handles],
+            table['realm'][handles],
+            row_totals(table['technique_mastery'][handles]),
+            table['soul_strength'][handles]
+        )
+
+    def being_profiles(self, handles: np.ndarray) -> Dict[str, np.ndarray]:
+        table = self.being_table
+        return {
+            'stage': table['stage'][handles],
+            'race': table['race'][handles],
+            'age': table['age'][handles],
+            'combat_power': self.combat_powers(handles)
+        }
+
+    def set_master(self, disciple: int, master: int) -> None:
+        self.graph.set_master(disciple, master)
+
+    def set_masters(self, disciples: np.ndarray, masters: np.ndarray) -> None:
+        self.graph.set_masters(disciples, masters)
+
+    def link(self, kind: str, first: int, second: int, weight: float) -> None:
+        self.graph.add_edge(kind, first, second, weight)
+
+    def link_many(
+        self,
+        kind: str,
+        first: np.ndarray,
+        second: np.ndarray,
+        weight: np.ndarray
+    ) -> None:
+        self.graph.add_edges(kind, first, second, weight)
+
+    def relationship_graph(self) -> RelationshipGraph:
+        return self.graph
+
+    def being_labels(self, rows: np.ndarray) -> List[str]:
+        return [str(words_to_uuid(high, low)) for high, low in self.being_table['id'][rows].tolist()]
+
+    def give_artifact(self, owner: int, resource: int) -> None:
+        self.resource_table.writable('owner')[resource] = owner
+
+    def give_artifacts(self, owners: np.ndarray, resources: np.ndarray) -> None:
+        self.resource_table.writable('owner')[resources] = owners
+
+    def advance_beings(self, time_delta: timedelta, clock: WorldClock) -> None:
+        """Run one tick of aging, breakthroughs and karma over the being columns."""
+        table = self.being_table
+        if not len(table):
+            return
+        table.writable('age')[...] += tick_years(time_delta.days)
+
+        # Rows in ascending order, so tribulations are appended as a full scan would
+        eligible = np.sort(self._due_breakthroughs(clock))
+        if len(eligible):
+            stage = table['stage'][eligible]
+            power = combat_power(
+                table['base_power'][eligible],
+                table['realm'][eligible],
+                row_totals(table['technique_mastery'][eligible]),
+                table['soul_strength'][eligible]
+            )
+            self.events.append(
+                'tribulation',
+                table['id'][eligible],
+                clock.datetime64,
+                np.column_stack((power, tribulation_difficulty(stage, table['fate_value'][eligible]))),
+                stage
+            )
+            table.writable('last_breakthrough')[eligible] = clock.datetime64
+            self._breakthroughs.schedule(eligible, self._breakthrough_due(eligible))
+
+        apply_karma(
+            table.writable('fate_value'),
+            table.writable('fortune'),
+            table.writable('tribulation_counter'),
+            0.001 * time_delta.days
+        )
+
+    def reschedule_breakthroughs(self) -> None:
+        self._breakthroughs = None
+
+    def _due_breakthroughs(self, clock: WorldClock) -> np.ndarray:
+        """Pop the rows whose breakthrough is due, queueing every row on first use."""
+        if self._breakthroughs is None:
+            rows = np.arange(len(self.being_table), dtype=ROW_DTYPE)
+            self._breakthroughs = EventQueue(dtype=ROW_DTYPE)
+            self._breakthroughs.schedule(rows, self._breakthrough_due(rows))
+        return self._breakthroughs.pop_ready(clock.micros, self._breakthrough_due)
+
+    def _breakthrough_due(self, rows: np.ndarray) -> np.ndarray:
+        """Return when each of the given rows may next attempt a breakthrough."""
+        table = self.being_table
+        # Insights are never recorded in columnar form, so only first breakthroughs are ever due
+        return breakthrough_due(
+            table['last_breakthrough'][rows],
+            0,
+            table['foundation_quality'][rows],
+            table['bottleneck_threshold'][rows]
+        )
+
+    def advance_resources(self, time_delta: timedelta) -> None:
+        """Run one tick of aging and degradation over the resource columns."""
+        table = self.resource_table
+        years = tick_years(time_delta.days)
+        table.writable('current_age')[...] += years
+        degrade_resources(
+            {name: table.writable(name) for name in (
+                'degradation_rate', 'preservation_state', 'stability',
+                'purity', 'remaining_uses'
+            )},
+            years
+        )
+
+    def nbytes(self) -> int:
+        """Return the bytes held by all column tables."""
+        tables = [self.being_table, self.resource_table]
+        return sum(table.nbytes() for table in tables) + self.graph.nbytes() + self.events.nbytes()
+
+    def being_rows(self, ids: np.ndarray) -> np.ndarray:
+        """Return the rows holding an (n, 2) array of being id words, -1 where absent."""
+        table = self.being_table
+        # Allocator ids usually sit at the row matching their index
+        rows = word_indices(ids)
+        found = rows < len(table)
+        found[found] = (table['id'][rows[found]] == ids[found]).all(axis=1)
+        for position in np.flatnonzero(~found).tolist():
+            rows[position] = self._being_lookup.find(words_to_uuid(*ids[position]))
+        return rows
+
+class _ModelView(Mapping):
+    """Read-only UUID -> model mapping that materializes rows on access."""
+
+    def __init__(self, world: ColumnarWorld, kind: str):
+        self._world = world
+        self._kind = kind
+
+    def _table(self) -> ColumnTable:
+        return self._world.being_table if self._kind == 'being' else self._world.resource_table
+
+    def _build(self, row: int):
+        return self._world.being(row) if self._kind == 'being' else self._world.resource(row)
+
+    def _uuid(self, row: int) -> UUID:
+        return words_to_uuid(*self._table()['id'][row])
+
+    def __getitem__(self, key: UUID):
+        lookup = self._world._being_lookup if self._kind == 'being' else self._world._resource_lookup
+        row = lookup.find(key)
+        if row < 0:
+            raise KeyError(key)
+        return self._build(row)
+
+    def __iter__(self) -> Iterator[UUID]:
+        return (self._uuid(row) for row in range(len(self._table())))
+
+    def __len__(self) -> int:
+        return len(self._table())
+
+    def values(self) -> ValuesView:
+        return _RowValues(self)
+
+    def items(self) -> ItemsView:
+        return _RowItems(self)
+
+class _LocationView(Mapping):
+    """Read-only UUID -> realm UUID mapping over a table's location column."""
+
+    def __init__(self, world: ColumnarWorld, table: ColumnTable):
+        self._world = world
+        self._table = table
+        self._lookup = _UuidLookup(table)
+
+    def __getitem__(self, key: UUID) -> UUID:
+        row = self._lookup.find(key)
+        if row < 0:
+            raise KeyError(key)
+        return self._world.realm_ids[self._table['location'][row]]
+
+    def __iter__(self) -> Iterator[UUID]:
+        return (words_to_uuid(*words) for words in self._table['id'])
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def items(self) -> ItemsView:
+        return _RowItems(self)
+
+    def _build(self, row: int) -> UUID:
+        return self._world.realm_ids[self._table['location'][row]]
+
+    def _uuid(self, row: int) -> UUID:
+        return words_to_uuid(*self._table['id'][row])
+
+class _RowValues(ValuesView):
+    """Values view that walks rows directly instead of looking up each key."""
+
+    def __iter__(self):
+        view = self._mapping
+        return (view._build(row) for row in range(len(view)))
+
+class _RowItems(ItemsView):
+    """Items view that walks rows directly instead of looking up each key."""
+
+    def __iter__(self):
+        view = self._mapping
+        return ((view._uuid(row), view._build(row)) for row in range(len(view)))
@@ -0,0 +1,398 @@
+"""
+World event log.
+Append-only, chunked columnar storage of entity events such as tribulations and realm stability samples, with per-entity range queries, retention and spilling to disk.
+"""
+import copy
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+import numpy as np
+from pathlib import Path
+import shutil
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from uuid import UUID
+
+from .tables import ColumnTable
+from ..constants import CultivationStage
+
+# kind name: code stored in the 'kind' column
+EVENT_KINDS = {'tribulation': 1, 'stability': 2}
+
+EVENT_SCHEMA = {
+    'entity_high': (np.uint64, (), 0),  # entity UUID as high and low 64-bit words
+    'entity_low': (np.uint64, (), 0),
+    'kind': (np.uint8, (), 0),
+    'code': (np.int16, (), 0),  # kind-specific category, e.g. the cultivation stage
+    'timestamp': ('datetime64[us]', (), 'NaT'),
+    'value': (np.float64, (2,), np.nan)  # kind-specific numbers
+}
+
+_LOW_MASK = (1 << 64) - 1
+
+Time = Union[datetime, np.datetime64]
+
+def _tribulation_entry(code: int, value: List[float], timestamp: datetime) -> Dict[str, object]:
+    return {
+        'power_level': value[0],
+        'difficulty': value[1],
+        'type': f"{CultivationStage(code).name}_TRIBULATION",
+        'timestamp': timestamp
+    }
+
+def _tribulation_fields(entry: Dict[str, object]) -> Tuple[int, Tuple[float, float]]:
+    stage = CultivationStage[entry['type'].rsplit('_', 1)[0]]
+    return stage.value, (entry['power_level'], entry['difficulty'])
+
+def _stability_entry(code: int, value: List[float], timestamp: datetime) -> Dict[str, object]:
+    return {'timestamp': timestamp, 'stability': value[0], 'energy_state': value[1]}
+
+def _stability_fields(entry: Dict[str, object]) -> Tuple[int, Tuple[float, float]]:
+    return 0, (entry['stability'], entry['energy_state'])
+
+# kind: (row -> model history dict, model history dict -> (code, values))
+_FORMATS: Dict[str, Tuple[Callable, Callable]] = {
+    'tribulation': (_tribulation_entry, _tribulation_fields),
+    'stability': (_stability_entry, _stability_fields)
+}
+
+def _entries(kind: str, columns: Dict[str, np.ndarray], rows: slice = slice(None)) -> List[Dict[str, object]]:
+    """Return the selected rows of `select` columns as the dicts model fields hold."""
+    entry = _FORMATS[kind][0]
+    return [
+        entry(code, value, timestamp)
+        for code, value, timestamp in zip(
+            columns['code'][rows].tolist(),
+            columns['value'][rows].tolist(),
+            columns['timestamp'][rows].astype(datetime).tolist()
+        )
+    ]
+
+def entity_words(ids: Iterable[UUID]) -> np.ndarray:
+    """Return UUIDs as an (n, 2) uint64 array of [high, low] words."""
+    words = [(value.int >> 64, value.int & _LOW_MASK) for value in ids]
+    return np.array(words, dtype=np.uint64).reshape(len(words), 2)
+
+class _Chunk:
+    """A sealed block of events sorted by entity, then time; `path` is set once spilled."""
+
+    __slots__ = ('columns', 'first', 'last', 'path')
+
+    def __init__(self, columns: Dict[str, np.ndarray], path: Optional[Path] = None):
+        self.columns = columns
+        timestamps = columns['timestamp']
+        self.first = timestamps.min()
+        self.last = timestamps.max()
+        self.path = path
+
+    def __len__(self) -> int:
+        return len(self.columns['timestamp'])
+
+    def __getstate__(self) -> tuple:
+        # Spilled chunks are pickled as their directory and mapped again on load
+        return (None if self.path else self.columns), self.first, self.last, self.path
+
+    def __setstate__(self, state: tuple) -> None:
+        self.columns, self.first, self.last, self.path = state
+        if self.path is not None:
+            self.columns = _load_columns(self.path)
+
+def _load_columns(path: Path) -> Dict[str, np.ndarray]:
+    """Memory-map the column files of a spilled chunk."""
+    return {name: np.load(path / f"{name}.npy", mmap_mode='r') for name in EVENT_SCHEMA}
+
+class EventLog:
+    """Append-only log of entity events in typed, chunked columns.
+
+    Events land in an active table; every `chunk_size` events it is
+    sealed into a chunk sorted by entity and time, so one entity's
+    history is found by binary search instead of a scan. With a
+    `spill_dir` sealed chunks are written there as .npy files and memory
+    mapped. With a `retention` period, `compact` drops older events and
+    merges the chunks it leaves small. Model history fields are append-only
+    EventHistory views over the log.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 65_536,
+        spill_dir: Optional[Union[str, Path]] = None,
+        retention: Optional[timedelta] = None
+    ):
+        """Initialize an empty log."""
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be at least 1, got {chunk_size}")
+        self.chunk_size = chunk_size
+        self.spill_dir = None if spill_dir is None else Path(spill_dir)
+        self.retention = retention
+        self._chunks: List[_Chunk] = []
+        self._active = ColumnTable(EVENT_SCHEMA)
+        self._spilled = 0  # chunks written so far, for directory names
+
+    def __len__(self) -> int:
+        return sum(len(chunk) for chunk in self._chunks) + len(self._active)
+
+    def append(
+        self,
+        kind: str,
+        entities: np.ndarray,
+        timestamp: Union[Time, np.ndarray],
+        values: np.ndarray,
+        codes: Union[int, np.ndarray] = 0
+    ) -> None:
+        """Record one event per row of `entities`, an (n, 2) array of UUID words."""
+        n = len(entities)
+        if not n:
+            return
+        self._active.append({
+            'entity_high': entities[:, 0],
+            'entity_low': entities[:, 1],
+            'kind': EVENT_KINDS[kind],
+            'code': codes,
+            'timestamp': np.asarray(timestamp, dtype='datetime64[us]'),
+            'value': values
+        }, n)
+        if len(self._active) >= self.chunk_size:
+            self.seal()
+
+    def seal(self) -> None:
+        """Sort the active events into a new chunk, spilling it if enabled."""
+        active = self._active
+        if not len(active):
+            return
+        order = np.lexsort((
+            active['timestamp'].view(np.int64), active['entity_low'], active['entity_high']
+        ))
+        self._chunks.append(self._store({name: active[name][order] for name in EVENT_SCHEMA}))
+        self._active = ColumnTable(EVENT_SCHEMA)
+
+    def view(self, kind: str, entity: UUID) -> 'EventHistory':
+        """Return the live history of one entity."""
+        return EventHistory(self, kind, entity)
+
+    def adopt(self, kind: str, entity: UUID, entries: Sequence) -> 'EventHistory':
+        """Move an entity's existing history into the log and return the view replacing it."""
+        if isinstance(entries, EventHistory) and entries.log is self:
+            return entries
+        if entries:
+            fields = [_FORMATS[kind][1](entry) for entry in entries]
+            self.append(
+                kind,
+                entity_words([entity] * len(fields)),
+                np.array([entry['timestamp'] for entry in entries], dtype='datetime64[us]'),
+                np.array([value for _, value in fields], dtype=np.float64),
+                np.array([code for code, _ in fields], dtype=np.int16)
+            )
+        return self.view(kind, entity)
+
+    def select(
+        self,
+        kind: str,
+        entity: Optional[UUID] = None,
+        start: Optional[Time] = None,
+        end: Optional[Time] = None
+    ) -> Dict[str, np.ndarray]:
+        """Return the events of a kind, oldest first, as columns.
+
+        `entity` limits them to one entity and [start, end) to a time range;
+        within each sealed chunk both are binary searches.
+        """
+        parts = self._parts(kind, entity, start, end)
+        columns = {name: np.concatenate([part[name] for part in parts]) for name in EVENT_SCHEMA}
+        order = np.argsort(columns['timestamp'], kind='stable')
+        return {name: values[order] for name, values in columns.items()}
+
+    def count(
+        self,
+        kind: str,
+        entity: Optional[UUID] = None,
+        start: Optional[Time] = None,
+        end: Optional[Time] = None
+    ) -> int:
+        """Return how many events `select` would return, without joining or sorting them."""
+        return sum(len(part['timestamp']) for part in self._parts(kind, entity, start, end))
+
+    def entries(self, kind: str, entity: UUID) -> List[Dict[str, object]]:
+        """Return one entity's history as the dicts model fields hold."""
+        return _entries(kind, self.select(kind, entity))
+
+    def compact(self, now: Time) -> int:
+        """Drop events older than the retention period at `now` and merge small chunks.
+
+        Returns how many events were dropped; without a retention period
+        nothing happens.
+        """
+        if self.retention is None:
+            return 0
+        cutoff = np.datetime64(now, 'us') - np.timedelta64(self.retention, 'us')
+        dropped = 0
+        kept: list = []  # chunks and filtered column dicts
+        for chunk in self._chunks:
+            if chunk.first >= cutoff:
+                kept.append(chunk)
+                continue
+            keep = chunk.columns['timestamp'] >= cutoff
+            dropped += len(chunk) - int(keep.sum())
+            if keep.any():
+                # Filtering keeps the entity and time order
+                kept.append({name: values[keep] for name, values in chunk.columns.items()})
+            self._discard(chunk)
+        active = self._active
+        if len(active) and active['timestamp'].min() < cutoff:
+            keep = active['timestamp'] >= cutoff
+            dropped += len(active) - int(keep.sum())
+            self._active = ColumnTable(EVENT_SCHEMA)
+            self._active.append({name: active[name][keep] for name in EVENT_SCHEMA}, int(keep.sum()))
+        if dropped:
+            kept = self._merge(kept)
+        self._chunks = [part if isinstance(part, _Chunk) else self._store(part) for part in kept]
+        return dropped
+
+    def nbytes(self) -> int:
+        """Return the bytes of events held in memory; spilled chunks are not counted."""
+        held = sum(
+            values.nbytes
+            for chunk in self._chunks if chunk.path is None
+            for values in chunk.columns.values()
+        )
+        return held + self._active.nbytes()
+
+    def _merge(self, parts: List[Union[_Chunk, Dict[str, np.ndarray]]]) -> list:
+        """Join runs of neighbouring chunks that together fit in one chunk."""
+        merged: list = []
+        for part in parts:
+            size = len(part) if isinstance(part, _Chunk) else len(part['timestamp'])
+            if merged and merged[-1][1] + size <= self.chunk_size:
+                merged[-1][0].append(part)
+                merged[-1][1] += size
+            else:
+                merged.append([[part], size])
+        result = []
+        for group, _ in merged:
+            if len(group) == 1:
+                result.append(group[0])
+                continue
+            columns = [part.columns if isinstance(part, _Chunk) else part for part in group]
+            joined = {name: np.concatenate([c[name] for c in columns]) for name in EVENT_SCHEMA}
+            order = np.lexsort((
+                joined['timestamp'].view(np.int64), joined['entity_low'], joined['entity_high']
+            ))
+            for part in group:
+                if isinstance(part, _Chunk):
+                    self._discard(part)
+            result.append({name: values[order] for name, values in joined.items()})
+        return result
+
+    def _store(self, columns: Dict[str, np.ndarray]) -> _Chunk:
+        """Wrap sorted columns as a chunk, writing and mapping them when spilling."""
+        if self.spill_dir is None:
+            return _Chunk(columns)
+        path = self.spill_dir / f"chunk-{self._spilled:06d}"
+        self._spilled += 1
+        path.mkdir(parents=True, exist_ok=True)
+        for name, values in columns.items():
+            np.save(path / f"{name}.npy", values)
+        return _Chunk(_load_columns(path), path)
+
+    def _discard(self, chunk: _Chunk) -> None:
+        """Delete a spilled chunk's files."""
+        if chunk.path is not None:
+            chunk.columns = {}
+            shutil.rmtree(chunk.path, ignore_errors=True)
+
+    def _parts(
+        self,
+        kind: str,
+        entity: Optional[UUID],
+        start: Optional[Time],
+        end: Optional[Time]
+    ) -> List[Dict[str, np.ndarray]]:
+        """Return the matching rows of every chunk that may hold some and of the active table."""
+        start = None if start is None else np.datetime64(start, 'us')
+        end = None if end is None else np.datetime64(end, 'us')
+        key = None if entity is None else (np.uint64(entity.int >> 64), np.uint64(entity.int & _LOW_MASK))
+        parts = [
+            self._select(chunk.columns, kind, key, start, end, True)
+            for chunk in self._chunks
+            if (start is None or chunk.last >= start) and (end is None or chunk.first < end)
+        ]
+        active = {name: self._active[name] for name in EVENT_SCHEMA}
+        parts.append(self._select(active, kind, key, start, end, False))
+        return parts
+
+    @staticmethod
+    def _select(
+        columns: Dict[str, np.ndarray],
+        kind: str,
+        key: Optional[Tuple[np.uint64, np.uint64]],
+        start: Optional[np.datetime64],
+        end: Optional[np.datetime64],
+        ordered: bool
+    ) -> Dict[str, np.ndarray]:
+        """Return the matching rows of one chunk (`ordered`) or of the active table."""
+        if key is not None and ordered:
+            high = columns['entity_high']
+            lo, hi = np.searchsorted(high, key[0], 'left'), np.searchsorted(high, key[0], 'right')
+            low = columns['entity_low'][lo:hi]
+            lo, hi = lo + np.searchsorted(low, key[1], 'left'), lo + np.searchsorted(low, key[1], 'right')
+            timestamps = columns['timestamp'][lo:hi]
+            if start is not None:
+                lo += np.searchsorted(timestamps, start, 'left')
+            if end is not None:
+                hi = lo + np.searchsorted(columns['timestamp'][lo:hi], end, 'left')
+            columns = {name: values[lo:hi] for name, values in columns.items()}
+            mask = columns['kind'] == EVENT_KINDS[kind]
+        else:
+            mask = columns['kind'] == EVENT_KINDS[kind]
+            if key is not None:
+                mask &= (columns['entity_high'] == key[0]) & (columns['entity_low'] == key[1])
+            if start is not None:
+                mask &= columns['timestamp'] >= start
+            if end is not None:
+                mask &= columns['timestamp'] < end
+        return {name: values[mask] for name, values in columns.items()}
+
+class EventHistory(Sequence):
+    """Append-only list of one entity's events of one kind, read from an EventLog on access.
+
+    Appended entries are recorded in the log. Copies are plain lists, like
+    the shared frozen containers.
+    """
+
+    __slots__ = ('log', 'kind', 'entity')
+
+    def __init__(self, log: EventLog, kind: str, entity: UUID):
+        self.log = log
+        self.kind = kind
+        self.entity = entity
+
+    def __len__(self) -> int:
+        return self.log.count(self.kind, self.entity)
+
+    def __getitem__(self, index):
+        columns = self.log.select(self.kind, self.entity)
+        if isinstance(index, slice):
+            return _entries(self.kind, columns, index)
+        row = range(len(columns['timestamp']))[index]
+        return _entries(self.kind, columns, slice(row, row + 1))[0]
+
+    def __iter__(self):
+        return iter(self.log.entries(self.kind, self.entity))
+
+    def append(self, entry: Dict[str, object]) -> None:
+        """Record one more event."""
+        self.log.adopt(self.kind, self.entity, [entry])
+
+    def extend(self, entries: Iterable[Dict[str, object]]) -> None:
+        """Record several more events."""
+        self.log.adopt(self.kind, self.entity, list(entries))
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Sequence) and list(self) == list(other)
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo) -> list:
+        return copy.deepcopy(list(self), memo)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
@@ -0,0 +1,229 @@
+"""
+Reverse index from realms to the beings and resources placed in them.
+Keeps per-realm membership and stage-sorted views current as entities are placed or moved.
+"""
+import numpy as np
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+class _RealmMembers:
+    """Growable membership list for one realm, backed by NumPy arrays.
+
+    Appends write into arrays with spare capacity. Removal and stage
+    updates find a member through an id -> slot map built on first use;
+    a removed member's slot is only marked dead, and dead slots are
+    compacted away on the next read, so moving members one at a time
+    costs O(1) each instead of a rebuild of the realm.
+    """
+
+    def __init__(self, id_dtype, track_stages: bool):
+        """Initialize an empty membership list."""
+        self._id_dtype = id_dtype
+        self._track_stages = track_stages
+        self._ids = np.empty(0, dtype=id_dtype)
+        self._stages = np.empty(0, dtype=np.int16)
+        self._live = np.empty(0, dtype=bool)
+        self._size = 0  # slots in use, dead ones included
+        self._dead = 0
+        self._slots: Optional[Dict[Hashable, int]] = None
+        self._sorted: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return self._size - self._dead
+
+    def append(self, member_id: Hashable, stage: int = 0) -> None:
+        """Add a single member."""
+        self._reserve(1)
+        slot = self._size
+        self._ids[slot] = member_id
+        self._stages[slot] = stage
+        self._live[slot] = True
+        self._size += 1
+        if self._slots is not None:
+            self._slots[member_id] = slot
+        self._sorted = None
+
+    def extend(self, member_ids: Iterable, stages: Optional[Iterable[int]] = None) -> None:
+        """Add many members at once."""
+        new_ids = np.asarray(member_ids, dtype=self._id_dtype)
+        n = len(new_ids)
+        self._reserve(n)
+        start, stop = self._size, self._size + n
+        self._ids[start:stop] = new_ids
+        self._stages[start:stop] = np.asarray(stages, dtype=np.int16) if self._track_stages else 0
+        self._live[start:stop] = True
+        self._size = stop
+        if self._slots is not None:
+            self._slots.update(zip(new_ids.tolist(), range(start, stop)))
+        self._sorted = None
+
+    def remove(self, member_id: Hashable) -> bool:
+        """Remove a member, returning whether it was present."""
+        slot = self._slot_map().pop(member_id, None)
+        if slot is None:
+            return False
+        self._live[slot] = False
+        self._dead += 1
+        self._sorted = None
+        return True
+
+    def set_stage(self, member_id: Hashable, stage: int) -> None:
+        """Record a new cultivation stage for a member."""
+        slot = self._slot_map().get(member_id)
+        if slot is not None:
+            self._stages[slot] = stage
+            self._sorted = None
+
+    def ids(self) -> np.ndarray:
+        """Return member ids in placement order."""
+        self._compact()
+        return self._ids[:self._size]
+
+    def stages(self) -> np.ndarray:
+        """Return member stage values in placement order."""
+        self._compact()
+        return self._stages[:self._size] if self._track_stages else np.empty(0, dtype=np.int16)
+
+    def stage_sorted(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return member ids and stage values ordered by ascending stage."""
+        if self._sorted is None:
+            ids, stages = self.ids(), self.stages()
+            order = np.argsort(stages, kind='stable')
+            self._sorted = (ids[order], stages[order])
+        return self._sorted
+
+    def _reserve(self, n: int) -> None:
+        """Grow the arrays, doubling their capacity, so n more members fit."""
+        needed = self._size + n
+        if needed <= len(self._ids):
+            return
+        capacity = max(needed, 2 * len(self._ids), 16)
+        for name, dtype in (('_ids', self._id_dtype), ('_stages', np.int16), ('_live', bool)):
+            grown = np.empty(capacity, dtype=dtype)
+            grown[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, grown)
+
+    def _slot_map(self) -> Dict[Hashable, int]:
+        """Return the id -> slot map of live members, building it on first use."""
+        if self._slots is None:
+            live = np.flatnonzero(self._live[:self._size])
+            self._slots = dict(zip(self._ids[live].tolist(), live.tolist()))
+        return self._slots
+
+    def _compact(self) -> None:
+        """Drop dead slots into fresh arrays, keeping placement order."""
+        if not self._dead:
+            return
+        live = self._live[:self._size]
+        self._ids = self._ids[:self._size][live]
+        self._stages = self._stages[:self._size][live]
+        self._size = len(self._ids)
+        self._live = np.ones(self._size, dtype=bool)
+        self._dead = 0
+        self._slots = None
+
+class PopulationIndex:
+    """Maintained mapping of realm -> beings and realm -> resources."""
+
+    def __init__(self, id_dtype=object):
+        """Initialize an empty index whose member ids use the given dtype."""
+        self.id_dtype = id_dtype
+        self._beings: Dict[Hashable, _RealmMembers] = {}
+        self._resources: Dict[Hashable, _RealmMembers] = {}
+
+    def add_being(self, being_id: Hashable, realm_id: Hashable, stage: int) -> None:
+        """Record a being placed in a realm at the given cultivation stage."""
+        self._being_members(realm_id).append(being_id, stage)
+
+    def add_beings(
+        self,
+        being_ids: Iterable,
+        realm_id: Hashable,
+        stages: Iterable[int]
+    ) -> None:
+        """Record a batch of beings placed in the same realm."""
+        self._being_members(realm_id).extend(being_ids, stages)
+
+    def remove_being(self, being_id: Hashable, realm_id: Hashable) -> bool:
+        """Remove a being from a realm's membership."""
+        members = self._beings.get(realm_id)
+        return members.remove(being_id) if members is not None else False
+
+    def move_being(
+        self,
+        being_id: Hashable,
+        from_realm: Hashable,
+        to_realm: Hashable,
+        stage: int
+    ) -> None:
+        """Move a being between realms."""
+        self.remove_being(being_id, from_realm)
+        self.add_being(being_id, to_realm, stage)
+
+    def set_being_stage(self, being_id: Hashable, realm_id: Hashable, stage: int) -> None:
+        """Update the stage recorded for a being after a breakthrough."""
+        self._being_members(realm_id).set_stage(being_id, stage)
+
+    def add_resource(self, resource_id: Hashable, realm_id: Hashable) -> None:
+        """Record a resource placed in a realm."""
+        self._resource_members(realm_id).append(resource_id)
+
+    def remove_resource(self, resource_id: Hashable, realm_id: Hashable) -> bool:
+        """Remove a resource from a realm's membership."""
+        members = self._resources.get(realm_id)
+        return members.remove(resource_id) if members is not None else False
+
+    def move_resource(
+        self,
+        resource_id: Hashable,
+        from_realm: Hashable,
+        to_realm: Hashable
+    ) -> None:
+        """Move a resource between realms."""
+        self.remove_resource(resource_id, from_realm)
+        self.add_resource(resource_id, to_realm)
+
+    def realms(self) -> List[Hashable]:
+        """Return every realm that has ever held a being or resource."""
+        return list(dict.fromkeys([*self._beings, *self._resources]))
+
+    def beings_in(self, realm_id: Hashable) -> np.ndarray:
+        """Return the ids of beings in a realm, in placement order."""
+        members = self._beings.get(realm_id)
+        return members.ids() if members is not None else np.empty(0, dtype=self.id_dtype)
+
+    def being_stages_in(self, realm_id: Hashable) -> np.ndarray:
+        """Return stage values aligned with beings_in(realm_id)."""
+        members = self._beings.get(realm_id)
+        return members.stages() if members is not None else np.empty(0, dtype=np.int16)
+
+    def stage_sorted(self, realm_id: Hashable) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (being ids, stage values) for a realm sorted by ascending stage."""
+        members = self._beings.get(realm_id)
+        if members is None:
+            return np.empty(0, dtype=self.id_dtype), np.empty(0, dtype=np.int16)
+        return members.stage_sorted()
+
+    def resources_in(self, realm_id: Hashable) -> np.ndarray:
+        """Return the ids of resources in a realm, in placement order."""
+        members = self._resources.get(realm_id)
+        return members.ids() if members is not None else np.empty(0, dtype=self.id_dtype)
+
+    def being_count(self, realm_id: Hashable) -> int:
+        """Return the number of beings in a realm."""
+        members = self._beings.get(realm_id)
+        return len(members) if members is not None else 0
+
+    def resource_count(self, realm_id: Hashable) -> int:
+        """Return the number of resources in a realm."""
+        members = self._resources.get(realm_id)
+        return len(members) if members is not None else 0
+
+    def _being_members(self, realm_id: Hashable) -> _RealmMembers:
+        if realm_id not in self._beings:
+            self._beings[realm_id] = _RealmMembers(self.id_dtype, track_stages=True)
+        return self._beings[realm_id]
+
+    def _resource_members(self, realm_id: Hashable) -> _RealmMembers:
+        if realm_id not in self._resources:
+            self._resources[realm_id] = _RealmMembers(self.id_dtype, track_stages=False)
+        return self._resources[realm_id]
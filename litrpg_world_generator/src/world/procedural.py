@@ -0,0 +1,207 @@
+"""
+Procedural world with on-demand beings.
+Defines every being by its realm and index and regenerates it from a counter-based random stream when it is accessed.
+"""
+from collections import OrderedDict
+from collections.abc import Mapping
+import numpy as np
+from typing import Dict, Iterator, List, Tuple, Union
+from uuid import UUID
+
+from .ids import IdAllocator
+from .simulation import combat_power, row_totals
+from ..clock import WorldClock, using_clock
+from ..generators.being_batch import BeingBatch, build_being
+from ..generators.being_generator import BeingGenerator
+from ..generators.realm_generator import RealmGenerator
+from ..generators.base_generator import SeedLike
+from ..models.being import Being
+from ..models.realm import Realm
+from ..constants import BEING_VOCABULARY, CultivationStage, POPULATION_DISTRIBUTION, RealmTier
+
+# A being is addressed by its position in the whole world, by (realm id, index in realm) or by its id
+BeingKey = Union[int, Tuple[UUID, int], UUID]
+
+class ProceduralWorld:
+    """A world whose beings exist only as (realm, index) until they are read.
+
+    Each realm's population is split into fixed-size blocks. Block b of a
+    realm is drawn in one vectorized generate_beings call from a Philox
+    stream keyed by the realm's seed with b in the high counter words, so
+    any block can be produced directly and always comes out the same.
+    Recently used blocks and built models are kept in bounded LRU caches.
+    Relationships and resources are not generated in this mode.
+    """
+
+    def __init__(
+        self,
+        seed: SeedLike = None,
+        num_realms: int = 6,
+        beings_per_realm: int = 1000,
+        block_size: int = 1024,
+        cache_size: int = 4096,
+        block_cache_size: int = 16
+    ):
+        """Generate the realms and the per-realm stream keys; no being is drawn yet."""
+        if block_size < 1:
+            raise ValueError(f"Block size must be at least 1, got {block_size}")
+        realm_seed, being_seed = np.random.SeedSequence(seed).spawn(2)
+        realm_generator = RealmGenerator(realm_seed)
+        # Being ids are derived from world positions, so they repeat with the seed;
+        # the tag comes from the being stream so they differ from WorldGenerator ids
+        self.ids = IdAllocator(being_seed)
+        tiers = list(RealmTier)[:num_realms]
+        self.realms: Dict[UUID, Realm] = {}
+        for tier in tiers:
+            realm = realm_generator.generate_realm(tier=tier)
+            realm.id = self.ids.new_uuid('realm')
+            self.realms[realm.id] = realm
+        self.realm_ids: List[UUID] = list(self.realms)
+        self.populations = np.array(
+            [int(beings_per_realm * POPULATION_DISTRIBUTION[tier]) for tier in tiers],
+            dtype=np.int64
+        )
+        self._offsets = np.concatenate([[0], np.cumsum(self.populations)])
+        self._keys = [child.generate_state(2, np.uint64) for child in being_seed.spawn(len(tiers))]
+        self._realm_index = {realm_id: k for k, realm_id in enumerate(self.realm_ids)}
+        self.block_size = block_size
+        self.clock = WorldClock()
+        self.creation_date = self.clock.now
+        self.cache_size = cache_size
+        self.block_cache_size = block_cache_size
+        self._models: 'OrderedDict[Tuple[int, int], Being]' = OrderedDict()
+        self._blocks: 'OrderedDict[Tuple[int, int], BeingBatch]' = OrderedDict()
+        self.beings = _ProceduralBeings(self)
+
+    def __len__(self) -> int:
+        return int(self._offsets[-1])
+
+    def locate(self, key: BeingKey) -> Tuple[int, int]:
+        """Return (realm position, index in realm) for a being key, raising KeyError if out of range."""
+        if isinstance(key, UUID):
+            decoded = self.ids.decode(key)
+            if decoded is None or decoded[0] != 'being':
+                raise KeyError(key)
+            key = decoded[1]
+        if isinstance(key, tuple):
+            realm_id, index = key
+            if realm_id not in self._realm_index:
+                raise KeyError(key)
+            realm = self._realm_index[realm_id]
+        else:
+            if not 0 <= key < len(self):
+                raise KeyError(key)
+            realm = int(np.searchsorted(self._offsets, key, side='right')) - 1
+            index = key - int(self._offsets[realm])
+        if not 0 <= index < self.populations[realm]:
+            raise KeyError(key)
+        return realm, int(index)
+
+    def being_id(self, realm: int, index: int) -> UUID:
+        """Return the stable UUID of a being, derived from the seed and its world position."""
+        return self.ids.uuid('being', int(self._offsets[realm]) + index)
+
+    def block(self, realm: int, block: int) -> BeingBatch:
+        """Return the columns of one block of a realm, generating them on a cache miss."""
+        cache_key = (realm, block)
+        if cache_key in self._blocks:
+            self._blocks.move_to_end(cache_key)
+            return self._blocks[cache_key]
+        batch = self._generate_block(realm, block)
+        self._blocks[cache_key] = batch
+        if len(self._blocks) > self.block_cache_size:
+            self._blocks.popitem(last=False)
+        return batch
+
+    def being(self, key: BeingKey) -> Being:
+        """Return a being, building it from its block on first access."""
+        realm, index = self.locate(key)
+        cache_key = (realm, index)
+        if cache_key in self._models:
+            self._models.move_to_end(cache_key)
+            return self._models[cache_key]
+        block, row = divmod(index, self.block_size)
+        columns = self.block(realm, block).columns
+        with using_clock(self.clock):
+            being = build_being(
+                {name: values[row] for name, values in columns.items()},
+                self.creation_date,
+                id=self.being_id(realm, index)
+            )
+        self._models[cache_key] = being
+        if len(self._models) > self.cache_size:
+            self._models.popitem(last=False)
+        return being
+
+    def iter_blocks(self, realm: int) -> Iterator[BeingBatch]:
+        """Yield every block of a realm in order, leaving the block cache as it is."""
+        for block in range((int(self.populations[realm]) + self.block_size - 1) // self.block_size):
+            cached = self._blocks.get((realm, block))
+            yield cached if cached is not None else self._generate_block(realm, block)
+
+    def _generate_block(self, realm: int, block: int) -> BeingBatch:
+        """Draw one block of a realm from its own Philox stream."""
+        start = block * self.block_size
+        stream = np.random.Philox(key=self._keys[realm], counter=[0, 0, block, 0])
+        generator = BeingGenerator(stream)
+        generator.current_time = self.creation_date
+        return generator.generate_beings(
+            min(self.block_size, int(self.populations[realm]) - start),
+            initial_realm=self.realms[self.realm_ids[realm]].tier
+        )
+
+    def summary(self) -> Dict[str, object]:
+        """Return population statistics per realm, computed block by block from the columns."""
+        races = BEING_VOCABULARY['races']
+        realms = {}
+        for realm, realm_id in enumerate(self.realm_ids):
+            stages = np.zeros(len(CultivationStage) + 1, dtype=np.int64)
+            race_counts = np.zeros(len(races), dtype=np.int64)
+            power_total = age_total = 0.0
+            power_max = -np.inf
+            for batch in self.iter_blocks(realm):
+                stages += np.bincount(batch['stage'], minlength=len(stages))[:len(stages)]
+                race_counts += np.bincount(batch['race'], minlength=len(races))
+                power = combat_power(
+                    batch['base_power'],
+                    batch['realm'],
+                    row_totals(batch['technique_mastery']),
+                    batch['soul_strength']
+                )
+                power_total += power.sum()
+                power_max = max(power_max, power.max())
+                age_total += batch['age'].sum()
+            population = int(self.populations[realm])
+            realms[str(realm_id)] = {
+                'name': self.realms[realm_id].name,
+                'tier': self.realms[realm_id].tier.name,
+                'population': population,
+                'stages': {
+                    stage.name: int(stages[stage.value])
+                    for stage in CultivationStage if stages[stage.value]
+                },
+                'races': {race: int(n) for race, n in zip(races, race_counts) if n},
+                'mean_age': age_total / population if population else None,
+                'mean_combat_power': power_total / population if population else None,
+                'max_combat_power': float(power_max) if population else None
+            }
+        return {'population': len(self), 'realms': realms}
+
+class _ProceduralBeings(Mapping):
+    """Read-only being-key -> Being mapping over a procedural world.
+
+    Iteration yields world positions; indexing also accepts
+    (realm id, index) pairs and being ids.
+    """
+
+    def __init__(self, world: ProceduralWorld):
+        self._world = world
+
+    def __getitem__(self, key: BeingKey) -> Being:
+        return self._world.being(key)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self._world)))
+
+    def __len__(self) -> int:
+        return len(self._world)
@@ -0,0 +1,36 @@
+"""
+Ranking queries over population arrays.
+Top-k selection, percentile bands and stage histograms computed on whole columns without sorting them.
+"""
+import numpy as np
+from typing import Dict, Sequence
+
+from ..constants import CultivationStage
+
+def top_k(values: np.ndarray, k: int) -> np.ndarray:
+    """Return the positions of the k largest values, largest first.
+
+    argpartition finds the k largest in linear time; only those k are
+    then sorted, so the cost barely depends on k for large arrays.
+    """
+    values = np.asarray(values)
+    k = min(max(k, 0), len(values))
+    if k == 0:
+        return np.empty(0, dtype=np.int64)
+    if k < len(values):
+        top = np.argpartition(values, len(values) - k)[len(values) - k:]
+    else:
+        top = np.arange(len(values))
+    return top[np.argsort(values[top], kind='stable')[::-1]]
+
+def percentile_bands(values: np.ndarray, percentiles: Sequence[float]) -> Dict[float, float]:
+    """Return the value at each percentile; empty populations give an empty dict."""
+    values = np.asarray(values)
+    if not len(values):
+        return {}
+    return dict(zip(percentiles, np.percentile(values, percentiles).tolist()))
+
+def stage_histogram(stages: np.ndarray) -> Dict[str, int]:
+    """Return the number of beings at each cultivation stage that occurs."""
+    counts = np.bincount(np.asarray(stages, dtype=np.int64), minlength=len(CultivationStage) + 1)
+    return {stage.name: int(counts[stage.value]) for stage in CultivationStage if counts[stage.value]}
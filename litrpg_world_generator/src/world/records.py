@@ -0,0 +1,302 @@
+"""
+Slotted record backend for the world generator.
+Keeps each being as a compact record of generated values and builds pydantic models only at API and export boundaries.
+"""
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+import numpy as np
+from typing import Dict, Iterator, List, Optional, Sequence
+from uuid import UUID
+
+from .events import EventLog, entity_words
+from .ids import IdAllocator
+from .relationship_graph import RelationshipGraph
+from .simulation import (
+    apply_karma,
+    breakthrough_due,
+    combat_power,
+    tick_years,
+    tribulation_difficulty
+)
+from .stores import ModelStore
+from ..clock import WorldClock
+from ..generators.being_batch import BeingBatch, KEYED_COLUMNS, build_being, encode_beings
+from ..constants import BEING_STARTING_KIT
+from ..models.being import Being
+from ..models.shared import EMPTY_DICT, peek
+
+# Generated values held by a record, named after the BeingBatch columns they come from
+RECORD_COLUMNS = (
+    'name_prefix', 'name_suffix', 'name_number', 'race', 'age',
+    'bloodline_name', 'bloodline_strength', 'bloodline_purity', 'bloodline_mutation',
+    'bloodline_traits', 'stage', 'realm', 'foundation_quality', 'cultivation_speed',
+    'bottleneck_threshold', 'comprehension_rate', 'soul_strength', 'soul_purity',
+    'soul_stability', 'dao_marks', 'base_power', 'battle_experience', 'special_moves',
+    'storage_rings', 'fate_value', 'karmic_debt', 'fortune', 'tribulation_counter',
+    'measurement_accuracy', 'data_reliability', 'hidden_attributes',
+    *KEYED_COLUMNS
+)
+
+# Shared stand-ins for containers a being has not filled yet
+_NO_LINKS = EMPTY_DICT
+_NONE = ()
+
+class BeingRecord:
+    """One being as flat slots instead of a tree of pydantic models.
+
+    Names, races and traits stay as codes into the shared vocabularies,
+    keyed dicts become tuples aligned with KEYED_COLUMNS and the per-being
+    containers point at shared empty values until something is added.
+    """
+
+    __slots__ = (
+        'id', 'created', *RECORD_COLUMNS,
+        'last_breakthrough', 'tribulation_history',
+        'master_id', 'disciples', 'allies', 'enemies', 'artifacts'
+    )
+
+    def __init__(self, being_id: UUID, created: datetime, values: Sequence):
+        """Initialize a record from values ordered like RECORD_COLUMNS."""
+        self.id = being_id
+        self.created = created
+        for name, value in zip(RECORD_COLUMNS, values):
+            setattr(self, name, value)
+        self.last_breakthrough: Optional[datetime] = None
+        self.tribulation_history = _NONE
+        self.master_id: Optional[UUID] = None
+        self.disciples = _NONE
+        self.allies = _NO_LINKS
+        self.enemies = _NO_LINKS
+        self.artifacts = _NO_LINKS
+
+    def row(self) -> Dict[str, object]:
+        """Return the record's generated values keyed by column name."""
+        return {name: getattr(self, name) for name in RECORD_COLUMNS}
+
+    def to_model(self) -> Being:
+        """Build the Being model for this record."""
+        being = build_being(
+            self.row(),
+            self.created,
+            id=self.id,
+            last_breakthrough=self.last_breakthrough,
+            tribulation_history=list(self.tribulation_history),
+            master_id=self.master_id,
+            disciples=list(self.disciples),
+            allies=dict(self.allies),
+            enemies=dict(self.enemies)
+        )
+        if self.artifacts:
+            being.inventory.artifacts.update(self.artifacts)
+        if not float(self.age).is_integer():
+            being.age = self.age  # aged beings carry fractional years, as in the model path
+        return being
+
+def records_from_columns(
+    columns: Dict[str, np.ndarray],
+    ids: Sequence[UUID],
+    created: Sequence[datetime]
+) -> List[BeingRecord]:
+    """Build records from batch-style columns, converting each column in one pass."""
+    n = len(ids)
+    lists = []
+    for name in RECORD_COLUMNS:
+        if name not in columns:
+            lists.append([0] * n)  # only tribulation_counter is ever absent
+        elif name in KEYED_COLUMNS:
+            lists.append(list(map(tuple, columns[name].tolist())))
+        else:
+            lists.append(columns[name].tolist())
+    return [
+        BeingRecord(being_id, when, values)
+        for being_id, when, values in zip(ids, created, zip(*lists))
+    ]
+
+class RecordStore(ModelStore):
+    """Store that keeps beings as slotted records keyed by UUID.
+
+    Resources stay pydantic models as in ModelStore. `beings` is a
+    read-only view that builds a model on access, so changes to a returned
+    model are not written back.
+    """
+
+    def __init__(self, ids: Optional[IdAllocator] = None, events: Optional[EventLog] = None):
+        """Initialize empty record and resource dicts and the population index."""
+        super().__init__(ids, events)
+        self.records: Dict[UUID, BeingRecord] = {}
+        self.beings = _RecordView(self.records)
+
+    def add_beings(self, batch: BeingBatch, realm_id: UUID) -> None:
+        """Store a batch of generated beings as records placed in one realm."""
+        ids = self.ids.new_uuids('being', len(batch))
+        records = records_from_columns(batch.columns, ids, [batch.creation_date] * len(ids))
+        self._place(records, realm_id)
+
+    def place_beings(self, beings: List[Being], realm_id: UUID) -> None:
+        """Store already-built beings as records, keeping their links and history."""
+        records = records_from_columns(
+            encode_beings(beings),
+            [being.id for being in beings],
+            [being.creation_date for being in beings]
+        )
+        kit = BEING_STARTING_KIT['artifacts']
+        for record, being in zip(records, beings):
+            record.last_breakthrough = being.last_breakthrough
+            record.master_id = being.master_id
+            history = peek(being, 'tribulation_history')
+            if history:
+                record.tribulation_history = self.events.adopt('tribulation', being.id, history)
+            if being.disciples:
+                record.disciples = list(being.disciples)
+            for kind in RelationshipGraph.KINDS:
+                if getattr(being, kind):
+                    setattr(record, kind, dict(getattr(being, kind)))
+            artifacts = {
+                name: grade for name, grade in peek(being.inventory, 'artifacts').items()
+                if kit.get(name) != grade
+            }
+            if artifacts:
+                record.artifacts = artifacts
+        self._place(records, realm_id)
+
+    def place_being(self, being: Being, realm_id: UUID) -> None:
+        """Store a single being as a record and record its location."""
+        self.place_beings([being], realm_id)
+
+    def move_being(self, being_id: UUID, realm_id: UUID) -> None:
+        """Move a being to another realm."""
+        self.index.move_being(
+            being_id,
+            self.being_locations[being_id],
+            realm_id,
+            self.records[being_id].stage
+        )
+        self.being_locations[being_id] = realm_id
+
+    def being(self, handle: UUID) -> Being:
+        return self.records[handle].to_model()
+
+    def combat_powers(self, handles: np.ndarray) -> np.ndarray:
+        records = [self.records[handle] for handle in handles]
+        return self._combat_power(records)
+
+    def being_profiles(self, handles: np.ndarray) -> Dict[str, np.ndarray]:
+        records = [self.records[handle] for handle in handles]
+        n = len(records)
+        return {
+            'stage': np.fromiter((r.stage for r in records), np.int64, n),
+            'race': np.fromiter((r.race for r in records), np.int64, n),
+            'age': np.fromiter((r.age for r in records), np.float64, n),
+            'combat_power': self._combat_power(records)
+        }
+
+    def set_master(self, disciple: UUID, master: UUID) -> None:
+        self.records[disciple].master_id = master
+        record = self.records[master]
+        if record.disciples is _NONE:
+            record.disciples = []
+        record.disciples.append(disciple)
+
+    def link(self, kind: str, first: UUID, second: UUID, weight: float) -> None:
+        for a, b in ((first, second), (second, first)):
+            record = self.records[a]
+            if getattr(record, kind) is _NO_LINKS:
+                setattr(record, kind, {})
+            getattr(record, kind)[b] = weight
+
+    def give_artifact(self, owner: UUID, resource: UUID) -> None:
+        item = self.resources[resource]
+        self.artifact_owners[resource] = owner
+        record = self.records[owner]
+        if record.artifacts is _NO_LINKS:
+            record.artifacts = {}
+        record.artifacts[item.name] = item.quality_metrics.base_grade
+
+    def relationship_graph(self) -> RelationshipGraph:
+        """Build a graph snapshot of the relationships held in the records."""
+        return self._graph_from(list(self.records.values()))
+
+    def advance_beings(self, time_delta: timedelta, clock: WorldClock) -> None:
+        """Resolve the breakthroughs that are due, then run the karma kernels over the record slots."""
+        records = list(self.records.values())
+        if not records:
+            return
+        now = clock.now
+        n = len(records)
+
+        due = self._due_breakthroughs(clock)
+        candidates = [self.records[handle] for handle in due.tolist()]
+        count = len(candidates)
+        power = self._combat_power(candidates)
+        stage = np.fromiter((r.stage for r in candidates), np.int64, count)
+        difficulty = tribulation_difficulty(
+            stage,
+            np.fromiter((r.fate_value for r in candidates), np.float64, count)
+        )
+        for record in candidates:
+            if record.tribulation_history is _NONE:
+                record.tribulation_history = self.events.view('tribulation', record.id)
+            record.last_breakthrough = now
+        self.events.append(
+            'tribulation',
+            entity_words(due.tolist()),
+            now,
+            np.column_stack((power, difficulty)),
+            stage
+        )
+        self._breakthroughs.schedule(due, self._breakthrough_due(due))
+
+        fate = np.fromiter((r.fate_value for r in records), np.float64, n)
+        fortune = np.fromiter((r.fortune for r in records), np.float64, n)
+        counter = np.fromiter((r.tribulation_counter for r in records), np.int64, n)
+        apply_karma(fate, fortune, counter, 0.001 * time_delta.days)
+        years = tick_years(time_delta.days)
+        for record, *karma in zip(records, fate.tolist(), fortune.tolist(), counter.tolist()):
+            record.age += years
+            record.fate_value, record.fortune, record.tribulation_counter = karma
+
+    def _breakthrough_due(self, handles: np.ndarray) -> np.ndarray:
+        """Return when each of the given records may next attempt a breakthrough."""
+        records = [self.records[handle] for handle in handles.tolist()]
+        n = len(records)
+        # Insights are never recorded on records, so only first breakthroughs are ever due
+        return breakthrough_due(
+            np.array([r.last_breakthrough for r in records], dtype='datetime64[us]'),
+            0,
+            np.fromiter((r.foundation_quality for r in records), np.float64, n),
+            np.fromiter((r.bottleneck_threshold for r in records), np.float64, n)
+        )
+
+    def _place(self, records: List[BeingRecord], realm_id: UUID) -> None:
+        """Store records placed in the same realm."""
+        ids = [record.id for record in records]
+        self._breakthroughs = None
+        self.records.update(zip(ids, records))
+        self.being_locations.update(dict.fromkeys(ids, realm_id))
+        self.index.add_beings(ids, realm_id, [record.stage for record in records])
+
+    @staticmethod
+    def _combat_power(records: List[BeingRecord]) -> np.ndarray:
+        """Return the combat power of several records."""
+        n = len(records)
+        return combat_power(
+            np.fromiter((r.base_power for r in records), np.float64, n),
+            np.fromiter((r.realm for r in records), np.int64, n),
+            np.fromiter((sum(r.technique_mastery) for r in records), np.float64, n),
+            np.fromiter((r.soul_strength for r in records), np.float64, n)
+        )
+
+class _RecordView(Mapping):
+    """Read-only UUID -> Being mapping that builds models from records on access."""
+
+    def __init__(self, records: Dict[UUID, BeingRecord]):
+        self._records = records
+
+    def __getitem__(self, key: UUID) -> Being:
+        return self._records[key].to_model()
+
+    def __iter__(self) -> Iterator[UUID]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
@@ -0,0 +1,227 @@
+"""
+Relationship graph over integer being indices.
+Stores ally/enemy edges and master links in typed arrays and answers queries through CSR adjacency views.
+"""
+import numpy as np
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .tables import ROW_DTYPE, ColumnTable
+
+EDGE_SCHEMA = {
+    'first': (ROW_DTYPE, (), 0),
+    'second': (ROW_DTYPE, (), 0),
+    'weight': (np.float32, (), 0)
+}
+
+MASTER_SCHEMA = {
+    'master': (ROW_DTYPE, (), -1)
+}
+
+# Edges written per chunk by write_edge_lists
+EDGE_LIST_CHUNK = 100_000
+
+def _gather(indptr: np.ndarray, values: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+    """Concatenate the CSR rows of several nodes without a Python loop."""
+    starts = indptr[nodes]
+    counts = indptr[nodes + 1] - starts
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    return values[offsets + np.arange(counts.sum())]
+
+class RelationshipGraph:
+    """Symmetric ally/enemy edges and master links with lazily built CSR views.
+
+    Edges are appended to per-kind tables; the CSR arrays (`indptr`,
+    `indices`, `weights`) are rebuilt on the first query after a change.
+    Every node's row lists its neighbors in the order the edges were added.
+    A pair linked twice keeps both edges; materialized models keep the
+    later weight, as repeated dict assignment would.
+    """
+
+    KINDS = ('allies', 'enemies')
+
+    def __init__(self):
+        """Initialize an empty graph with no nodes."""
+        self.edges: Dict[str, ColumnTable] = {kind: ColumnTable(EDGE_SCHEMA) for kind in self.KINDS}
+        self._masters = ColumnTable(MASTER_SCHEMA)
+        self._csr: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._disciples: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    @classmethod
+    def from_arrays(
+        cls,
+        masters: np.ndarray,
+        edges: Dict[str, Dict[str, np.ndarray]]
+    ) -> 'RelationshipGraph':
+        """Build a graph from a master column and per-kind edge columns."""
+        graph = cls()
+        graph._masters = ColumnTable.from_columns(MASTER_SCHEMA, {'master': masters})
+        for kind, columns in edges.items():
+            graph.edges[kind] = ColumnTable.from_columns(EDGE_SCHEMA, columns)
+        return graph
+
+    def __len__(self) -> int:
+        return len(self._masters)
+
+    @property
+    def masters(self) -> np.ndarray:
+        """Master index per node, -1 where a node has no master."""
+        return self._masters['master']
+
+    def add_nodes(self, count: int) -> None:
+        """Append `count` nodes with no master and no edges."""
+        self._masters.append({}, count)
+        self._invalidate()
+
+    def add_edge(self, kind: str, first: int, second: int, weight: float) -> None:
+        """Record a symmetric relationship between two nodes."""
+        self.edges[kind].append({'first': first, 'second': second, 'weight': weight}, 1)
+        self._csr.pop(kind, None)
+
+    def add_edges(
+        self,
+        kind: str,
+        first: np.ndarray,
+        second: np.ndarray,
+        weight: np.ndarray
+    ) -> None:
+        """Record many symmetric relationships at once."""
+        if len(first):
+            self.edges[kind].append({'first': first, 'second': second, 'weight': weight})
+            self._csr.pop(kind, None)
+
+    def set_master(self, disciple: int, master: int) -> None:
+        """Make `master` the master of `disciple`, replacing any earlier one."""
+        self._masters.writable('master')[disciple] = master
+        self._disciples = None
+
+    def set_masters(self, disciples: np.ndarray, masters: np.ndarray) -> None:
+        """Assign masters to many disciples at once."""
+        self._masters.writable('master')[disciples] = masters
+        self._disciples = None
+
+    def csr(self, kind: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (indptr, indices, weights) for one relationship kind."""
+        if kind not in self._csr:
+            table = self.edges[kind]
+            first, second = table['first'], table['second']
+            endpoints = np.concatenate([first, second])
+            # Sorting by (endpoint, edge number) keeps each row in insertion order;
+            # a single int64 key sorts much faster than a lexsort
+            count = len(first)
+            key = endpoints.astype(np.int64) * max(count, 1) + np.tile(np.arange(count), 2)
+            order = np.argsort(key)
+            indptr = np.zeros(len(self) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(endpoints, minlength=len(self)), out=indptr[1:])
+            self._csr[kind] = (
+                indptr,
+                np.concatenate([second, first])[order].astype(ROW_DTYPE, copy=False),
+                np.concatenate([table['weight'], table['weight']])[order]
+            )
+        return self._csr[kind]
+
+    def neighbors(self, kind: str, node: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (neighbor indices, weights) of a node."""
+        indptr, indices, weights = self.csr(kind)
+        return indices[indptr[node]:indptr[node + 1]], weights[indptr[node]:indptr[node + 1]]
+
+    def degree(self, kind: str) -> np.ndarray:
+        """Return the number of relationships of each kind per node."""
+        return np.diff(self.csr(kind)[0])
+
+    def disciples_of(self, node: int) -> np.ndarray:
+        """Return the disciples of a node in index order."""
+        indptr, disciples = self._disciple_csr()
+        return disciples[indptr[node]:indptr[node + 1]]
+
+    def sect_tree(self, root: int, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (nodes, levels) of the master-disciple tree below `root`.
+
+        Level 0 is the root itself; `depth` limits how many generations of
+        disciples are followed (all of them when None).
+        """
+        indptr, disciples = self._disciple_csr()
+        frontier = np.array([root], dtype=ROW_DTYPE)
+        nodes, levels = [frontier], [np.zeros(1, dtype=np.int32)]
+        level = 0
+        while len(frontier) and (depth is None or level < depth):
+            frontier = _gather(indptr, disciples, frontier)
+            # Guard against cycles left by arbitrary set_master calls
+            frontier = frontier[~np.isin(frontier, np.concatenate(nodes))]
+            level += 1
+            nodes.append(frontier)
+            levels.append(np.full(len(frontier), level, dtype=np.int32))
+        return np.concatenate(nodes), np.concatenate(levels)
+
+    def mutual_enemies(self, first: int, second: int) -> np.ndarray:
+        """Return the nodes that are enemies of both `first` and `second`."""
+        return np.intersect1d(
+            self.neighbors('enemies', first)[0],
+            self.neighbors('enemies', second)[0]
+        )
+
+    def nbytes(self) -> int:
+        """Return the bytes held by edge tables and cached CSR views."""
+        tables = [self._masters, *self.edges.values()]
+        cached = [array for views in self._csr.values() for array in views]
+        if self._disciples is not None:
+            cached.extend(self._disciples)
+        return sum(t.nbytes() for t in tables) + sum(a.nbytes for a in cached)
+
+    def write_edge_lists(
+        self,
+        directory: Path,
+        labels: Callable[[np.ndarray], Sequence[str]],
+        opener: Callable = open,
+        suffix: str = ''
+    ) -> List[Path]:
+        """Write allies, enemies and disciples as CSV edge lists; return the paths.
+
+        `labels` maps an array of node indices to the identifiers written
+        in the files. Edges are written in fixed-size chunks.
+        """
+        directory = Path(directory)
+        paths = []
+        for kind in self.KINDS:
+            table = self.edges[kind]
+            path = directory / f"{kind}.csv{suffix}"
+            with opener(path, 'wt', encoding='utf-8') as f:
+                f.write("first,second,weight\n")
+                for start in range(0, len(table), EDGE_LIST_CHUNK):
+                    stop = start + EDGE_LIST_CHUNK
+                    rows = zip(
+                        labels(table['first'][start:stop]),
+                        labels(table['second'][start:stop]),
+                        table['weight'][start:stop].astype(str)
+                    )
+                    f.writelines(f"{a},{b},{w}\n" for a, b, w in rows)
+            paths.append(path)
+
+        disciples = np.flatnonzero(self.masters >= 0)
+        path = directory / f"disciples.csv{suffix}"
+        with opener(path, 'wt', encoding='utf-8') as f:
+            f.write("master,disciple\n")
+            for start in range(0, len(disciples), EDGE_LIST_CHUNK):
+                chunk = disciples[start:start + EDGE_LIST_CHUNK]
+                rows = zip(labels(self.masters[chunk]), labels(chunk))
+                f.writelines(f"{a},{b}\n" for a, b in rows)
+        paths.append(path)
+        return paths
+
+    def _disciple_csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (indptr, disciples) grouping nodes under their master."""
+        if self._disciples is None:
+            masters = self.masters
+            disciples = np.flatnonzero(masters >= 0)
+            order = np.argsort(masters[disciples], kind='stable')
+            indptr = np.zeros(len(self) + 1, dtype=np.int64)
+            np.cumsum(
+                np.bincount(masters[disciples], minlength=len(self)), out=indptr[1:]
+            )
+            self._disciples = (indptr, disciples[order].astype(ROW_DTYPE))
+        return self._disciples
+
+    def _invalidate(self) -> None:
+        """Drop cached CSR views after the node count changes."""
+        self._csr.clear()
+        self._disciples = None
@@ -0,0 +1,90 @@
+"""
+Event scheduling for the world simulation.
+A calendar queue of entity handles keyed on the simulated time each one next needs attention, so a tick touches only the entities that are due.
+"""
+import heapq
+import numpy as np
+from typing import Callable, Dict, List, Tuple
+
+from ..clock import MICROS_PER_DAY
+
+# Due time of an entity that waits for no further event
+NEVER_DUE = np.iinfo(np.int64).max
+
+class EventQueue:
+    """Calendar queue of handles ordered by the time they fall due.
+
+    Due times are int64 microseconds since the epoch. Events are grouped
+    into buckets `bucket` microseconds wide (a day by default) and a heap
+    holds the bucket keys, so scheduling a batch is one sort and a tick
+    only opens the buckets that have come due, whatever the population.
+    Handles are row numbers or, with dtype=object, ids such as UUIDs.
+    """
+
+    def __init__(self, dtype: np.dtype = np.int64, bucket: int = MICROS_PER_DAY):
+        """Initialize an empty queue of handles of the given dtype."""
+        self.dtype = np.dtype(dtype)
+        self.bucket = bucket
+        self._buckets: Dict[int, List[Tuple[np.ndarray, np.ndarray]]] = {}
+        self._keys: List[int] = []  # heap of bucket keys
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def schedule(self, handles: np.ndarray, due: np.ndarray) -> None:
+        """Queue each handle for its due time; handles that are NEVER_DUE are left out."""
+        handles = np.asarray(handles, dtype=self.dtype)
+        due = np.asarray(due, dtype=np.int64)
+        waiting = due != NEVER_DUE
+        handles, due = handles[waiting], due[waiting]
+        if not len(due):
+            return
+        keys = due // self.bucket
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        ends = np.append(starts[1:], len(keys))
+        for key, start, end in zip(keys[starts].tolist(), starts.tolist(), ends.tolist()):
+            if key not in self._buckets:
+                self._buckets[key] = []
+                heapq.heappush(self._keys, key)
+            chunk = order[start:end]
+            self._buckets[key].append((handles[chunk], due[chunk]))
+        self._size += len(due)
+
+    def pop_due(self, now: int) -> np.ndarray:
+        """Remove and return the handles due at or before `now`."""
+        handles, due = [], []
+        while self._keys and self._keys[0] <= now // self.bucket:
+            for chunk_handles, chunk_due in self._buckets.pop(heapq.heappop(self._keys)):
+                handles.append(chunk_handles)
+                due.append(chunk_due)
+        if not handles:
+            return np.empty(0, dtype=self.dtype)
+        handles, due = np.concatenate(handles), np.concatenate(due)
+        self._size -= len(due)
+        # The last bucket opened may hold events later in the same day
+        ready = due <= now
+        self.schedule(handles[~ready], due[~ready])
+        return handles[ready]
+
+    def pop_ready(self, now: int, due_of: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+        """Pop the handles due by `now` whose due time, recomputed by `due_of`, has also passed.
+
+        A handle whose state changed since it was queued is queued again
+        for its recomputed time, or dropped when it is NEVER_DUE.
+        """
+        handles = self.pop_due(now)
+        if not len(handles):
+            return handles
+        due = np.asarray(due_of(handles), dtype=np.int64)
+        ready = due <= now
+        self.schedule(handles[~ready], due[~ready])
+        return handles[ready]
+
+    def clear(self) -> None:
+        """Drop every queued event."""
+        self._buckets.clear()
+        self._keys.clear()
+        self._size = 0
@@ -0,0 +1,115 @@
+"""
+Vectorized time-advance kernels for the world simulation.
+Array versions of the per-object rules in Being and Resource, applied to whole populations per tick.
+"""
+from datetime import datetime
+import numpy as np
+from typing import Dict, Union
+
+from .scheduler import NEVER_DUE
+from ..clock import MICROS_PER_DAY
+
+# Mirrors Being.can_breakthrough
+BREAKTHROUGH_COOLDOWN_DAYS = 30
+REQUIRED_INSIGHTS = 3
+
+# datetime64 NaT (never) as an int64
+_NAT = np.iinfo(np.int64).min
+
+# Mirrors Being.update_karma
+KARMA_FORTUNE_FACTOR = 0.1
+KARMA_TRIBULATION_THRESHOLD = 10
+
+def tick_years(days: int) -> float:
+    """Convert whole elapsed days to the fractional years used by every update rule."""
+    return days / 365.25
+
+def breakthrough_due(
+    last_breakthrough: np.ndarray,
+    insight_counts: Union[int, np.ndarray],
+    foundation_quality: np.ndarray,
+    bottleneck_threshold: np.ndarray
+) -> np.ndarray:
+    """Return when each being may next attempt a breakthrough (Being.can_breakthrough).
+
+    Times are int64 microseconds since the epoch. Beings that never broke
+    through are due at once; beings failing the insight or foundation
+    check are NEVER_DUE, since a tick does not change those inputs.
+    """
+    last = np.asarray(last_breakthrough, dtype='datetime64[us]').view(np.int64)
+    # timedelta.days >= 30 holds exactly when 30 whole days of microseconds have passed
+    due = np.where(
+        (np.asarray(insight_counts) >= REQUIRED_INSIGHTS) & (foundation_quality > bottleneck_threshold),
+        last + BREAKTHROUGH_COOLDOWN_DAYS * MICROS_PER_DAY,
+        NEVER_DUE
+    )
+    return np.where(last == _NAT, _NAT, due)
+
+def breakthrough_eligible(
+    last_breakthrough: np.ndarray,
+    now: Union[datetime, np.datetime64],
+    insight_counts: Union[int, np.ndarray],
+    foundation_quality: np.ndarray,
+    bottleneck_threshold: np.ndarray
+) -> np.ndarray:
+    """Return which beings may attempt a breakthrough at `now` (Being.can_breakthrough)."""
+    due = breakthrough_due(last_breakthrough, insight_counts, foundation_quality, bottleneck_threshold)
+    return due <= np.datetime64(now, 'us').astype(np.int64)
+
+def row_totals(values: np.ndarray) -> np.ndarray:
+    """Sum each row of a narrow 2-D column in float64, one column at a time.
+
+    For a handful of columns this is several times faster than
+    sum(axis=1) and adds in the same left-to-right order as Python's sum.
+    """
+    total = values[:, 0].astype(np.float64) if values.shape[1] else np.zeros(len(values))
+    for column in range(1, values.shape[1]):
+        total += values[:, column]
+    return total
+
+def combat_power(
+    base_power: np.ndarray,
+    realm_value: np.ndarray,
+    technique_total: np.ndarray,
+    soul_strength: np.ndarray
+) -> np.ndarray:
+    """Return total combat power (Being.calculate_combat_power)."""
+    return (
+        np.asarray(base_power, dtype=np.float64)
+        * realm_value
+        * (1 + np.asarray(technique_total, dtype=np.float64))
+        * np.asarray(soul_strength, dtype=np.float64)
+    )
+
+def tribulation_difficulty(stage_value: np.ndarray, fate_value: np.ndarray) -> np.ndarray:
+    """Return tribulation difficulty (Being.generate_tribulation)."""
+    return stage_value * (1 + np.abs(fate_value))
+
+def apply_karma(
+    fate_value: np.ndarray,
+    fortune: np.ndarray,
+    tribulation_counter: np.ndarray,
+    magnitude: float
+) -> None:
+    """Apply one karma update in place (Being.update_karma)."""
+    fate_value += magnitude
+    np.clip(fortune + magnitude * KARMA_FORTUNE_FACTOR, -1, 1, out=fortune)
+    tribulation_counter += np.abs(fate_value) > KARMA_TRIBULATION_THRESHOLD
+
+def degrade_resources(
+    columns: Dict[str, np.ndarray],
+    time_passed: float
+) -> None:
+    """Apply natural degradation in place (Resource.degrade).
+
+    `remaining_uses` uses -1 for resources without a usage limit.
+    """
+    degradation = columns['degradation_rate'] * time_passed
+    columns['preservation_state'] *= (1 - degradation)
+    columns['stability'] *= (1 - degradation * 0.5)
+    columns['purity'] *= (1 - degradation * 0.3)
+
+    remaining = columns['remaining_uses']
+    limited = remaining > 0  # None and 0 are both skipped by the model
+    used = (degradation[limited] * 10).astype(np.int64)
+    remaining[limited] = np.maximum(0, remaining[limited] - used)
@@ -0,0 +1,262 @@
+"""
+Incrementally maintained world statistics.
+Keeps population counts, per-realm stage and race histograms and running moments of age and combat power current as entities are placed, moved or aged, so reading them never rescans the world.
+"""
+import numpy as np
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+from .simulation import combat_power, row_totals
+from ..generators.being_batch import BeingBatch
+from ..models.being import Being
+from ..models.realm import Realm
+from ..constants import BEING_VOCABULARY, CultivationStage, RealmTier
+
+# Race name -> the code used in being columns
+RACE_CODES = {race: code for code, race in enumerate(BEING_VOCABULARY['races'])}
+
+_STAGE_NAMES = [(stage.name, stage.value) for stage in CultivationStage]
+
+def batch_profiles(batch: BeingBatch) -> Dict[str, np.ndarray]:
+    """Return the stage, race code, age and combat power of every being in a batch."""
+    return {
+        'stage': batch['stage'],
+        'race': batch['race'],
+        'age': batch['age'],
+        'combat_power': combat_power(
+            batch['base_power'],
+            batch['realm'],
+            row_totals(batch['technique_mastery']),
+            batch['soul_strength']
+        )
+    }
+
+def being_profile(being: Being) -> Dict[str, np.ndarray]:
+    """Return the profile of a single being model, shaped like batch_profiles."""
+    return {
+        'stage': np.array([being.cultivation.stage.value]),
+        'race': np.array([RACE_CODES[being.race]]),
+        'age': np.array([being.age], dtype=np.float64),
+        'combat_power': np.array([being.calculate_combat_power()])
+    }
+
+class Moments:
+    """Count, mean and sum of squared deviations of a stream of values.
+
+    Batches are merged with Chan's parallel update and single values can
+    be taken out again, so the moments follow a population through moves
+    without revisiting it. `shift` adds a constant to every value, which
+    moves the mean and leaves the spread alone.
+    """
+
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def add(self, values: np.ndarray) -> None:
+        """Fold a batch of values in."""
+        values = np.asarray(values, dtype=np.float64)
+        if len(values):
+            mean = float(values.mean())
+            self.merge(Moments(len(values), mean, float(np.square(values - mean).sum())))
+
+    def merge(self, other: 'Moments') -> None:
+        """Fold another set of moments in."""
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+
+    def remove(self, value: float) -> None:
+        """Take one value that was added earlier back out."""
+        if self.count <= 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        mean = (self.count * self.mean - value) / (self.count - 1)
+        self.m2 = max(0.0, self.m2 - (value - self.mean) * (value - mean))
+        self.count -= 1
+        self.mean = mean
+
+    def shift(self, delta: float) -> None:
+        """Add `delta` to every value."""
+        if self.count:
+            self.mean += delta
+
+    def std(self) -> Optional[float]:
+        """Return the population standard deviation, or None when empty."""
+        return float(np.sqrt(self.m2 / self.count)) if self.count else None
+
+    def to_dict(self) -> Dict[str, Optional[float]]:
+        """Return the mean and standard deviation."""
+        return {'mean': self.mean if self.count else None, 'std': self.std()}
+
+class RealmStatistics:
+    """Running population figures for one realm."""
+
+    def __init__(self, name: str, tier: RealmTier):
+        """Initialize empty figures for a realm."""
+        self.name = name
+        self.tier = tier
+        self.beings = 0
+        self.resources = 0
+        self.stages = np.zeros(len(CultivationStage) + 1, dtype=np.int64)
+        self.races = np.zeros(len(RACE_CODES), dtype=np.int64)
+        self.age = Moments()
+        self.combat_power = Moments()
+
+    def add(self, profiles: Dict[str, np.ndarray]) -> None:
+        """Count beings described by batch_profiles-style columns."""
+        self.beings += len(profiles['stage'])
+        self.stages += np.bincount(profiles['stage'], minlength=len(self.stages))[:len(self.stages)]
+        self.races += np.bincount(profiles['race'], minlength=len(self.races))[:len(self.races)]
+        self.age.add(profiles['age'])
+        self.combat_power.add(profiles['combat_power'])
+
+    def remove(self, profile: Dict[str, np.ndarray]) -> None:
+        """Stop counting one being described by being_profile."""
+        self.beings -= 1
+        self.stages[int(profile['stage'][0])] -= 1
+        self.races[int(profile['race'][0])] -= 1
+        self.age.remove(float(profile['age'][0]))
+        self.combat_power.remove(float(profile['combat_power'][0]))
+
+    def to_dict(self) -> Dict[str, object]:
+        """Return the figures in JSON-ready form."""
+        return {
+            'name': self.name,
+            'tier': self.tier.name,
+            'population': self.beings,
+            'resources': self.resources,
+            **_distributions(self.stages, self.races, self.age, self.combat_power)
+        }
+
+class WorldStatistics:
+    """World totals kept current by every insert, move and tick.
+
+    Per-realm counts, stage and race histograms and age and combat power
+    moments are updated from the columns of each placed batch, from the
+    one being or resource a move touches, and by shifting the age mean on
+    each tick (aging is uniform and nothing else a tick changes is
+    tracked), so reading them costs the same at any population. World
+    totals are merged from the realms on read; there are at most one per
+    RealmTier.
+    """
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.realms: Dict[Hashable, RealmStatistics] = {}
+        self.ticks = 0
+        self.days = 0  # simulated days advanced
+        self.tribulations = 0
+        self.stabilizations = 0
+        self.being_moves = 0
+        self.resource_moves = 0
+
+    @property
+    def population(self) -> int:
+        """The number of beings in the world."""
+        return sum(realm.beings for realm in self.realms.values())
+
+    @property
+    def resources(self) -> int:
+        """The number of resources in the world."""
+        return sum(realm.resources for realm in self.realms.values())
+
+    def add_realm(self, realm: Realm) -> None:
+        """Start counting a new realm."""
+        self.realms[realm.id] = RealmStatistics(realm.name, realm.tier)
+
+    def add_beings(self, realm_id: Hashable, profiles: Dict[str, np.ndarray]) -> None:
+        """Count beings placed in a realm."""
+        self.realms[realm_id].add(profiles)
+
+    def move_being(self, from_realm: Hashable, to_realm: Hashable, profile: Dict[str, np.ndarray]) -> None:
+        """Count one being, described by being_profile, in its new realm instead of its old one."""
+        self.realms[from_realm].remove(profile)
+        self.realms[to_realm].add(profile)
+        self.being_moves += 1
+
+    def add_resources(self, realm_id: Hashable, count: int = 1) -> None:
+        """Count resources placed in a realm."""
+        self.realms[realm_id].resources += count
+
+    def move_resource(self, from_realm: Hashable, to_realm: Hashable) -> None:
+        """Count one resource in its new realm instead of its old one."""
+        self.realms[from_realm].resources -= 1
+        self.realms[to_realm].resources += 1
+        self.resource_moves += 1
+
+    def tick(self, days: int, years: float, tribulations: int = 0, stabilizations: int = 0) -> None:
+        """Record one time step that aged every being by `years`."""
+        for realm in self.realms.values():
+            realm.age.shift(years)
+        self.ticks += 1
+        self.days += days
+        self.tribulations += tribulations
+        self.stabilizations += stabilizations
+
+    def tier_counts(self) -> Dict[str, int]:
+        """Return the number of realms of each tier that occurs."""
+        counts = np.bincount(
+            [realm.tier.value for realm in self.realms.values()],
+            minlength=len(RealmTier) + 1
+        )
+        return {tier.name: int(counts[tier.value]) for tier in RealmTier if counts[tier.value]}
+
+    def stage_histogram(self, realm_id: Optional[Hashable] = None) -> Dict[str, int]:
+        """Count the beings at each cultivation stage in one realm or the whole world."""
+        realms = self.realms.values() if realm_id is None else [self.realms[realm_id]]
+        return _named_counts(_total((realm.stages for realm in realms), len(CultivationStage) + 1), _STAGE_NAMES)
+
+    def to_dict(self) -> Dict[str, object]:
+        """Return every figure in JSON-ready form."""
+        realms = list(self.realms.values())
+        age, power = Moments(), Moments()
+        for realm in realms:
+            age.merge(realm.age)
+            power.merge(realm.combat_power)
+        return {
+            'population': self.population,
+            'resources': self.resources,
+            'realm_tiers': self.tier_counts(),
+            **_distributions(
+                _total((realm.stages for realm in realms), len(CultivationStage) + 1),
+                _total((realm.races for realm in realms), len(RACE_CODES)),
+                age,
+                power
+            ),
+            'counters': {
+                'ticks': self.ticks,
+                'days': self.days,
+                'tribulations': self.tribulations,
+                'stabilizations': self.stabilizations,
+                'being_moves': self.being_moves,
+                'resource_moves': self.resource_moves
+            },
+            'realms': {str(realm_id): realm.to_dict() for realm_id, realm in self.realms.items()}
+        }
+
+def _total(histograms: Iterable[np.ndarray], size: int) -> np.ndarray:
+    """Add up histograms of length `size`."""
+    total = np.zeros(size, dtype=np.int64)
+    for histogram in histograms:
+        total += histogram
+    return total
+
+def _named_counts(counts: np.ndarray, names: Iterable[Tuple[str, int]]) -> Dict[str, int]:
+    """Return the nonzero counts keyed by name."""
+    return {name: int(counts[code]) for name, code in names if counts[code]}
+
+def _distributions(stages: np.ndarray, races: np.ndarray, age: Moments, power: Moments) -> Dict[str, object]:
+    """Return the histogram and moment sections shared by world and realm output."""
+    return {
+        'stages': _named_counts(stages, _STAGE_NAMES),
+        'races': _named_counts(races, list(RACE_CODES.items())),
+        'age': age.to_dict(),
+        'combat_power': power.to_dict()
+    }
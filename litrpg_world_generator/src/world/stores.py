@@ -0,0 +1,391 @@
+"""
+Population storage backends for the world generator.
+Defines the operations WorldGenerator performs on beings and resources and the default model-backed store.
+"""
+from abc import ABC, abstractmethod
+from datetime import timedelta
+import numpy as np
+from typing import Dict, Hashable, List, Mapping, Optional, Sequence
+from uuid import UUID
+
+from .events import EventLog, entity_words
+from .ids import IdAllocator
+from .population_index import PopulationIndex
+from .relationship_graph import RelationshipGraph
+from .scheduler import EventQueue
+from .statistics import RACE_CODES
+from .tables import ROW_DTYPE
+from .simulation import (
+    apply_karma,
+    breakthrough_due,
+    combat_power,
+    degrade_resources,
+    tick_years,
+    tribulation_difficulty
+)
+from ..clock import WorldClock
+from ..generators.being_batch import BeingBatch
+from ..models.being import Being
+from ..models.resource import Resource
+from ..models.shared import peek
+
+class PopulationStore(ABC):
+    """Interface shared by the world's population backends.
+
+    Stores hand out opaque handles (UUIDs for the model store, row numbers
+    for the columnar store). The population index and every mutation below
+    are expressed in terms of those handles. New beings get their UUIDs
+    from the store's IdAllocator. Breakthroughs are driven by an EventQueue
+    of beings keyed on when each may next attempt one, and the tribulations
+    they cause are recorded in the store's EventLog.
+    """
+
+    index: PopulationIndex
+    ids: IdAllocator
+    events: EventLog
+    beings: Mapping[UUID, Being]
+    resources: Mapping[UUID, Resource]
+    being_locations: Mapping[UUID, UUID]
+    resource_locations: Mapping[UUID, UUID]
+
+    @abstractmethod
+    def add_beings(self, batch: BeingBatch, realm_id: UUID) -> None:
+        """Store a batch of generated beings placed in one realm."""
+
+    @abstractmethod
+    def add_resource(self, resource: Resource, realm_id: UUID) -> None:
+        """Store a generated resource placed in a realm."""
+
+    @abstractmethod
+    def move_being(self, being_id: UUID, realm_id: UUID) -> None:
+        """Move a being to another realm."""
+
+    @abstractmethod
+    def move_resource(self, resource_id: UUID, realm_id: UUID) -> None:
+        """Move a resource to another realm."""
+
+    @abstractmethod
+    def being(self, handle: Hashable) -> Being:
+        """Return the Being for a handle."""
+
+    @abstractmethod
+    def resource(self, handle: Hashable) -> Resource:
+        """Return the Resource for a handle."""
+
+    @abstractmethod
+    def resource_tier(self, handle: Hashable) -> int:
+        """Return the tier value of a resource."""
+
+    @abstractmethod
+    def resource_tiers(self, handles: np.ndarray) -> np.ndarray:
+        """Return the tier values of many resources."""
+
+    @abstractmethod
+    def combat_powers(self, handles: np.ndarray) -> np.ndarray:
+        """Return the combat power of many beings."""
+
+    @abstractmethod
+    def being_profiles(self, handles: np.ndarray) -> Dict[str, np.ndarray]:
+        """Return the stage, race code, age and combat power columns of many beings."""
+
+    @abstractmethod
+    def set_master(self, disciple: Hashable, master: Hashable) -> None:
+        """Record a master-disciple relationship."""
+
+    @abstractmethod
+    def set_masters(self, disciples: Sequence[Hashable], masters: Sequence[Hashable]) -> None:
+        """Record many master-disciple relationships at once."""
+
+    @abstractmethod
+    def link(self, kind: str, first: Hashable, second: Hashable, weight: float) -> None:
+        """Record a symmetric 'allies' or 'enemies' relationship."""
+
+    @abstractmethod
+    def link_many(
+        self,
+        kind: str,
+        first: Sequence[Hashable],
+        second: Sequence[Hashable],
+        weight: Sequence[float]
+    ) -> None:
+        """Record many symmetric relationships at once."""
+
+    @abstractmethod
+    def give_artifact(self, owner: Hashable, resource: Hashable) -> None:
+        """Place a resource in a being's artifact inventory."""
+
+    @abstractmethod
+    def give_artifacts(self, owners: Sequence[Hashable], resources: Sequence[Hashable]) -> None:
+        """Place many resources in their owners' artifact inventories."""
+
+    @abstractmethod
+    def relationship_graph(self) -> RelationshipGraph:
+        """Return ally, enemy and master links as a graph whose node i is the i-th being."""
+
+    @abstractmethod
+    def being_labels(self, rows: np.ndarray) -> List[str]:
+        """Return the UUID strings of the beings at the given graph nodes."""
+
+    @abstractmethod
+    def advance_beings(self, time_delta: timedelta, clock: WorldClock) -> None:
+        """Age beings, resolve breakthroughs at the clock's time and apply karma for one time step."""
+
+    @abstractmethod
+    def reschedule_breakthroughs(self) -> None:
+        """Rebuild the breakthrough queue from every being's current state on the next tick."""
+
+    @abstractmethod
+    def advance_resources(self, time_delta: timedelta) -> None:
+        """Age and degrade resources for one time step."""
+
+class ModelStore(PopulationStore):
+    """Store that keeps every entity as a pydantic model keyed by UUID."""
+
+    def __init__(self, ids: Optional[IdAllocator] = None, events: Optional[EventLog] = None):
+        """Initialize empty entity dicts and the population index, allocating ids from `ids`."""
+        self.ids = ids if ids is not None else IdAllocator()
+        self.events = events if events is not None else EventLog()
+        self.beings: Dict[UUID, Being] = {}
+        self.resources: Dict[UUID, Resource] = {}
+        self.being_locations: Dict[UUID, UUID] = {}  # being -> realm
+        self.resource_locations: Dict[UUID, UUID] = {}  # resource -> realm
+        self.artifact_owners: Dict[UUID, UUID] = {}  # resource -> being
+        self.index = PopulationIndex()  # realm -> beings/resources
+        self._labels: Optional[np.ndarray] = None  # graph node -> UUID string
+        self._breakthroughs: Optional[EventQueue] = None  # built on the first tick
+
+    def add_beings(self, batch: BeingBatch, realm_id: UUID) -> None:
+        """Materialize a batch of beings and place them in one realm."""
+        self.place_beings(batch.to_models(self.ids.new_uuids('being', len(batch))), realm_id)
+
+    def place_beings(self, beings: List[Being], realm_id: UUID) -> None:
+        """Store already-built beings placed in the same realm."""
+        being_ids = [being.id for being in beings]
+        self._breakthroughs = None
+        self.beings.update(zip(being_ids, beings))
+        self.being_locations.update(dict.fromkeys(being_ids, realm_id))
+        self.index.add_beings(
+            being_ids,
+            realm_id,
+            [being.cultivation.stage.value for being in beings]
+        )
+
+    def place_being(self, being: Being, realm_id: UUID) -> None:
+        """Store a single being and record its location."""
+        self._breakthroughs = None
+        self.beings[being.id] = being
+        self.being_locations[being.id] = realm_id
+        self.index.add_being(being.id, realm_id, being.cultivation.stage.value)
+
+    def add_resource(self, resource: Resource, realm_id: UUID) -> None:
+        """Store a resource and record its location."""
+        self.resources[resource.id] = resource
+        self.resource_locations[resource.id] = realm_id
+        self.index.add_resource(resource.id, realm_id)
+
+    def move_being(self, being_id: UUID, realm_id: UUID) -> None:
+        """Move a being to another realm."""
+        self.index.move_being(
+            being_id,
+            self.being_locations[being_id],
+            realm_id,
+            self.beings[being_id].cultivation.stage.value
+        )
+        self.being_locations[being_id] = realm_id
+
+    def move_resource(self, resource_id: UUID, realm_id: UUID) -> None:
+        """Move a resource to another realm."""
+        self.index.move_resource(
+            resource_id,
+            self.resource_locations[resource_id],
+            realm_id
+        )
+        self.resource_locations[resource_id] = realm_id
+
+    def being(self, handle: UUID) -> Being:
+        return self.beings[handle]
+
+    def resource(self, handle: UUID) -> Resource:
+        return self.resources[handle]
+
+    def resource_tier(self, handle: UUID) -> int:
+        return self.resources[handle].tier.value
+
+    def resource_tiers(self, handles: np.ndarray) -> np.ndarray:
+        return np.fromiter(
+            (self.resources[handle].tier.value for handle in handles),
+            dtype=np.int64,
+            count=len(handles)
+        )
+
+    def combat_powers(self, handles: np.ndarray) -> np.ndarray:
+        return np.fromiter(
+            (self.beings[handle].calculate_combat_power() for handle in handles),
+            dtype=np.float64,
+            count=len(handles)
+        )
+
+    def being_profiles(self, handles: np.ndarray) -> Dict[str, np.ndarray]:
+        beings = [self.beings[handle] for handle in handles]
+        n = len(beings)
+        return {
+            'stage': np.fromiter((b.cultivation.stage.value for b in beings), np.int64, n),
+            'race': np.fromiter((RACE_CODES[b.race] for b in beings), np.int64, n),
+            'age': np.fromiter((b.age for b in beings), np.float64, n),
+            'combat_power': self.combat_powers(handles)
+        }
+
+    def set_master(self, disciple: UUID, master: UUID) -> None:
+        self.beings[disciple].master_id = master
+        self.beings[master].disciples.append(disciple)
+
+    def set_masters(self, disciples: Sequence[UUID], masters: Sequence[UUID]) -> None:
+        for disciple, master in zip(disciples, masters):
+            self.set_master(disciple, master)
+
+    def link(self, kind: str, first: UUID, second: UUID, weight: float) -> None:
+        getattr(self.beings[first], kind)[second] = weight
+        getattr(self.beings[second], kind)[first] = weight
+
+    def link_many(
+        self,
+        kind: str,
+        first: Sequence[UUID],
+        second: Sequence[UUID],
+        weight: Sequence[float]
+    ) -> None:
+        for a, b, w in zip(first, second, weight):
+            self.link(kind, a, b, w)
+
+    def give_artifact(self, owner: UUID, resource: UUID) -> None:
+        item = self.resources[resource]
+        self.artifact_owners[resource] = owner
+        self.beings[owner].inventory.artifacts[item.name] = item.quality_metrics.base_grade
+
+    def give_artifacts(self, owners: Sequence[UUID], resources: Sequence[UUID]) -> None:
+        for owner, resource in zip(owners, resources):
+            self.give_artifact(owner, resource)
+
+    def relationship_graph(self) -> RelationshipGraph:
+        """Build a graph snapshot of the relationships held in the models."""
+        return self._graph_from(list(self.beings.values()))
+
+    def _graph_from(self, beings: Sequence) -> RelationshipGraph:
+        """Build a graph from objects carrying id, master_id, allies and enemies."""
+        rows = {being.id: row for row, being in enumerate(beings)}
+        masters = np.array([rows.get(b.master_id, -1) for b in beings], dtype=ROW_DTYPE)
+        edges = {}
+        for kind in RelationshipGraph.KINDS:
+            # Models hold each link in both directions; keep one edge per pair
+            pairs = [
+                (row, rows[other], weight)
+                for row, being in enumerate(beings)
+                for other, weight in getattr(being, kind).items()
+                if row < rows[other] or being.id not in getattr(beings[rows[other]], kind)
+            ]
+            first, second, weight = zip(*pairs) if pairs else ((), (), ())
+            edges[kind] = {
+                'first': np.array(first, dtype=ROW_DTYPE),
+                'second': np.array(second, dtype=ROW_DTYPE),
+                'weight': np.array(weight, dtype=np.float32)
+            }
+        self._labels = np.array([str(being.id) for being in beings], dtype=object)
+        return RelationshipGraph.from_arrays(masters, edges)
+
+    def being_labels(self, rows: np.ndarray) -> List[str]:
+        if self._labels is None or len(self._labels) != len(self.beings):
+            self._labels = np.array([str(being_id) for being_id in self.beings], dtype=object)
+        return self._labels[rows].tolist()
+
+    def reschedule_breakthroughs(self) -> None:
+        self._breakthroughs = None
+
+    def advance_beings(self, time_delta: timedelta, clock: WorldClock) -> None:
+        """Resolve the breakthroughs that are due, then run the karma kernels over every being."""
+        beings = list(self.beings.values())
+        if not beings:
+            return
+        now = clock.now
+        n = len(beings)
+
+        due = self._due_breakthroughs(clock)
+        candidates = [self.beings[handle] for handle in due.tolist()]
+        count = len(candidates)
+        power = combat_power(
+            np.fromiter((b.combat.base_power for b in candidates), np.float64, count),
+            np.fromiter((b.cultivation.realm.value for b in candidates), np.int64, count),
+            np.fromiter((sum(b.combat.technique_mastery.values()) for b in candidates), np.float64, count),
+            np.fromiter((b.soul.strength for b in candidates), np.float64, count)
+        )
+        stage = np.fromiter((b.cultivation.stage.value for b in candidates), np.int64, count)
+        difficulty = tribulation_difficulty(
+            stage,
+            np.fromiter((b.karma.fate_value for b in candidates), np.float64, count)
+        )
+        for being in candidates:
+            being.tribulation_history = self.events.adopt('tribulation', being.id, being.tribulation_history)
+            being.last_breakthrough = now
+        self.events.append(
+            'tribulation',
+            entity_words(due.tolist()),
+            now,
+            np.column_stack((power, difficulty)),
+            stage
+        )
+        self._breakthroughs.schedule(due, self._breakthrough_due(due))
+
+        fate = np.fromiter((b.karma.fate_value for b in beings), np.float64, n)
+        fortune = np.fromiter((b.karma.fortune for b in beings), np.float64, n)
+        counter = np.fromiter((b.karma.tribulation_counter for b in beings), np.int64, n)
+        apply_karma(fate, fortune, counter, 0.001 * time_delta.days)
+        years = tick_years(time_delta.days)
+        for being, *karma in zip(beings, fate.tolist(), fortune.tolist(), counter.tolist()):
+            being.age += years
+            being.karma.fate_value, being.karma.fortune, being.karma.tribulation_counter = karma
+
+    def _due_breakthroughs(self, clock: WorldClock) -> np.ndarray:
+        """Pop the beings whose breakthrough is due, queueing every being on first use."""
+        if self._breakthroughs is None:
+            handles = np.fromiter(self.beings, dtype=object, count=len(self.beings))
+            self._breakthroughs = EventQueue(dtype=object)
+            self._breakthroughs.schedule(handles, self._breakthrough_due(handles))
+        return self._breakthroughs.pop_ready(clock.micros, self._breakthrough_due)
+
+    def _breakthrough_due(self, handles: np.ndarray) -> np.ndarray:
+        """Return when each of the given beings may next attempt a breakthrough."""
+        beings = [self.beings[handle] for handle in handles.tolist()]
+        n = len(beings)
+        return breakthrough_due(
+            np.array([b.last_breakthrough for b in beings], dtype='datetime64[us]'),
+            np.fromiter((len(peek(b, 'cultivation_insights')) for b in beings), np.int64, n),
+            np.fromiter((b.cultivation.foundation_quality for b in beings), np.float64, n),
+            np.fromiter((b.cultivation.bottleneck_threshold for b in beings), np.float64, n)
+        )
+
+    def advance_resources(self, time_delta: timedelta) -> None:
+        """Gather resource state into arrays, degrade it and write results back."""
+        resources = list(self.resources.values())
+        if not resources:
+            return
+        n = len(resources)
+        years = tick_years(time_delta.days)
+        columns = {
+            'degradation_rate': np.fromiter((r.usage_metrics.degradation_rate for r in resources), np.float64, n),
+            'preservation_state': np.fromiter((r.quality_metrics.preservation_state for r in resources), np.float64, n),
+            'stability': np.fromiter((r.energy_profile.stability for r in resources), np.float64, n),
+            'purity': np.fromiter((r.energy_profile.purity for r in resources), np.float64, n),
+            'remaining_uses': np.fromiter(
+                (-1 if r.usage_metrics.remaining_uses is None else r.usage_metrics.remaining_uses
+                 for r in resources), np.int64, n
+            )
+        }
+        degrade_resources(columns, years)
+        for resource, preservation, stability, purity, remaining in zip(
+            resources, *(columns[name].tolist() for name in list(columns)[1:])
+        ):
+            resource.formation_attributes.current_age += years
+            resource.quality_metrics.preservation_state = preservation
+            resource.energy_profile.stability = stability
+            resource.energy_profile.purity = purity
+            if remaining >= 0:
+                resource.usage_metrics.remaining_uses = remaining
@@ -0,0 +1,81 @@
+"""
+Growable typed column tables shared by the columnar stores.
+Each table keeps aligned NumPy columns described by a schema and grows them geometrically.
+"""
+import numpy as np
+from typing import Dict, Optional
+
+# Row numbers are stored as int32; two billion beings is well past any target
+ROW_DTYPE = np.int32
+
+class ColumnTable:
+    """Growable table of aligned, typed NumPy columns."""
+
+    def __init__(self, schema: Dict[str, tuple]):
+        """Initialize an empty table for the given column schema."""
+        self.schema = schema
+        self._size = 0
+        self._data = {
+            name: np.empty((0,) + shape, dtype=dtype)
+            for name, (dtype, shape, _) in schema.items()
+        }
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._data[name][:self._size]
+
+    def append(self, columns: Dict[str, np.ndarray], count: Optional[int] = None) -> np.ndarray:
+        """Append rows, filling schema columns missing from `columns`; return new row numbers."""
+        if count is None:
+            count = len(next(iter(columns.values())))
+        start = self._size
+        self._reserve(start + count)
+        for name, (_, _, fill) in self.schema.items():
+            target = self._data[name][start:start + count]
+            target[...] = columns[name] if name in columns else fill
+        self._size += count
+        return np.arange(start, start + count, dtype=ROW_DTYPE)
+
+    @classmethod
+    def from_columns(cls, schema: Dict[str, tuple], columns: Dict[str, np.ndarray]) -> 'ColumnTable':
+        """Wrap existing column arrays without copying them.
+        
+        Columns missing from `columns` are filled; read-only arrays (such as
+        memory-mapped ones) are copied the first time `writable` is called.
+        """
+        table = cls(schema)
+        table._size = len(next(iter(columns.values())))
+        for name, (dtype, shape, fill) in schema.items():
+            if name in columns:
+                table._data[name] = columns[name]
+            else:
+                table._data[name] = np.full((table._size,) + shape, fill, dtype=dtype)
+        return table
+
+    def writable(self, name: str) -> np.ndarray:
+        """Return the live rows of a column for in-place updates."""
+        values = self._data[name]
+        if not values.flags.writeable:
+            values = self._data[name] = values.copy()
+        return values[:self._size]
+
+    def row(self, index: int) -> Dict[str, object]:
+        """Return one row as a dict of column values."""
+        return {name: values[index] for name, values in self._data.items()}
+
+    def nbytes(self) -> int:
+        """Return the bytes held by the live rows."""
+        return sum(self[name].nbytes for name in self._data)
+
+    def _reserve(self, capacity: int) -> None:
+        """Grow the backing arrays geometrically to hold `capacity` rows."""
+        current = len(next(iter(self._data.values())))
+        if capacity <= current:
+            return
+        new_capacity = max(capacity, 2 * current, 1024)
+        for name, values in self._data.items():
+            grown = np.empty((new_capacity,) + values.shape[1:], dtype=values.dtype)
+            grown[:self._size] = values[:self._size]
+            self._data[name] = grown
@@ -0,0 +1,8 @@
+"""
+Shared test setup.
+Puts the project root on the import path so tests import `src` the way main.py does.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,14 @@
+"""
+Smoke tests for the benchmark suite.
+Runs every registered case that is not marked slow once, so a case that stops running fails here.
+"""
+import pytest
+
+from benchmarks.cases import select
+
+CASES = select()
+
+@pytest.mark.parametrize('name', list(CASES))
+def test_case_runs(name):
+    bench = CASES[name]
+    bench.run(bench.setup())
@@ -0,0 +1,37 @@
+"""
+Tests for the world event log.
+Checks EventHistory views against the full entry list across sealed chunks and the active table.
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.world.events import EventLog, entity_words
+from src.world.ids import IdAllocator
+
+def test_history_indexing_matches_entries():
+    log = EventLog(chunk_size=4)
+    ids = IdAllocator(1)
+    beings = ids.new_uuids('being', 3)
+    start = datetime(2024, 1, 1)
+    for day in range(7):
+        log.append(
+            'tribulation',
+            entity_words(beings),
+            np.datetime64(start + timedelta(days=day), 'us'),
+            np.array([[day, 1.0], [day, 2.0], [day, 3.0]]),
+            np.array([1, 2, 3], dtype=np.int16)
+        )
+    history = log.view('tribulation', beings[1])
+    entries = log.entries('tribulation', beings[1])
+
+    assert len(history) == len(entries) == log.count('tribulation', beings[1]) == 7
+    assert log.count('tribulation') == 21
+    assert history[0] == entries[0]
+    assert history[-1] == entries[-1]
+    assert history[2:5] == entries[2:5]
+    assert history[::-2] == entries[::-2]
+    assert history == entries
+    with pytest.raises(IndexError):
+        history[7]
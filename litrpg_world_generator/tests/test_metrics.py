@@ -0,0 +1,37 @@
+"""
+Tests for the derived metric cache.
+Checks that cached values follow their own entity and that bumping keeps the cache bounded.
+"""
+from src.generators.world_generator import WorldGenerator
+from src.models.metrics import MetricCache, metric_cache, set_metric_cache
+
+def _world(backend: str = 'models') -> WorldGenerator:
+    world = WorldGenerator(seed=9, backend=backend)
+    world.generate_world(num_realms=2, beings_per_realm=20, resources_per_realm=5)
+    return world
+
+def test_same_seed_worlds_do_not_share_values():
+    first, second = _world(), _world()
+    resource_id = next(iter(first.resources))
+    expected = second.resources[resource_id].calculate_true_value()
+
+    first.resources[resource_id].degrade(200)
+    assert first.resources[resource_id].calculate_true_value() != expected
+    assert second.resources[resource_id].calculate_true_value() == expected
+
+def test_bump_invalidates_and_keeps_the_cache_bounded():
+    previous = set_metric_cache(MetricCache(max_size=50))
+    try:
+        world = _world()
+        resource = next(iter(world.resources.values()))
+        value = resource.calculate_true_value()
+        assert resource.calculate_true_value() == value
+        assert metric_cache().hits >= 1
+
+        for _ in range(1000):
+            resource.degrade(1)
+        assert resource.calculate_true_value() < value
+        assert len(metric_cache()) <= 50
+        assert not hasattr(metric_cache(), '_versions')
+    finally:
+        set_metric_cache(previous)
@@ -0,0 +1,46 @@
+"""
+Tests for the realm population index.
+Checks membership, order and stages as members are added, moved and removed one at a time.
+"""
+import numpy as np
+
+from src.world.population_index import PopulationIndex
+from src.world.tables import ROW_DTYPE
+
+def test_moves_keep_order_and_stages():
+    index = PopulationIndex(id_dtype=ROW_DTYPE)
+    index.add_beings(np.arange(10), 'a', np.arange(10) % 3)
+    for being in range(0, 10, 2):
+        index.move_being(being, 'a', 'b', being % 3)
+    index.set_being_stage(3, 'a', 7)
+    index.add_being(10, 'a', 1)
+
+    assert index.beings_in('a').tolist() == [1, 3, 5, 7, 9, 10]
+    assert index.being_stages_in('a').tolist() == [1, 7, 2, 1, 0, 1]
+    assert index.beings_in('b').tolist() == [0, 2, 4, 6, 8]
+    assert index.being_count('a') == 6 and index.being_count('b') == 5
+    ids, stages = index.stage_sorted('a')
+    assert stages.tolist() == sorted(stages.tolist())
+    assert sorted(ids.tolist()) == [1, 3, 5, 7, 9, 10]
+    assert not index.remove_being(0, 'a')
+    assert index.remove_being(0, 'b') and index.being_count('b') == 4
+
+def test_interleaved_moves_and_reads():
+    rng = np.random.default_rng(4)
+    index = PopulationIndex()
+    realms = ['a', 'b', 'c']
+    location = {f"being-{i}": realms[i % 3] for i in range(300)}
+    for being, realm in location.items():
+        index.add_being(being, realm, 0)
+    for step in range(2000):
+        being = f"being-{rng.integers(300)}"
+        target = realms[rng.integers(3)]
+        index.move_being(being, location[being], target, 0)
+        location[being] = target
+        if step % 97 == 0:
+            for realm in realms:
+                expected = {b for b, r in location.items() if r == realm}
+                assert set(index.beings_in(realm).tolist()) == expected
+    for realm in realms:
+        assert index.being_count(realm) == sum(r == realm for r in location.values())
+        assert len(index.beings_in(realm)) == index.being_count(realm)
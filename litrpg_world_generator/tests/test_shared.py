@@ -0,0 +1,60 @@
+"""
+Tests for the shared model containers.
+Checks that writing through a model copies a shared container for that model alone.
+"""
+from datetime import datetime
+
+import pytest
+
+from src.generators.being_batch import SHARED_KIT
+from src.generators.world_generator import WorldGenerator
+from src.models.shared import EMPTY_LIST, peek
+from src.world.events import EventHistory
+
+@pytest.mark.parametrize('backend', WorldGenerator.BACKENDS)
+def test_writes_copy_shared_containers(backend):
+    world = WorldGenerator(seed=3, backend=backend)
+    world.generate_world(num_realms=1, beings_per_realm=20, resources_per_realm=2)
+    first, second = (world.beings[being_id] for being_id in list(world.beings)[:2])
+    kit = dict(SHARED_KIT['artifacts'])
+
+    first.cultivation_insights.append('Flowing Water')
+    first.inventory.artifacts['Jade Slip'] = 0.5
+    first.tribulation_history.append({
+        'power_level': 1.0,
+        'difficulty': 2.0,
+        'type': 'BODY_REFINEMENT_TRIBULATION',
+        'timestamp': datetime(2024, 1, 1)
+    })
+
+    assert first.cultivation_insights == ['Flowing Water']
+    assert first.inventory.artifacts['Jade Slip'] == 0.5
+    assert len(first.tribulation_history) >= 1
+    assert 'Jade Slip' not in second.inventory.artifacts
+    assert dict(SHARED_KIT['artifacts']) == kit
+    assert EMPTY_LIST == []
+    first.model_dump_json()
+
+def test_reads_for_serialization_keep_sharing():
+    world = WorldGenerator(seed=3)
+    world.generate_world(num_realms=1, beings_per_realm=20, resources_per_realm=2)
+    being = next(
+        being for being in world.beings.values()
+        if peek(being.inventory, 'artifacts') is SHARED_KIT['artifacts']
+    )
+    being.model_dump_json()
+    assert peek(being.inventory, 'artifacts') is SHARED_KIT['artifacts']
+
+def test_event_history_append_records_in_the_log():
+    world = WorldGenerator(seed=3)
+    being_id = world.ids.new_uuid('being')
+    history = world.events.view('tribulation', being_id)
+    history.append({
+        'power_level': 3.0,
+        'difficulty': 4.0,
+        'type': 'FOUNDATION_ESTABLISHMENT_TRIBULATION',
+        'timestamp': datetime(2024, 1, 1)
+    })
+    assert isinstance(history, EventHistory)
+    assert [entry['power_level'] for entry in history] == [3.0]
+    assert len(world.events) == 1
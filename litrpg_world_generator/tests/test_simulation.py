@@ -0,0 +1,77 @@
+"""
+Tests for the vectorized time-advance kernels.
+Checks a world tick against the per-object rules in Being and Resource that the kernels mirror.
+"""
+from datetime import timedelta
+
+import pytest
+
+from src.generators.world_generator import WorldGenerator
+from src.world.simulation import tick_years
+
+DAYS = 30
+
+def _reference_tick(beings, resources, clock, days: int, tribulations) -> None:
+    """Advance copies of the population one tick with the per-object methods."""
+    years = tick_years(days)
+    for being in beings.values():
+        if being.can_breakthrough(clock):
+            tribulations[being.id].append(being.generate_tribulation(clock))
+            being.last_breakthrough = clock.now
+        being.update_karma('time', 0.001 * days)
+        being.age += years
+    for resource in resources.values():
+        resource.degrade(years)
+        resource.formation_attributes.current_age += years
+
+def _assert_tribulations_match(actual, expected) -> None:
+    assert len(actual) == len(expected)
+    for got, want in zip(actual, expected):
+        assert got['type'] == want['type']
+        assert got['timestamp'] == want['timestamp']
+        assert got['power_level'] == pytest.approx(want['power_level'])
+        assert got['difficulty'] == pytest.approx(want['difficulty'])
+
+@pytest.mark.parametrize('backend', WorldGenerator.BACKENDS)
+def test_tick_matches_per_object_rules(backend):
+    world = WorldGenerator(seed=11, backend=backend)
+    world.generate_world(num_realms=2, beings_per_realm=60, resources_per_realm=10)
+    if backend == 'models':
+        # Mix beings that are due, cooling down or past their cooldown, some about to cross
+        # the karma threshold, so every branch of the kernels is taken
+        now = world.current_time
+        for i, being in enumerate(world.beings.values()):
+            if i % 3:
+                being.last_breakthrough = now - timedelta(days=45 if i % 3 == 1 else 10)
+                being.cultivation_insights.extend(['Stillness', 'Flow', 'Return'][:i % 4])
+            if i % 5 == 0:
+                being.karma.fate_value = 9.99
+        world.reschedule()
+
+    beings = {being_id: world.beings[being_id].model_copy(deep=True) for being_id in world.beings}
+    resources = {
+        resource_id: world.resources[resource_id].model_copy(deep=True) for resource_id in world.resources
+    }
+    tribulations = {being_id: [] for being_id in beings}
+
+    for _ in range(2):
+        world.advance_time(days=DAYS)
+        _reference_tick(beings, resources, world.clock, DAYS, tribulations)
+
+    for being_id, expected in beings.items():
+        being = world.beings[being_id]
+        assert being.age == pytest.approx(expected.age)
+        assert being.last_breakthrough == expected.last_breakthrough
+        assert being.karma.fate_value == pytest.approx(expected.karma.fate_value)
+        assert being.karma.fortune == pytest.approx(expected.karma.fortune)
+        assert being.karma.tribulation_counter == expected.karma.tribulation_counter
+        _assert_tribulations_match(world.events.entries('tribulation', being_id), tribulations[being_id])
+    assert any(tribulations.values())
+
+    for resource_id, expected in resources.items():
+        resource = world.resources[resource_id]
+        assert resource.formation_attributes.current_age == pytest.approx(expected.formation_attributes.current_age)
+        assert resource.quality_metrics.preservation_state == pytest.approx(expected.quality_metrics.preservation_state)
+        assert resource.energy_profile.stability == pytest.approx(expected.energy_profile.stability)
+        assert resource.energy_profile.purity == pytest.approx(expected.energy_profile.purity)
+        assert resource.usage_metrics.remaining_uses == expected.usage_metrics.remaining_uses
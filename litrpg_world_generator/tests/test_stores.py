@@ -0,0 +1,20 @@
+"""
+Tests for the population store interface.
+Checks that every backend implements it and that an incomplete one cannot be created.
+"""
+import pytest
+
+from src.generators.world_generator import _STORES
+from src.world.stores import ModelStore, PopulationStore
+
+@pytest.mark.parametrize('backend', sorted(_STORES))
+def test_backends_implement_the_interface(backend):
+    store = _STORES[backend]()
+    assert isinstance(store, PopulationStore)
+
+def test_incomplete_store_cannot_be_instantiated():
+    class Incomplete(PopulationStore):
+        add_beings = ModelStore.add_beings
+
+    with pytest.raises(TypeError, match='abstract'):
+        Incomplete()
@@ -0,0 +1,36 @@
+"""
+Tests for WorldGenerator.
+Generates small seeded worlds on every backend and advances their time.
+"""
+import pytest
+
+from src.generators.world_generator import WorldGenerator
+from src.models.construction import build, set_strict
+from src.models.realm import Realm
+
+@pytest.fixture(params=[False, True], ids=['fast', 'strict'])
+def strict(request):
+    set_strict(request.param)
+    yield request.param
+    set_strict(False)
+
+@pytest.mark.parametrize('backend', WorldGenerator.BACKENDS)
+def test_generate_then_advance_time(backend, strict):
+    world = WorldGenerator(seed=7, backend=backend)
+    world.generate_world(num_realms=6, beings_per_realm=200, resources_per_realm=20)
+    for entity in [*world.realms.values(), *world.resources.values()]:
+        entity.model_dump_json()
+    world.advance_time(days=30)
+
+    for realm in world.realms.values():
+        assert len(realm.stability_history) == 1
+        assert realm.major_events == []
+    for resource in world.resources.values():
+        assert resource.refinement_history == []
+        assert resource.last_refined is None
+        resource.can_be_refined()
+    assert len(world.events) == world.statistics.tribulations + len(world.realms)
+
+def test_build_rejects_missing_required_fields():
+    with pytest.raises(ValueError, match='natural_laws'):
+        build(Realm, name='Nowhere')